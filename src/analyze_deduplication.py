@@ -3,7 +3,6 @@
 """
 
 import asyncio
-import json
 from collections import Counter, defaultdict
 from pathlib import Path
 from typing import Dict, List, Set
@@ -11,6 +10,7 @@ from urllib.parse import urlparse
 
 from deduplication import ServerDeduplicator
 from models import MCPServer, RegistrySource
+from snapshot_io import iter_snapshot_server_dicts, latest_snapshot_file
 
 
 def load_latest_snapshots() -> dict[str, list[MCPServer]]:
@@ -23,19 +23,14 @@ def load_latest_snapshots() -> dict[str, list[MCPServer]]:
             continue
 
         registry_name = registry_dir.name
-        json_files = list(registry_dir.glob("*.json"))
+        # The registry manifest names the latest snapshot
+        latest_file = latest_snapshot_file(registry_dir)
 
-        if not json_files:
+        if not latest_file:
             continue
 
-        # Get the latest file
-        latest_file = max(json_files, key=lambda f: f.stat().st_mtime)
-
-        with open(latest_file) as f:
-            data = json.load(f)
-
         servers = []
-        for server_data in data.get("servers", []):
+        for server_data in iter_snapshot_server_dicts(latest_file):
             try:
                 server = MCPServer(**server_data)
                 servers.append(server)
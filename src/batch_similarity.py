@@ -0,0 +1,153 @@
+"""Vectorized similarity scoring for the deduplication merge pass.
+
+``ServerDeduplicator`` scores candidate pairs one at a time with
+``SequenceMatcher``. ``TfidfScorer`` encodes names, authors and descriptions
+as character n-gram TF-IDF vectors instead and scores a whole batch of pairs
+with sparse matrix products: the cosine of two vectors stands in for the
+``SequenceMatcher`` ratio, and the remaining signals (categories, language,
+repository owner and domain) are compared as integer arrays. The weights and
+thresholds are the deduplicator's own, so both backends merge the same kind
+of pairs, but cosine and ratio differ, so results can differ at the margins.
+
+Requires NumPy and SciPy; ``VECTOR_SCORING_AVAILABLE`` is False without them.
+"""
+
+from collections import Counter
+
+try:
+    import numpy as np
+    from scipy import sparse
+    VECTOR_SCORING_AVAILABLE = True
+except ImportError:
+    VECTOR_SCORING_AVAILABLE = False
+
+from server_record import CATEGORY_BITS, ServerRecord
+
+NGRAM_SIZES = (2, 3)
+
+
+def char_ngrams(text: str) -> list[str]:
+    """Character n-grams of ``text``, padded so short strings still produce some"""
+    padded = f" {text} "
+    return [padded[i:i + size] for size in NGRAM_SIZES for i in range(len(padded) - size + 1)]
+
+
+def tfidf_matrix(texts: list[str | None]) -> "sparse.csr_matrix":
+    """L2-normalized character n-gram TF-IDF rows, one per text; None gives a zero row"""
+    vocabulary: dict[str, int] = {}
+    indptr = [0]
+    indices = []
+    counts = []
+    for text in texts:
+        if text is not None:
+            for gram, count in Counter(char_ngrams(text)).items():
+                indices.append(vocabulary.setdefault(gram, len(vocabulary)))
+                counts.append(count)
+        indptr.append(len(indices))
+
+    matrix = sparse.csr_matrix(
+        (np.asarray(counts, dtype=np.float64), np.asarray(indices, dtype=np.int64), np.asarray(indptr, dtype=np.int64)),
+        shape=(len(texts), len(vocabulary)),
+    )
+
+    # Smoothed IDF, as in scikit-learn's TfidfVectorizer
+    document_frequency = np.bincount(matrix.indices, minlength=len(vocabulary))
+    idf = np.log((1 + len(texts)) / (1 + document_frequency)) + 1
+    matrix.data *= idf[matrix.indices]
+
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    matrix.data /= np.repeat(norms, np.diff(matrix.indptr))
+    return matrix
+
+
+def _codes(values: list) -> "np.ndarray":
+    """Integer codes for hashable values, -1 for None, so equality compares as arrays"""
+    code_of = {}
+    return np.asarray([-1 if value is None else code_of.setdefault(value, len(code_of)) for value in values],
+                      dtype=np.int64)
+
+
+class TfidfScorer:
+    """Batch scores for pairs of records, addressed by their positions in ``records``"""
+
+    def __init__(self, records: list[ServerRecord]):
+        if not VECTOR_SCORING_AVAILABLE:
+            raise ImportError("NumPy and SciPy are required for TF-IDF scoring. Install with: pip install askg[similarity]")
+
+        self.names = tfidf_matrix([record.name_key for record in records])
+        self.authors = tfidf_matrix([record.author_key for record in records])
+        self.description_prefixes = tfidf_matrix([record.description_prefix for record in records])
+        self.descriptions = tfidf_matrix([record.description for record in records])
+
+        self.registries = _codes([record.registry_source for record in records])
+        self.languages = _codes([record.language for record in records])
+        self.repo_owners = _codes([record.repo_owner for record in records])
+        self.repo_domains = _codes([record.repo_domain for record in records])
+
+        self.categories = np.asarray(
+            [[bool(record.category_mask & bit) for bit in CATEGORY_BITS.values()] for record in records],
+            dtype=bool,
+        ).reshape(len(records), len(CATEGORY_BITS))
+        self.category_counts = np.asarray([record.category_count for record in records], dtype=np.float64)
+
+    @staticmethod
+    def _cosines(matrix: "sparse.csr_matrix", left: "np.ndarray", right: "np.ndarray") -> "np.ndarray":
+        return np.asarray(matrix[left].multiply(matrix[right]).sum(axis=1)).ravel()
+
+    @staticmethod
+    def _present(matrix: "sparse.csr_matrix", left: "np.ndarray", right: "np.ndarray") -> "np.ndarray":
+        nonzero = np.diff(matrix.indptr) > 0
+        return nonzero[left] & nonzero[right]
+
+    @staticmethod
+    def _same(codes: "np.ndarray", left: "np.ndarray", right: "np.ndarray") -> "np.ndarray":
+        return (codes[left] >= 0) & (codes[left] == codes[right])
+
+    def similar_scores(self, left: "np.ndarray", right: "np.ndarray") -> "np.ndarray":
+        """Batch counterpart of ``ServerDeduplicator._servers_are_similar``'s score"""
+        author = self._cosines(self.authors, left, right) * self._present(self.authors, left, right)
+        description = (self._cosines(self.description_prefixes, left, right)
+                       * self._present(self.description_prefixes, left, right))
+
+        common = (self.categories[left] & self.categories[right]).sum(axis=1)
+        largest = np.maximum(self.category_counts[left], self.category_counts[right])
+        both_categorized = (self.category_counts[left] > 0) & (self.category_counts[right] > 0)
+        category = np.divide(common, largest, out=np.zeros(len(left)), where=both_categorized)
+
+        return (author * 0.3 + description * 0.2 + category * 0.2
+                + self._same(self.languages, left, right) * 0.1
+                + self._same(self.repo_owners, left, right) * 0.2)
+
+    def merge_scores(self, left: "np.ndarray", right: "np.ndarray") -> "np.ndarray":
+        """Batch counterpart of ``ServerDeduplicator._calculate_similarity_score``"""
+        name = self._cosines(self.names, left, right) * self._present(self.names, left, right)
+        author = self._cosines(self.authors, left, right) * self._present(self.authors, left, right)
+        description = self._cosines(self.descriptions, left, right) * self._present(self.descriptions, left, right)
+
+        common = (self.categories[left] & self.categories[right]).sum(axis=1)
+        total = (self.categories[left] | self.categories[right]).sum(axis=1)
+        both_categorized = (self.category_counts[left] > 0) & (self.category_counts[right] > 0)
+        category = np.divide(common, total, out=np.zeros(len(left)), where=both_categorized & (total > 0))
+
+        return (name * 0.4 + author * 0.2 + self._same(self.repo_domains, left, right) * 0.2
+                + description * 0.1 + category * 0.1)
+
+    def highly_similar(self, left: list[int], right: list[int], similar_threshold: float,
+                       merge_threshold: float) -> list[bool]:
+        """Batch counterpart of ``ServerDeduplicator._servers_are_highly_similar``"""
+        if not left:
+            return []
+        left = np.asarray(left, dtype=np.int64)
+        right = np.asarray(right, dtype=np.int64)
+
+        # Same cheap requirements as the pairwise check: different registries, both authors, same domain
+        eligible = ((self.registries[left] != self.registries[right])
+                    & self._present(self.authors, left, right)
+                    & self._same(self.repo_domains, left, right))
+        result = np.zeros(len(left), dtype=bool)
+        left, right = left[eligible], right[eligible]
+        if len(left):
+            result[eligible] = ((self.similar_scores(left, right) > similar_threshold)
+                                & (self.merge_scores(left, right) > merge_threshold))
+        return result.tolist()
@@ -0,0 +1,69 @@
+"""Content-addressed store for bulky server metadata.
+
+``MCPServer.raw_metadata`` can hold a registry's whole payload for a server
+(for GitHub, the full repository object). Kept inline it is copied into every
+snapshot, every master data file and every server in memory. Instead it is
+written once here, compressed and named by the hash of its content, and
+servers carry only ``raw_metadata_ref``. Identical payloads, such as an
+unchanged repo across daily snapshots, are stored once.
+"""
+
+import hashlib
+import json
+import os
+import zlib
+from pathlib import Path
+from typing import Any
+
+from models import MCPServer
+
+
+class BlobStore:
+    """Compressed JSON blobs keyed by the sha256 of their canonical encoding"""
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, ref: str) -> Path:
+        return self.root / ref[:2] / f"{ref[2:]}.json.z"
+
+    def put(self, value: Any) -> str:
+        """Store a JSON-serializable value and return its reference."""
+        data = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode()
+        ref = hashlib.sha256(data).hexdigest()
+
+        path = self._path(ref)
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            _atomic_write(path, zlib.compress(data))
+        return ref
+
+    def get(self, ref: str) -> Any:
+        """The value stored under ``ref``; KeyError if it isn't in the store."""
+        try:
+            return json.loads(zlib.decompress(self._path(ref).read_bytes()))
+        except FileNotFoundError:
+            raise KeyError(ref) from None
+
+    def __contains__(self, ref: str) -> bool:
+        return self._path(ref).exists()
+
+    def offload(self, server: MCPServer) -> MCPServer:
+        """Move a server's inline ``raw_metadata`` into the store, in place."""
+        if server.raw_metadata:
+            server.raw_metadata_ref = self.put(server.raw_metadata)
+            server.raw_metadata = None
+        return server
+
+    def raw_metadata(self, server: MCPServer) -> dict[str, Any] | None:
+        """A server's full raw metadata: the stored payload plus anything kept inline."""
+        if not server.raw_metadata_ref:
+            return server.raw_metadata
+        return {**self.get(server.raw_metadata_ref), **(server.raw_metadata or {})}
+
+
+def _atomic_write(path: Path, data: bytes):
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
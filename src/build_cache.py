@@ -0,0 +1,131 @@
+"""Content-keyed cache of pipeline stage outputs.
+
+A stage (dedup, infer, load, ...) is keyed on the checksums of its inputs and
+a version of the code that produces its output. When a stage runs again with
+the same key, its recorded output is reused instead of recomputing it. Unlike
+comparing file mtimes, this ignores files that were touched or rewritten
+without changes, and it reruns a stage when only its logic has changed.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from models import RegistrySnapshot
+from snapshot_io import latest_snapshot_entry
+
+
+def cache_key(*parts: Any) -> str:
+    """Hash any JSON-serializable parts into a cache key"""
+    data = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str).encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+def code_version(*objects: Any) -> str:
+    """Fingerprint of the source of the given modules, classes or functions"""
+    return cache_key(*(inspect.getsource(obj) for obj in objects))
+
+
+def file_checksum(path: str | Path) -> str:
+    """sha256 of a file's contents"""
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def registry_checksums(registries_path: Path = Path("data/registries")) -> dict[str, str]:
+    """Content checksum of each registry's latest snapshot"""
+    checksums = {}
+    for registry_dir in sorted(Path(registries_path).iterdir()):
+        if not registry_dir.is_dir():
+            continue
+        latest = latest_snapshot_entry(registry_dir)
+        if latest:
+            # Legacy snapshots have no checksum in their header
+            checksums[registry_dir.name] = latest["checksum"] or file_checksum(registry_dir / latest["file"])
+    return checksums
+
+
+def snapshot_checksums(snapshots: list[RegistrySnapshot]) -> list[tuple[str, str]]:
+    """Content checksum of each in-memory snapshot, by registry"""
+    return sorted(
+        (snapshot.registry_source.value,
+         snapshot.checksum or cache_key(*(server.model_dump(mode="json") for server in snapshot.servers)))
+        for snapshot in snapshots
+    )
+
+
+class BuildCache:
+    """Records, per stage, the key of its last run and what it produced"""
+
+    def __init__(self, root: str | Path = Path("data/build_cache")):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.root / "index.json"
+
+    def _read_index(self) -> dict[str, Any]:
+        try:
+            return json.loads(self.index_path.read_text())
+        except FileNotFoundError:
+            return {}
+
+    def get(self, stage: str, key: str) -> dict[str, Any] | None:
+        """The output recorded for ``stage`` if its last run had this key"""
+        entry = self._read_index().get(stage)
+        if entry is None or entry["key"] != key:
+            return None
+        return entry["output"]
+
+    def key_of(self, stage: str) -> str | None:
+        """Key of the last recorded run of a stage"""
+        entry = self._read_index().get(stage)
+        return entry["key"] if entry else None
+
+    def last_output(self, stage: str) -> dict[str, Any] | None:
+        """Output of the last recorded run of a stage, whatever its key"""
+        entry = self._read_index().get(stage)
+        return entry["output"] if entry else None
+
+    def put(self, stage: str, key: str, output: dict[str, Any] | None = None):
+        """Record a stage's run; older outputs of the stage are removed"""
+        index = self._read_index()
+        previous = index.get(stage)
+        index[stage] = {"key": key, "output": output or {}, "recorded_at": time.time()}
+
+        tmp_path = self.index_path.with_name(f"index.json.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(index, indent=2))
+        os.replace(tmp_path, self.index_path)
+
+        if previous and previous["key"] != key:
+            self.output_path(stage, previous["key"]).unlink(missing_ok=True)
+
+    def load_output(self, stage: str, key: str, adapter: TypeAdapter) -> Any | None:
+        """Cached output data of a stage run with this key, or None if there is none"""
+        if self.get(stage, key) is None:
+            return None
+        try:
+            return adapter.validate_json(self.output_path(stage, key).read_bytes())
+        except FileNotFoundError:
+            return None
+
+    def save_output(self, stage: str, key: str, adapter: TypeAdapter, value: Any):
+        """Store a stage's output data and record the run"""
+        path = self.output_path(stage, key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(adapter.dump_json(value))
+        os.replace(tmp_path, path)
+        self.put(stage, key, {"file": path.name})
+
+    def output_path(self, stage: str, key: str) -> Path:
+        """Where a stage that stores its own output data should write it"""
+        stage_dir = self.root / stage.replace(":", "_")
+        stage_dir.mkdir(exist_ok=True)
+        return stage_dir / f"{key}.json"
@@ -0,0 +1,145 @@
+"""Partitioning of deduplication input into independent shards.
+
+Every decision ``ServerDeduplicator`` makes about a server involves only
+servers it can match:
+
+* servers sharing an exact key (repository, name+author or content hash)
+* servers whose names are similar enough for fuzzy matching
+* servers whose names are similar enough for the similarity merge, when the
+  fields the merge requires (registry, author, repository domain) allow it
+
+None of those fields change when duplicates are merged, so the relation can
+be computed up front. Its connected components never influence each other:
+deduplicating them separately, in input order, gives the same servers as a
+single pass over everything. This module finds the components and packs
+them into shards of similar size for a process pool.
+"""
+
+import heapq
+from collections.abc import Callable
+from concurrent.futures import Executor
+from difflib import SequenceMatcher
+
+from ngram_index import NgramCandidateIndex
+from server_record import ServerRecord
+
+# Per-process state for name linking, set up by init_name_links
+_names: list[str] = []
+_name_ids: dict[str, int] = {}
+_name_index: NgramCandidateIndex | None = None
+_merge_threshold = 0.0
+_fuzzy_threshold = 0.0
+
+
+class DisjointSet:
+    """Union-find over the integers 0..size-1"""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, item1: int, item2: int):
+        root1, root2 = self.find(item1), self.find(item2)
+        if root1 != root2:
+            self.parent[max(root1, root2)] = min(root1, root2)
+
+
+def init_name_links(names: list[str], merge_threshold: float, fuzzy_threshold: float):
+    """Process pool initializer: index the distinct names once per worker
+
+    ``merge_threshold`` is the lowest name ratio the similarity merge can
+    accept and ``fuzzy_threshold`` the one fuzzy matching needs.
+    """
+    global _names, _name_ids, _name_index, _merge_threshold, _fuzzy_threshold
+    _names = names
+    _name_ids = {name: name_id for name_id, name in enumerate(names)}
+    _name_index = NgramCandidateIndex(merge_threshold)
+    for name in names:
+        _name_index.add(name)
+    _merge_threshold = merge_threshold
+    _fuzzy_threshold = fuzzy_threshold
+
+
+def name_links(start: int, stop: int) -> list[tuple[int, int, bool]]:
+    """Pairs of similar names, the first in ``start:stop``, and whether they're similar enough for fuzzy matching
+
+    Ratios are taken either way round, since matching compares names in input order.
+    """
+    links = []
+    for name_id in range(start, stop):
+        name = _names[name_id]
+        for other in _name_index.candidates(name):
+            other_id = _name_ids[other]
+            if other_id <= name_id:
+                continue
+            ratio = max(SequenceMatcher(None, name, other).ratio(), SequenceMatcher(None, other, name).ratio())
+            if ratio > _merge_threshold:
+                links.append((name_id, other_id, ratio > _fuzzy_threshold))
+    return links
+
+
+def dedup_components(records: list[ServerRecord], names: list[str], executor: Executor, chunks: int,
+                     could_merge: Callable[[ServerRecord, ServerRecord], bool]) -> list[list[int]]:
+    """Positions of ``records`` grouped into components, each in input order
+
+    ``names`` are the distinct ``name_key or ""`` values and ``executor``
+    must have been initialized with ``init_name_links`` on them.
+    ``could_merge`` tells whether two records with merge-similar names could
+    be merged at all.
+    """
+    components = DisjointSet(len(records))
+
+    # Records sharing an exact key or a name
+    first_with_key: list[dict[str, int]] = [{}, {}, {}, {}]
+    for position, record in enumerate(records):
+        keys = (record.repo_key, record.name_author_key, record.content_hash, record.name_key or "")
+        for first_with, key in zip(first_with_key, keys):
+            if key is None:
+                continue
+            first = first_with.setdefault(key, position)
+            if first != position:
+                components.union(first, position)
+
+    # Records whose names are similar
+    positions_by_name: dict[str, list[int]] = {}
+    for position, record in enumerate(records):
+        positions_by_name.setdefault(record.name_key or "", []).append(position)
+
+    chunk_size = -(-len(names) // chunks) if names else 1
+    starts = range(0, len(names), chunk_size)
+    stops = [min(start + chunk_size, len(names)) for start in starts]
+    for links in executor.map(name_links, starts, stops):
+        for name_id, other_id, fuzzy in links:
+            positions = positions_by_name[names[name_id]]
+            other_positions = positions_by_name[names[other_id]]
+            if fuzzy:
+                components.union(positions[0], other_positions[0])
+                continue
+            for position in positions:
+                for other_position in other_positions:
+                    if could_merge(records[position], records[other_position]):
+                        components.union(position, other_position)
+
+    grouped: dict[int, list[int]] = {}
+    for position in range(len(records)):
+        grouped.setdefault(components.find(position), []).append(position)
+    return list(grouped.values())
+
+
+def pack_shards(components: list[list[int]], shard_count: int) -> list[list[int]]:
+    """Components packed into at most ``shard_count`` shards of similar size, each in input order"""
+    shard_count = max(1, min(shard_count, len(components)))
+    shards: list[list[int]] = [[] for _ in range(shard_count)]
+    # Largest components first, each into the currently smallest shard
+    heap = [(0, shard) for shard in range(shard_count)]
+    for component in sorted(components, key=len, reverse=True):
+        size, shard = heapq.heappop(heap)
+        shards[shard].extend(component)
+        heapq.heappush(heap, (size + len(component), shard))
+    return [sorted(shard) for shard in shards if shard]
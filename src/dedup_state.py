@@ -0,0 +1,94 @@
+"""Saved deduplication state, for deduplicating a new snapshot incrementally.
+
+A full run of ``ServerDeduplicator`` matches every input server against the
+indexes built from the servers before it. ``DedupState`` keeps the outcome:
+which output server (cluster) each input server ended up in, two fingerprints
+of each input server, and the matching indexes with their entries pointing at
+clusters. It is saved next to the master data file it produced.
+
+On the next run only the input servers whose matching fingerprint is new or
+different need matching. Clusters that contained such a server or a removed
+one are dissolved and their remaining members matched again, since their
+merged metadata may no longer hold. A cluster whose members changed only in
+fields matching doesn't read (stars, timestamps) keeps its members and has its
+output merged again from them.
+"""
+
+import hashlib
+
+from pydantic import BaseModel
+
+from id_standardization import IDRegistry
+from models import MCPServer
+
+
+class DedupState(BaseModel):
+    code_version: str = ""  # Dedup code the state was built with; set by the pipeline that saves it
+    assignments: dict[str, str] = {}  # Input server identity key -> ID of the output server it's in
+    fingerprints: dict[str, str] = {}  # Input server identity key -> fingerprint of the fields matching reads
+    metadata_fingerprints: dict[str, str] = {}  # Input server identity key -> fingerprint of all its contents
+    # Matching indexes, pointing at output server IDs
+    repository_index: dict[str, str] = {}
+    name_author_index: dict[str, str] = {}
+    content_hash_index: dict[str, str] = {}
+    fuzzy_name_index: dict[str, list[str]] = {}
+
+    def update(self, other: "DedupState"):
+        """Add the clusters of a state built from a disjoint set of servers"""
+        self.assignments.update(other.assignments)
+        self.fingerprints.update(other.fingerprints)
+        self.metadata_fingerprints.update(other.metadata_fingerprints)
+        self.repository_index.update(other.repository_index)
+        self.name_author_index.update(other.name_author_index)
+        self.content_hash_index.update(other.content_hash_index)
+        for name, clusters in other.fuzzy_name_index.items():
+            self.fuzzy_name_index.setdefault(name, []).extend(clusters)
+
+    def drop_clusters(self, clusters: set[str]) -> list[str]:
+        """Forget the given clusters and return the identity keys of their members"""
+        members = [member for member, cluster in self.assignments.items() if cluster in clusters]
+        for member in members:
+            del self.assignments[member]
+        for index in (self.repository_index, self.name_author_index, self.content_hash_index):
+            for key in [key for key, cluster in index.items() if cluster in clusters]:
+                del index[key]
+        for name in list(self.fuzzy_name_index):
+            kept = [cluster for cluster in self.fuzzy_name_index[name] if cluster not in clusters]
+            if kept:
+                self.fuzzy_name_index[name] = kept
+            else:
+                del self.fuzzy_name_index[name]
+        return members
+
+    def rename_clusters(self, renamed: dict[str, str]):
+        """Point everything at a cluster's new ID after a merge made another server its output"""
+        for index in (self.assignments, self.repository_index, self.name_author_index, self.content_hash_index):
+            for key, cluster in index.items():
+                if cluster in renamed:
+                    index[key] = renamed[cluster]
+        for name, clusters in self.fuzzy_name_index.items():
+            self.fuzzy_name_index[name] = list(dict.fromkeys(renamed.get(cluster, cluster) for cluster in clusters))
+
+
+def member_key(server: MCPServer) -> str:
+    """Identity of an input server across snapshots"""
+    return IDRegistry.identity_key(server)
+
+
+def server_fingerprint(server: MCPServer) -> str:
+    """Checksum of the fields ``ServerRecord`` derives, to tell whether matching could treat a server differently"""
+    fields = [
+        server.name,
+        server.author or "",
+        str(server.repository or ""),
+        server.description or "",
+        ",".join(sorted(category.value for category in server.categories)),
+        ",".join(sorted(operation.value for operation in server.operations)),
+        server.implementation_language or "",
+    ]
+    return hashlib.md5("\x1f".join(fields).encode()).hexdigest()
+
+
+def metadata_fingerprint(server: MCPServer) -> str:
+    """Checksum of everything in a server, to tell whether its cluster's merged output is stale"""
+    return hashlib.md5(server.model_dump_json().encode()).hexdigest()
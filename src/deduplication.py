@@ -1,11 +1,10 @@
 """Robust deduplication system for MCP servers across multiple registries.
 """
 
-import hashlib
-import re
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from difflib import SequenceMatcher
 from typing import Dict, List, Optional, Set, Tuple
-from urllib.parse import urlparse
 
 try:
     from tqdm import tqdm
@@ -28,17 +27,51 @@ except ImportError:
         def close(self):
             pass
 
+from batch_similarity import VECTOR_SCORING_AVAILABLE, TfidfScorer
+from dedup_shards import dedup_components, init_name_links, pack_shards
+from dedup_state import DedupState, member_key, metadata_fingerprint, server_fingerprint
 from models import MCPServer, RegistrySource
+from ngram_index import NgramCandidateIndex
+from server_record import ServerRecord
+
+# Name similarity above which fuzzy-matched servers get the closer comparison
+FUZZY_NAME_THRESHOLD = 0.85
+
+# Score above which two servers are likely the same
+SIMILAR_SCORE_THRESHOLD = 0.7
+# Score above which the similarity pass merges two servers
+MERGE_SCORE_THRESHOLD = 0.9
+# The name carries 0.4 of the score, so a name ratio of 0.75 or less caps it at 0.9;
+# the margin covers float rounding in the score
+MERGE_NAME_THRESHOLD = 0.74
+
+# "sequence" compares pairs with SequenceMatcher; "tfidf" scores the similarity
+# pass in batches with n-gram TF-IDF cosines (needs NumPy and SciPy)
+SCORING_BACKENDS = ("sequence", "tfidf")
 
 
 class ServerDeduplicator:
     """Advanced deduplication system using multiple matching criteria"""
 
-    def __init__(self):
-        self.repository_index: dict[str, MCPServer] = {}
-        self.name_author_index: dict[str, MCPServer] = {}
-        self.fuzzy_name_index: dict[str, list[MCPServer]] = {}
-        self.content_hash_index: dict[str, MCPServer] = {}
+    def __init__(self, scoring_backend: str = "sequence", workers: int | None = 1):
+        if scoring_backend not in SCORING_BACKENDS:
+            raise ValueError(f"Unknown scoring backend {scoring_backend!r}, expected one of {SCORING_BACKENDS}")
+        if scoring_backend == "tfidf" and not VECTOR_SCORING_AVAILABLE:
+            print("⚠️  NumPy/SciPy not installed, using sequence scoring. Install with: pip install askg[similarity]")
+            scoring_backend = "sequence"
+        self.scoring_backend = scoring_backend
+        # More than one worker (None for the CPU count) deduplicates independent shards in a process pool
+        self.workers = workers or os.cpu_count() or 1
+        self.show_progress = True
+        self.repository_index: dict[str, ServerRecord] = {}
+        self.name_author_index: dict[str, ServerRecord] = {}
+        self.fuzzy_name_index: dict[str, list[ServerRecord]] = {}
+        self.content_hash_index: dict[str, ServerRecord] = {}
+        self.fuzzy_name_candidates = NgramCandidateIndex(FUZZY_NAME_THRESHOLD)
+        # Input servers behind each unique record, by identity key
+        self.members: dict[ServerRecord, list[str]] = {}
+        # Outcome of the last run, for deduplicating the next snapshot incrementally
+        self.state: DedupState | None = None
 
     def deduplicate_servers(self, servers: list[MCPServer]) -> list[MCPServer]:
         """Deduplicate servers using multiple strategies:
@@ -52,158 +85,372 @@ class ServerDeduplicator:
         print("📋 Using strategies: Repository URL, Name+Author, Content Hash, Fuzzy Matching")
         print()
 
+        # Fingerprint the input before merging changes it
+        fingerprints = {member_key(server): server_fingerprint(server) for server in servers}
+        metadata_fingerprints = {member_key(server): metadata_fingerprint(server) for server in servers}
+
+        if self.workers > 1 and len(servers) > 1:
+            final_servers, unique_count, duplicates_found, self.state = self._deduplicate_sharded(servers)
+            self._print_phase_one(len(servers), unique_count, duplicates_found)
+        else:
+            # Matching only compares a few derived fields, so derive them once per server
+            records = [ServerRecord(server) for server in servers]
+            unique_records, duplicates_found = self._find_unique_records(records)
+            unique_count = len(unique_records)
+            self._print_phase_one(len(servers), unique_count, duplicates_found)
+
+            # Post-process: merge similar servers with high confidence
+            print("🔗 Starting similarity merging phase...")
+            groups = self._merge_similar_servers(unique_records)
+            final_servers = [server for _, server in groups]
+            self.state = self._state_of(unique_records, groups)
+        self.state.fingerprints = fingerprints
+        self.state.metadata_fingerprints = metadata_fingerprints
+
+        self._print_summary(len(servers), unique_count, duplicates_found, len(final_servers))
+        return final_servers
+
+    def _print_summary(self, server_count: int, unique_count: int, duplicates_found: int, final_count: int):
+        """Report the outcome of both phases"""
+        additional_merges = unique_count - final_count
+        total_removed = duplicates_found + additional_merges
+
+        print("✅ Deduplication complete:")
+        print(f"   • Final unique servers: {final_count:,}")
+        print(f"   • Additional merges: {additional_merges:,}")
+        print(f"   • Total removed: {total_removed:,}")
+        if server_count > 0:
+            print(f"   • Overall deduplication rate: {(total_removed / server_count * 100):.1f}%")
+        else:
+            print("   • Overall deduplication rate: N/A (no servers to deduplicate)")
+
+    def deduplicate_incremental(self, servers: list[MCPServer], previous_servers: list[MCPServer],
+                                state: DedupState) -> list[MCPServer]:
+        """Deduplicate a new snapshot against the output and state of an earlier run
+
+        Only servers that are new or changed since that run are matched, and
+        members of the clusters they or removed servers were in. The rest
+        keep their clusters; a cluster whose members changed only in fields
+        matching doesn't read has its output merged again from them.
+        ``previous_servers`` and ``state`` are updated in place; ``self.state``
+        is the new state. Similarity is always scored pairwise here, whatever
+        the scoring backend.
+
+        Raises ValueError if ``state`` doesn't belong to ``previous_servers``,
+        or if servers share a registry ID or output servers share an ID, since
+        members and clusters are tracked by those.
+        """
+        print(f"🔍 Starting incremental deduplication of {len(servers):,} servers...")
+
+        keys = [member_key(server) for server in servers]
+        # Registries that derive IDs from names can give two servers the same one
+        repeated = _repeated(keys)
+        if repeated:
+            raise ValueError(f"{len(repeated):,} registry IDs are shared by several servers: {repeated[:5]}")
+        repeated = _repeated([server.id for server in previous_servers])
+        if repeated:
+            raise ValueError(f"{len(repeated):,} IDs are shared by several previous output servers: {repeated[:5]}")
+        fingerprints = {key: server_fingerprint(server) for key, server in zip(keys, servers)}
+        metadata_fingerprints = {key: metadata_fingerprint(server) for key, server in zip(keys, servers)}
+        position_of = {key: position for position, key in enumerate(keys)}
+
+        # A cluster with a changed or removed member may have been merged on metadata that no longer holds
+        changed = [key for key, fingerprint in fingerprints.items()
+                   if state.fingerprints.get(key) != fingerprint or key not in state.assignments]
+        removed = state.fingerprints.keys() - fingerprints.keys()
+        dissolved = {state.assignments[key] for key in [*changed, *removed] if key in state.assignments}
+
+        # Only popularity, timestamps and the like changed: same members, fresh output
+        stale = {state.assignments[key] for key, fingerprint in metadata_fingerprints.items()
+                 if state.metadata_fingerprints.get(key) != fingerprint and key in state.assignments} - dissolved
+        remerged = {}
+        if stale:
+            members = {}
+            for key, cluster in state.assignments.items():
+                if cluster in stale:
+                    members.setdefault(cluster, []).append(key)
+            for cluster, keys_in_cluster in members.items():
+                output = self._remerge_cluster([servers[position_of[key]]
+                                                for key in sorted(keys_in_cluster, key=position_of.__getitem__)])
+                if output is None:
+                    dissolved.add(cluster)  # Its members no longer merge on their own
+                else:
+                    remerged[cluster] = output
+
+        pending = set(changed)
+        if dissolved:
+            pending.update(key for key in state.drop_clusters(dissolved) if key in fingerprints)
+        pending = sorted(pending, key=position_of.__getitem__)
+
+        saved = _SavedClusters(state, [server for server in previous_servers if server.id not in dissolved])
+        saved.servers.update(remerged)
+        # New clusters are named after their server, so check before anything is merged
+        pending_ids = [servers[position_of[key]].id for key in pending]
+        pending_ids += [server.id for cluster, server in remerged.items() if server.id != cluster]
+        clashes = {server_id for server_id in pending_ids if server_id in saved.servers}
+        if clashes or len(set(pending_ids)) < len(pending_ids):
+            raise ValueError(f"Changed servers share IDs with other servers: {sorted(clashes)[:5]}")
+        print(f"♻️  {len(servers) - len(pending):,} servers unchanged since the last run, "
+              f"matching {len(pending):,} against {len(saved.servers):,} existing servers "
+              f"({len(remerged):,} merged again for metadata changes)")
+
+        # Phase 1: join an existing cluster or start a new one
+        new_clusters = []
+        duplicates_found = 0
+        progress_bar = tqdm(
+            pending,
+            desc="🔎 Matching changes",
+            unit="server",
+            colour="magenta",
+            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]",
+            disable=not self.show_progress,
+        )
+        for key in progress_bar:
+            server = servers[position_of[key]]
+            record = ServerRecord(server)
+            cluster, merges_metadata = self._find_saved_duplicate_of(record, saved)
+            if cluster is None:
+                cluster = saved.add(record)
+                new_clusters.append(cluster)
+                state.assignments[key] = cluster
+                continue
+
+            duplicates_found += 1
+            state.assignments[key] = cluster
+            if merges_metadata:
+                self._merge_duplicate_into(saved.servers[cluster], server)
+                saved.record(cluster).refresh()
+        progress_bar.close()
+
+        # Phase 2: the earliest highly similar cluster absorbs each new one
+        absorbed_by = {}
+        rank = {cluster: i for i, cluster in enumerate(saved.servers)}
+        for cluster in new_clusters:
+            record = saved.record(cluster)
+            if record.name_key is None:
+                continue
+            candidates = sorted(
+                {other for name in saved.names.candidates(record.name_key) for other in state.fuzzy_name_index[name]
+                 if rank[other] < rank[cluster] and other not in absorbed_by},
+                key=rank.__getitem__,
+            )
+            for other in candidates:
+                if self._servers_are_highly_similar(saved.record(other), record):
+                    saved.servers[other] = self._merge_multiple_servers([saved.servers[other], saved.servers[cluster]])
+                    del saved.servers[cluster]
+                    absorbed_by[cluster] = other
+                    break
+
+        # Clusters are named after their output server, which a merge may have changed
+        renamed = {cluster: saved.servers[other].id for cluster, other in absorbed_by.items()}
+        renamed.update((cluster, server.id) for cluster, server in saved.servers.items() if server.id != cluster)
+        if renamed:
+            state.rename_clusters(renamed)
+        state.fingerprints = fingerprints
+        state.metadata_fingerprints = metadata_fingerprints
+        self.state = state
+
+        final_servers = list(saved.servers.values())
+        print("✅ Incremental deduplication complete:")
+        print(f"   • Joined existing servers: {duplicates_found:,}")
+        print(f"   • New unique servers: {len(new_clusters) - len(absorbed_by):,}")
+        print(f"   • Similarity merges: {len(absorbed_by):,}")
+        print(f"   • Final unique servers: {len(final_servers):,}")
+        return final_servers
+
+    def _remerge_cluster(self, members: list[MCPServer]) -> MCPServer | None:
+        """A cluster's output rebuilt from its members, in input order, as a full run merges them
+
+        None if the members don't all end up in one server on their own.
+        """
+        if len(members) == 1:
+            return members[0]
+        deduplicator = ServerDeduplicator()
+        deduplicator.show_progress = False
+        # Merging changes servers in place, and the members are matched again if this fails
+        records = [ServerRecord(server.model_copy(deep=True)) for server in members]
+        unique_records, _ = deduplicator._find_unique_records(records)
+        groups = deduplicator._merge_similar_records(unique_records)
+        return groups[0][1] if len(groups) == 1 else None
+
+    def _find_saved_duplicate_of(self, record: ServerRecord, saved: "_SavedClusters") -> tuple[str | None, bool]:
+        """The saved cluster a server duplicates, as ``_find_duplicate_of`` would find it, or None
+
+        Also returns whether phase 1 would merge the server's metadata into it.
+        """
+        state = saved.state
+        if record.repo_key is not None and record.repo_key in state.repository_index:
+            return state.repository_index[record.repo_key], True
+
+        name_author_key = record.name_author_key
+        if name_author_key is not None and name_author_key in state.name_author_index:
+            return state.name_author_index[name_author_key], True
+
+        if record.content_hash in state.content_hash_index:
+            return state.content_hash_index[record.content_hash], False
+
+        normalized_name = record.name_key or ""
+        for existing_name in saved.names.candidates(normalized_name):
+            if existing_name == normalized_name:
+                continue
+            if SequenceMatcher(None, normalized_name, existing_name).ratio() > FUZZY_NAME_THRESHOLD:
+                for cluster in state.fuzzy_name_index[existing_name]:
+                    if self._servers_are_similar(record, saved.record(cluster)):
+                        return cluster, False
+
+        return None, False
+
+    def _find_unique_records(self, records: list[ServerRecord]) -> tuple[list[ServerRecord], int]:
+        """Phase 1: keep the first of each set of duplicates, merging the others' metadata into it
+
+        Returns the unique records, in input order, and the number of duplicates dropped.
+        """
         # Reset indexes
         self.repository_index.clear()
         self.name_author_index.clear()
         self.fuzzy_name_index.clear()
         self.content_hash_index.clear()
+        self.fuzzy_name_candidates = NgramCandidateIndex(FUZZY_NAME_THRESHOLD)
+        self.members.clear()
 
-        unique_servers = []
+        unique_records = []
         duplicates_found = 0
 
         # Enhanced progress bar for deduplication
         progress_bar = tqdm(
-            servers,
+            records,
             desc="🔎 Deduplicating",
             unit="server",
             colour="magenta",
             bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]",
+            disable=not self.show_progress,
         )
 
-        for server in progress_bar:
+        for record in progress_bar:
+            name = record.server.name
             # Update progress with current server name
-            progress_bar.set_postfix_str(f"Checking: {server.name[:25]}...")
+            progress_bar.set_postfix_str(f"Checking: {name[:25]}...")
 
-            if self._is_duplicate(server):
+            existing = self._find_duplicate_of(record)
+            if existing is not None:
                 duplicates_found += 1
+                self.members[existing].append(member_key(record.server))
                 # Merge metadata from duplicate
-                self._merge_server_metadata(server)
-                progress_bar.set_postfix_str(f"Duplicate: {server.name[:25]}...")
+                self._merge_server_metadata(record)
+                progress_bar.set_postfix_str(f"Duplicate: {name[:25]}...")
             else:
                 # Add as new unique server
-                self._add_to_indexes(server)
-                unique_servers.append(server)
-                progress_bar.set_postfix_str(f"Unique: {server.name[:25]}...")
+                self._add_to_indexes(record)
+                self.members[record] = [member_key(record.server)]
+                unique_records.append(record)
+                progress_bar.set_postfix_str(f"Unique: {name[:25]}...")
 
         progress_bar.close()
 
+        return unique_records, duplicates_found
+
+    def _print_phase_one(self, server_count: int, unique_count: int, duplicates_found: int):
+        """Report the outcome of phase 1"""
         print("✅ Deduplication phase 1 complete:")
-        print(f"   • Unique servers: {len(unique_servers):,}")
+        print(f"   • Unique servers: {unique_count:,}")
         print(f"   • Duplicates found: {duplicates_found:,}")
-        if len(servers) > 0:
-            print(f"   • Deduplication rate: {(duplicates_found / len(servers) * 100):.1f}%")
+        if server_count > 0:
+            print(f"   • Deduplication rate: {(duplicates_found / server_count * 100):.1f}%")
         else:
             print("   • Deduplication rate: N/A (no servers to deduplicate)")
         print()
 
-        # Post-process: merge similar servers with high confidence
-        print("🔗 Starting similarity merging phase...")
-        final_servers = self._merge_similar_servers(unique_servers)
-
-        additional_merges = len(unique_servers) - len(final_servers)
-        total_removed = duplicates_found + additional_merges
-
-        print("✅ Deduplication complete:")
-        print(f"   • Final unique servers: {len(final_servers):,}")
-        print(f"   • Additional merges: {additional_merges:,}")
-        print(f"   • Total removed: {total_removed:,}")
-        if len(servers) > 0:
-            print(f"   • Overall deduplication rate: {(total_removed / len(servers) * 100):.1f}%")
-        else:
-            print("   • Overall deduplication rate: N/A (no servers to deduplicate)")
-
-        return final_servers
+    def _deduplicate_sharded(self, servers: list[MCPServer]) -> tuple[list[MCPServer], int, int, DedupState]:
+        """Both phases on independent shards in a process pool, with the same result as one pass
 
-    def _is_duplicate(self, server: MCPServer) -> bool:
-        """Check if server is a duplicate using multiple criteria"""
+        Returns the final servers, the number left after phase 1, the number of
+        phase 1 duplicates and the state of the run, without fingerprints.
+        """
+        records = [ServerRecord(server) for server in servers]
+        names = list(dict.fromkeys(record.name_key or "" for record in records))
+
+        positioned = []
+        unique_count = duplicates_found = 0
+        state = DedupState()
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=init_name_links,
+                                 initargs=(names, MERGE_NAME_THRESHOLD, FUZZY_NAME_THRESHOLD)) as executor:
+            # Servers only ever match within their component, so components can be split across shards
+            components = dedup_components(records, names, executor, self.workers * 4, self._could_merge)
+            shards = pack_shards(components, self.workers * 4)
+            print(f"🧩 {len(components):,} independent groups in {len(shards)} shards across {self.workers} workers")
+
+            futures = [
+                executor.submit(_deduplicate_shard, [servers[position] for position in shard], shard,
+                                self.scoring_backend)
+                for shard in shards
+            ]
+            progress_bar = tqdm(
+                as_completed(futures),
+                total=len(futures),
+                desc="🧩 Deduplicating shards",
+                unit="shard",
+                colour="magenta",
+                bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]",
+                disable=not self.show_progress,
+            )
+            for future in progress_bar:
+                shard_servers, shard_unique, shard_duplicates, shard_state = future.result()
+                positioned.extend(shard_servers)
+                # Shards share no keys or names, so their states don't overlap
+                state.update(shard_state)
+                unique_count += shard_unique
+                duplicates_found += shard_duplicates
+            progress_bar.close()
+
+        # Single-process order: by the input position of each server's first record
+        positioned.sort(key=lambda item: item[0])
+        return [server for _, server in positioned], unique_count, duplicates_found, state
+
+    def _find_duplicate_of(self, record: ServerRecord) -> ServerRecord | None:
+        """The unique server this one duplicates, using multiple criteria, or None"""
         # 1. Exact repository URL match (highest confidence)
-        if server.repository:
-            normalized_repo = self._normalize_repository_url(str(server.repository))
-            if normalized_repo in self.repository_index:
-                return True
+        if record.repo_key is not None and record.repo_key in self.repository_index:
+            return self.repository_index[record.repo_key]
 
         # 2. Name + author combination
-        if server.name and server.author:
-            name_author_key = f"{self._normalize_name(server.name)}|{self._normalize_name(server.author)}"
-            if name_author_key in self.name_author_index:
-                return True
+        name_author_key = record.name_author_key
+        if name_author_key is not None and name_author_key in self.name_author_index:
+            return self.name_author_index[name_author_key]
 
         # 3. Content hash similarity (for servers with similar descriptions)
-        content_hash = self._calculate_content_hash(server)
-        if content_hash in self.content_hash_index:
-            return True
+        if record.content_hash in self.content_hash_index:
+            return self.content_hash_index[record.content_hash]
 
         # 4. Fuzzy name matching (for variations in naming)
-        if self._has_fuzzy_name_match(server):
-            return True
+        return self._fuzzy_name_match(record)
 
-        return False
-
-    def _add_to_indexes(self, server: MCPServer):
+    def _add_to_indexes(self, record: ServerRecord):
         """Add server to all relevant indexes"""
         # Repository index
-        if server.repository:
-            normalized_repo = self._normalize_repository_url(str(server.repository))
-            self.repository_index[normalized_repo] = server
+        if record.repo_key is not None:
+            self.repository_index[record.repo_key] = record
 
         # Name + author index
-        if server.name and server.author:
-            name_author_key = f"{self._normalize_name(server.name)}|{self._normalize_name(server.author)}"
-            self.name_author_index[name_author_key] = server
+        name_author_key = record.name_author_key
+        if name_author_key is not None:
+            self.name_author_index[name_author_key] = record
 
         # Content hash index
-        content_hash = self._calculate_content_hash(server)
-        self.content_hash_index[content_hash] = server
+        self.content_hash_index[record.content_hash] = record
 
         # Fuzzy name index
-        normalized_name = self._normalize_name(server.name)
-        if normalized_name not in self.fuzzy_name_index:
-            self.fuzzy_name_index[normalized_name] = []
-        self.fuzzy_name_index[normalized_name].append(server)
-
-    def _normalize_repository_url(self, url: str) -> str:
-        """Normalize repository URL for comparison"""
-        # Remove trailing slashes, .git suffix, and normalize case
-        url = url.lower().rstrip("/")
-        url = url.removesuffix(".git")
-
-        # Parse URL to get clean domain + path
-        parsed = urlparse(url)
-        return f"{parsed.netloc}{parsed.path}"
-
-    def _normalize_name(self, name: str) -> str:
-        """Normalize name for comparison"""
-        if not name:
-            return ""
-
-        # Convert to lowercase, remove special chars, normalize spaces
-        normalized = re.sub(r"[^a-z0-9\s]", "", name.lower())
-        normalized = re.sub(r"\s+", " ", normalized).strip()
-
-        # Remove common prefixes/suffixes
-        normalized = re.sub(r"^(mcp[-_\s]*)?", "", normalized)
-        normalized = re.sub(r"[-_\s]*(server|mcp)$", "", normalized)
-
-        return normalized
-
-    def _calculate_content_hash(self, server: MCPServer) -> str:
-        """Calculate content hash based on key identifying features"""
-        content_parts = [
-            self._normalize_name(server.name),
-            self._normalize_name(server.author or ""),
-            (server.description or "").lower()[:200],  # First 200 chars
-            str(sorted(cat.value for cat in server.categories)),
-            str(sorted(op.value for op in server.operations)),
-        ]
-
-        content_string = "|".join(content_parts)
-        return hashlib.md5(content_string.encode()).hexdigest()
-
-    def _has_fuzzy_name_match(self, server: MCPServer) -> bool:
-        """Check for fuzzy name matches using string similarity"""
-        normalized_name = self._normalize_name(server.name)
-
-        for existing_name, existing_servers in self.fuzzy_name_index.items():
+        name_key = record.name_key or ""
+        if name_key not in self.fuzzy_name_index:
+            self.fuzzy_name_index[name_key] = []
+            self.fuzzy_name_candidates.add(name_key)
+        self.fuzzy_name_index[name_key].append(record)
+
+    def _fuzzy_name_match(self, record: ServerRecord) -> ServerRecord | None:
+        """The first unique server with a similar name that looks like the same server, or None"""
+        normalized_name = record.name_key or ""
+
+        # Only names the candidate index can't rule out get a full comparison
+        for existing_name in self.fuzzy_name_candidates.candidates(normalized_name):
             # Skip exact matches (already handled)
             if existing_name == normalized_name:
                 continue
@@ -212,73 +459,67 @@ class ServerDeduplicator:
             similarity = SequenceMatcher(None, normalized_name, existing_name).ratio()
 
             # High similarity threshold for fuzzy matching
-            if similarity > 0.85:
+            if similarity > FUZZY_NAME_THRESHOLD:
                 # Additional checks to confirm it's the same server
-                for existing_server in existing_servers:
-                    if self._servers_are_similar(server, existing_server):
-                        return True
+                for existing_record in self.fuzzy_name_index[existing_name]:
+                    if self._servers_are_similar(record, existing_record):
+                        return existing_record
 
-        return False
+        return None
 
-    def _servers_are_similar(self, server1: MCPServer, server2: MCPServer) -> bool:
+    def _servers_are_similar(self, record1: ServerRecord, record2: ServerRecord) -> bool:
         """Check if two servers are likely the same using multiple signals"""
         similarity_score = 0
 
         # Author similarity
-        if server1.author and server2.author:
-            author_sim = SequenceMatcher(None,
-                self._normalize_name(server1.author),
-                self._normalize_name(server2.author),
-            ).ratio()
+        if record1.author_key is not None and record2.author_key is not None:
+            author_sim = SequenceMatcher(None, record1.author_key, record2.author_key).ratio()
             similarity_score += author_sim * 0.3
 
         # Description similarity
-        if server1.description and server2.description:
-            desc_sim = SequenceMatcher(None,
-                server1.description.lower()[:100],
-                server2.description.lower()[:100],
-            ).ratio()
+        if record1.description_prefix is not None and record2.description_prefix is not None:
+            desc_sim = SequenceMatcher(None, record1.description_prefix, record2.description_prefix).ratio()
             similarity_score += desc_sim * 0.2
 
         # Category overlap
-        common_categories = set(server1.categories) & set(server2.categories)
-        if server1.categories and server2.categories:
-            category_sim = len(common_categories) / max(len(server1.categories), len(server2.categories))
+        if record1.category_count and record2.category_count:
+            common_categories = (record1.category_mask & record2.category_mask).bit_count()
+            category_sim = common_categories / max(record1.category_count, record2.category_count)
             similarity_score += category_sim * 0.2
 
         # Language similarity
-        if (server1.implementation_language and server2.implementation_language and
-            server1.implementation_language == server2.implementation_language):
+        if record1.language is not None and record1.language == record2.language:
             similarity_score += 0.1
 
         # Repository domain similarity (different repos but same author/org)
-        if server1.repository and server2.repository:
-            repo1_parts = str(server1.repository).split("/")
-            repo2_parts = str(server2.repository).split("/")
-            if len(repo1_parts) >= 4 and len(repo2_parts) >= 4:
-                if repo1_parts[3] == repo2_parts[3]:  # Same GitHub organization
-                    similarity_score += 0.2
+        if record1.repo_owner is not None and record1.repo_owner == record2.repo_owner:
+            similarity_score += 0.2  # Same GitHub organization
 
-        return similarity_score > 0.7
+        return similarity_score > SIMILAR_SCORE_THRESHOLD
 
-    def _merge_server_metadata(self, duplicate_server: MCPServer):
+    def _merge_server_metadata(self, duplicate: ServerRecord):
         """Merge metadata from duplicate server into existing server"""
         # Find the existing server to merge into
-        existing_server = None
+        existing = None
 
         # Try repository match first
-        if duplicate_server.repository:
-            normalized_repo = self._normalize_repository_url(str(duplicate_server.repository))
-            existing_server = self.repository_index.get(normalized_repo)
+        if duplicate.repo_key is not None:
+            existing = self.repository_index.get(duplicate.repo_key)
 
         # Try name+author match
-        if not existing_server and duplicate_server.name and duplicate_server.author:
-            name_author_key = f"{self._normalize_name(duplicate_server.name)}|{self._normalize_name(duplicate_server.author)}"
-            existing_server = self.name_author_index.get(name_author_key)
+        if not existing and duplicate.name_author_key is not None:
+            existing = self.name_author_index.get(duplicate.name_author_key)
 
-        if not existing_server:
+        if not existing:
             return
 
+        self._merge_duplicate_into(existing.server, duplicate.server)
+        # Later matches compare against the merged categories and description
+        existing.refresh()
+
+    def _merge_duplicate_into(self, existing_server: MCPServer, duplicate_server: MCPServer):
+        """Copy missing metadata and union lists from a duplicate into the existing server"""
+
         # Merge metadata (prefer non-empty values)
         if not existing_server.description and duplicate_server.description:
             existing_server.description = duplicate_server.description
@@ -320,42 +561,74 @@ class ServerDeduplicator:
             (not existing_server.last_updated or duplicate_server.last_updated > existing_server.last_updated)):
             existing_server.last_updated = duplicate_server.last_updated
 
-    def _merge_similar_servers(self, servers: list[MCPServer]) -> list[MCPServer]:
+    def _merge_similar_servers(self, records: list[ServerRecord]) -> list[tuple[list[int], MCPServer]]:
         """Final pass: merge servers that are very similar but not exact duplicates"""
+        groups = self._merge_similar_records(records)
+        print(f"   • Similarity groups merged: {len(records) - len(groups)}")
+        return groups
+
+    def _merge_similar_records(self, records: list[ServerRecord]) -> list[tuple[list[int], MCPServer]]:
+        """Merged servers, each with the indexes of the records merged into it, first one first"""
         final_servers = []
         processed_indices = set()
-        merges_found = 0
 
         # Progress bar for similarity merging
         progress_bar = tqdm(
-            enumerate(servers),
-            total=len(servers),
+            enumerate(records),
+            total=len(records),
             desc="🔗 Similarity merge",
             unit="server",
             colour="cyan",
             bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]",
+            disable=not self.show_progress,
         )
 
-        for i, server in progress_bar:
+        # Block on the name: only servers whose names are close enough to reach the
+        # merge threshold are scored against each other
+        indices_by_name: dict[str, list[int]] = {}
+        name_candidates = NgramCandidateIndex(MERGE_NAME_THRESHOLD)
+        for i, record in enumerate(records):
+            if record.name_key is None:
+                continue
+            if record.name_key not in indices_by_name:
+                indices_by_name[record.name_key] = []
+                name_candidates.add(record.name_key)
+            indices_by_name[record.name_key].append(i)
+
+        def later_candidates(i: int) -> list[int]:
+            name_key = records[i].name_key
+            if name_key is None:
+                return []
+            return sorted(j for name in name_candidates.candidates(name_key) for j in indices_by_name[name] if j > i)
+
+        # The batch backend scores every candidate pair up front in one pass
+        batch_matches = None
+        if self.scoring_backend == "tfidf":
+            pairs = [(i, j) for i in range(len(records)) for j in later_candidates(i)]
+            verdicts = TfidfScorer(records).highly_similar([i for i, _ in pairs], [j for _, j in pairs],
+                                                           SIMILAR_SCORE_THRESHOLD, MERGE_SCORE_THRESHOLD)
+            batch_matches = {}
+            for (i, j), similar in zip(pairs, verdicts):
+                if similar:
+                    batch_matches.setdefault(i, []).append(j)
+
+        for i, record in progress_bar:
             if i in processed_indices:
                 continue
 
-            progress_bar.set_postfix_str(f"Analyzing: {server.name[:20]}...")
+            progress_bar.set_postfix_str(f"Analyzing: {record.server.name[:20]}...")
 
             # Look for highly similar servers
-            similar_indices = []
-            for j, other_server in enumerate(servers[i+1:], i+1):
-                if j in processed_indices:
-                    continue
-
-                if self._servers_are_highly_similar(server, other_server):
-                    similar_indices.append(j)
+            if batch_matches is not None:
+                similar_indices = [j for j in batch_matches.get(i, ()) if j not in processed_indices]
+            else:
+                similar_indices = [j for j in later_candidates(i)
+                                   if j not in processed_indices and self._servers_are_highly_similar(record, records[j])]
 
             if similar_indices:
                 # Merge all similar servers into one
-                merged_server = self._merge_multiple_servers([server] + [servers[j] for j in similar_indices])
-                final_servers.append(merged_server)
-                merges_found += len(similar_indices)
+                merged_server = self._merge_multiple_servers([record.server] + [records[j].server for j in similar_indices])
+                final_servers.append(([i] + similar_indices, merged_server))
 
                 # Mark all as processed
                 processed_indices.add(i)
@@ -363,65 +636,82 @@ class ServerDeduplicator:
 
                 progress_bar.set_postfix_str(f"Merged {len(similar_indices)+1} servers")
             else:
-                final_servers.append(server)
+                final_servers.append(([i], record.server))
                 processed_indices.add(i)
 
         progress_bar.close()
 
-        print(f"   • Similarity groups merged: {merges_found}")
-
         return final_servers
 
-    def _servers_are_highly_similar(self, server1: MCPServer, server2: MCPServer) -> bool:
-        """Check if servers are highly similar and should be merged"""
+    def _state_of(self, unique_records: list[ServerRecord],
+                  groups: list[tuple[list[int], MCPServer]]) -> DedupState:
+        """The clusters and indexes of a run, with the indexes pointing at output servers"""
+        cluster_of: dict[ServerRecord, str] = {}
+        assignments = {}
+        for indices, server in groups:
+            for i in indices:
+                cluster_of[unique_records[i]] = server.id
+                for member in self.members[unique_records[i]]:
+                    assignments[member] = server.id
+
+        return DedupState(
+            assignments=assignments,
+            repository_index={key: cluster_of[record] for key, record in self.repository_index.items()},
+            name_author_index={key: cluster_of[record] for key, record in self.name_author_index.items()},
+            content_hash_index={key: cluster_of[record] for key, record in self.content_hash_index.items()},
+            fuzzy_name_index={name: list(dict.fromkeys(cluster_of[record] for record in records))
+                              for name, records in self.fuzzy_name_index.items()},
+        )
+
+    @staticmethod
+    def _could_merge(record1: ServerRecord, record2: ServerRecord) -> bool:
+        """Whether the similarity pass could merge two servers, judged on fields merging never changes"""
         # Don't merge servers from the same registry (already deduplicated)
-        if server1.registry_source == server2.registry_source:
+        if record1.registry_source == record2.registry_source:
+            return False
+
+        # Without both authors or a shared repository domain the score can't reach the threshold
+        if record1.author_key is None or record2.author_key is None:
+            return False
+        return record1.repo_domain is not None and record1.repo_domain == record2.repo_domain
+
+    def _servers_are_highly_similar(self, record1: ServerRecord, record2: ServerRecord) -> bool:
+        """Check if servers are highly similar and should be merged"""
+        if not self._could_merge(record1, record2):
             return False
 
         # High similarity threshold for cross-registry merging
-        return self._servers_are_similar(server1, server2) and self._calculate_similarity_score(server1, server2) > 0.9
+        return (self._servers_are_similar(record1, record2)
+                and self._calculate_similarity_score(record1, record2) > MERGE_SCORE_THRESHOLD)
 
-    def _calculate_similarity_score(self, server1: MCPServer, server2: MCPServer) -> float:
+    def _calculate_similarity_score(self, record1: ServerRecord, record2: ServerRecord) -> float:
         """Calculate detailed similarity score between two servers"""
         score = 0.0
 
         # Name similarity (high weight)
-        if server1.name and server2.name:
-            name_sim = SequenceMatcher(None,
-                self._normalize_name(server1.name),
-                self._normalize_name(server2.name),
-            ).ratio()
+        if record1.name_key is not None and record2.name_key is not None:
+            name_sim = SequenceMatcher(None, record1.name_key, record2.name_key).ratio()
             score += name_sim * 0.4
 
         # Author similarity
-        if server1.author and server2.author:
-            author_sim = SequenceMatcher(None,
-                self._normalize_name(server1.author),
-                self._normalize_name(server2.author),
-            ).ratio()
+        if record1.author_key is not None and record2.author_key is not None:
+            author_sim = SequenceMatcher(None, record1.author_key, record2.author_key).ratio()
             score += author_sim * 0.2
 
         # Repository domain similarity
-        if server1.repository and server2.repository:
-            repo1_domain = urlparse(str(server1.repository)).netloc
-            repo2_domain = urlparse(str(server2.repository)).netloc
-            if repo1_domain == repo2_domain:
-                score += 0.2
+        if record1.repo_domain is not None and record1.repo_domain == record2.repo_domain:
+            score += 0.2
 
         # Description similarity
-        if server1.description and server2.description:
-            desc_sim = SequenceMatcher(None,
-                server1.description.lower(),
-                server2.description.lower(),
-            ).ratio()
+        if record1.description is not None and record2.description is not None:
+            desc_sim = SequenceMatcher(None, record1.description, record2.description).ratio()
             score += desc_sim * 0.1
 
         # Category overlap
-        if server1.categories and server2.categories:
-            common_cats = set(server1.categories) & set(server2.categories)
-            total_cats = set(server1.categories) | set(server2.categories)
-            if total_cats:
-                score += (len(common_cats) / len(total_cats)) * 0.1
+        if record1.category_count and record2.category_count:
+            common_cats = (record1.category_mask & record2.category_mask).bit_count()
+            total_cats = (record1.category_mask | record2.category_mask).bit_count()
+            score += (common_cats / total_cats) * 0.1
 
         return score
 
@@ -492,3 +782,69 @@ class ServerDeduplicator:
         if (other_server.last_updated and
             (not base_server.last_updated or other_server.last_updated > base_server.last_updated)):
             base_server.last_updated = other_server.last_updated
+
+
+def _repeated(values: list[str]) -> list[str]:
+    """Values that occur more than once, sorted"""
+    seen = set()
+    return sorted({value for value in values if value in seen or seen.add(value)})
+
+
+class _SavedClusters:
+    """Output servers of an earlier run, by cluster, with the state that matches against them"""
+
+    def __init__(self, state: DedupState, servers: list[MCPServer]):
+        self.state = state
+        # In output order; new clusters are added at the end
+        self.servers = {server.id: server for server in servers}
+        missing = set(state.assignments.values()) - self.servers.keys()
+        if missing:
+            raise ValueError(f"Saved dedup state refers to {len(missing):,} servers missing from the previous output")
+        self.records: dict[str, ServerRecord] = {}
+        # The merge threshold is the lower one, so these candidates serve fuzzy matching too
+        self.names = NgramCandidateIndex(MERGE_NAME_THRESHOLD)
+        for name in state.fuzzy_name_index:
+            self.names.add(name)
+
+    def record(self, cluster: str) -> ServerRecord:
+        if cluster not in self.records:
+            self.records[cluster] = ServerRecord(self.servers[cluster])
+        return self.records[cluster]
+
+    def add(self, record: ServerRecord) -> str:
+        """Start a cluster for a server that matched none, indexed as ``_add_to_indexes`` would"""
+        cluster = record.id
+        self.servers[cluster] = record.server
+        self.records[cluster] = record
+
+        state = self.state
+        if record.repo_key is not None:
+            state.repository_index[record.repo_key] = cluster
+        if record.name_author_key is not None:
+            state.name_author_index[record.name_author_key] = cluster
+        state.content_hash_index[record.content_hash] = cluster
+        name_key = record.name_key or ""
+        if name_key not in state.fuzzy_name_index:
+            state.fuzzy_name_index[name_key] = []
+            self.names.add(name_key)
+        state.fuzzy_name_index[name_key].append(cluster)
+        return cluster
+
+
+def _deduplicate_shard(servers: list[MCPServer], positions: list[int],
+                       scoring_backend: str) -> tuple[list[tuple[int, MCPServer]], int, int, DedupState]:
+    """Deduplicate one shard in a worker process
+
+    Returns the final servers with the input positions that order them, the
+    number of servers left after phase 1, the number of phase 1 duplicates and
+    the shard's state.
+    """
+    deduplicator = ServerDeduplicator(scoring_backend=scoring_backend)
+    deduplicator.show_progress = False
+
+    records = [ServerRecord(server) for server in servers]
+    unique_records, duplicates_found = deduplicator._find_unique_records(records)
+    position_of = {id(record): position for record, position in zip(records, positions)}
+    groups = deduplicator._merge_similar_records(unique_records)
+    final_servers = [(position_of[id(unique_records[indices[0]])], server) for indices, server in groups]
+    return final_servers, len(unique_records), duplicates_found, deduplicator._state_of(unique_records, groups)
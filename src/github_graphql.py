@@ -0,0 +1,93 @@
+"""Batch repository enrichment through the GitHub GraphQL API.
+
+The REST enrichment path costs two to five requests per repository (README,
+package manifests, repo details). A single GraphQL query can instead resolve
+a whole batch of repositories, README and manifest blobs included, by giving
+each repository its own alias.
+"""
+
+import json
+from typing import Any
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# The REST /readme endpoint finds the README whatever its name; GraphQL needs
+# explicit paths, so probe the common spellings.
+README_PATHS = ["README.md", "readme.md", "Readme.md", "README.rst", "README"]
+PACKAGE_FILES = ["package.json", "pyproject.toml", "Cargo.toml"]
+
+_BLOB_PATHS = README_PATHS + PACKAGE_FILES
+
+_REPOSITORY_FIELDS = """
+    name
+    owner { login }
+    url
+    description
+    homepageUrl
+    stargazerCount
+    forkCount
+    primaryLanguage { name }
+    pushedAt
+    updatedAt
+    repositoryTopics(first: 20) { nodes { topic { name } } }
+""" + "".join(
+    f'    blob{i}: object(expression: {json.dumps("HEAD:" + path)}) {{ ... on Blob {{ text }} }}\n'
+    for i, path in enumerate(_BLOB_PATHS)
+)
+
+
+class RepositoryDetails:
+    """Repository metadata plus README and manifest contents from one query"""
+
+    def __init__(self, repo: dict[str, Any], readme: str | None, files: dict[str, str]):
+        # Shaped like a REST repository object so the REST code paths can use it
+        self.repo = repo
+        self.readme = readme
+        self.files = files
+
+
+def build_query(repo_paths: list[str]) -> str:
+    """GraphQL query resolving every ``owner/name`` in ``repo_paths``."""
+    parts = []
+    for i, path in enumerate(repo_paths):
+        owner, _, name = path.partition("/")
+        parts.append(
+            f"  r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{{_REPOSITORY_FIELDS}  }}"
+        )
+    return "query {\n" + "\n".join(parts) + "\n}"
+
+
+def parse_repository(node: dict[str, Any] | None) -> RepositoryDetails | None:
+    """Convert one aliased ``repository`` result (None if it wasn't found)."""
+    if not node:
+        return None
+
+    blobs = {path: (node.get(f"blob{i}") or {}).get("text") for i, path in enumerate(_BLOB_PATHS)}
+    readme = next((blobs[path] for path in README_PATHS if blobs[path] is not None), None)
+    files = {path: blobs[path] for path in PACKAGE_FILES if blobs[path] is not None}
+
+    topics = [edge["topic"]["name"] for edge in (node.get("repositoryTopics") or {}).get("nodes", [])]
+    repo = {
+        "name": node["name"],
+        "owner": {"login": node["owner"]["login"]},
+        "html_url": node["url"],
+        "description": node.get("description"),
+        "homepage": node.get("homepageUrl"),
+        "language": (node.get("primaryLanguage") or {}).get("name"),
+        "topics": topics,
+        "stargazers_count": node.get("stargazerCount", 0),
+        "forks_count": node.get("forkCount", 0),
+        "pushed_at": node.get("pushedAt"),
+        "updated_at": node.get("updatedAt"),
+    }
+    return RepositoryDetails(repo, readme, files)
+
+
+def parse_response(repo_paths: list[str], data: dict[str, Any]) -> dict[str, RepositoryDetails | None]:
+    """Map each requested ``owner/name`` to its details.
+
+    Repositories that don't exist come back as null with a NOT_FOUND error
+    alongside the other results and map to None.
+    """
+    results = data.get("data") or {}
+    return {path: parse_repository(results.get(f"r{i}")) for i, path in enumerate(repo_paths)}
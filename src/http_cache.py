@@ -0,0 +1,105 @@
+"""Persistent HTTP cache for conditional requests.
+
+Stores the ETag / Last-Modified validators and the (compressed) body of every
+cacheable response on disk. On the next run the validators are sent back as
+If-None-Match / If-Modified-Since, and a 304 Not Modified reply is served from
+the local body store instead of downloading the page again.
+"""
+
+import hashlib
+import json
+import os
+import zlib
+from pathlib import Path
+from typing import Any
+
+
+class CachedResponse:
+    """Status, headers and body of a completed request"""
+
+    def __init__(self, url: str, status: int, headers: Any, body: bytes, from_cache: bool = False):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        # True when the server answered 304 and the body came from disk
+        self.from_cache = from_cache
+
+    def text(self, encoding: str = "utf-8") -> str:
+        return self.body.decode(encoding, errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class CacheEntry:
+    """Validators and body stored for one URL"""
+
+    def __init__(self, etag: str | None, last_modified: str | None, body: bytes):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body = body
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+    """Disk-backed store of validators and bodies keyed by request URL"""
+
+    def __init__(self, cache_dir: str | Path):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Per-run counters for reporting
+        self.revalidated = 0
+        self.downloaded = 0
+
+    def _paths(self, url: str, variant: str = "") -> tuple[Path, Path]:
+        key = hashlib.sha256(f"{variant}|{url}".encode()).hexdigest()
+        shard = self.cache_dir / key[:2]
+        return shard / f"{key}.json", shard / f"{key}.body"
+
+    def lookup(self, url: str, variant: str = "") -> CacheEntry | None:
+        """Return the stored entry for ``url``, or None if there is none."""
+        meta_path, body_path = self._paths(url, variant)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            body = zlib.decompress(body_path.read_bytes())
+        except (OSError, ValueError, zlib.error):
+            return None
+
+        return CacheEntry(meta.get("etag"), meta.get("last_modified"), body)
+
+    def store(self, url: str, headers: Any, body: bytes, variant: str = "") -> bool:
+        """Store a 200 response if it carries validators. Returns True if stored."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return False
+
+        meta_path, body_path = self._paths(url, variant)
+        meta_path.parent.mkdir(exist_ok=True)
+
+        # Write the body first and the metadata last, each atomically, so a
+        # crash never leaves validators pointing at a missing or partial body.
+        _atomic_write(body_path, zlib.compress(body))
+        _atomic_write(meta_path, json.dumps({
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+        }).encode())
+        return True
+
+
+def _atomic_write(path: Path, data: bytes):
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
@@ -1,11 +1,16 @@
 """Global standardized ID generation for MCP servers.
 
 Creates stable, unique, global identifiers based on server properties
-rather than registry-specific prefixes.
+rather than registry-specific prefixes. Assigned IDs can be kept in an
+``IDRegistry`` file so a server keeps its ID from one run to the next.
 """
 
 import hashlib
+import json
+import os
 import re
+from collections.abc import Iterable
+from pathlib import Path
 from typing import Any, Dict, Optional
 from urllib.parse import urlparse
 
@@ -15,8 +20,8 @@ from models import MCPServer, RegistrySource
 class GlobalIDGenerator:
     """Generates standardized global IDs for MCP servers"""
 
-    def __init__(self):
-        self.used_ids = set()
+    def __init__(self, reserved_ids: Iterable[str] = ()):
+        self.used_ids = set(reserved_ids)  # IDs already taken, e.g. by an IDRegistry
         self.id_mappings = {}  # Maps old registry-specific IDs to global IDs
 
     def generate_global_id(self, server_data: dict[str, Any], registry_source: RegistrySource) -> str:
@@ -155,10 +160,53 @@ class GlobalIDGenerator:
         return hashlib.sha256(content_string.encode()).hexdigest()
 
 
-def convert_server_to_global_id(server: MCPServer, id_generator: GlobalIDGenerator) -> MCPServer:
-    """Convert a server with registry-specific ID to use global ID"""
-    # Generate global ID
-    server_data = {
+class IDRegistry:
+    """Persistent mapping from server identity keys to their global IDs
+
+    A server's identity key is its registry and registry-specific ID. Once a
+    global ID has been assigned to a key it is returned for that key on every
+    later run, and never given to another server.
+
+    ``from_config`` opens the configured registry file. Without a ``path``
+    the registry lives only in memory, e.g. for tests.
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path else None
+        self.ids: dict[str, str] = {}
+        if self.path and self.path.exists():
+            self.ids = json.loads(self.path.read_text())
+        self.assigned = set(self.ids.values())
+
+    @classmethod
+    def from_config(cls, config) -> "IDRegistry":
+        """The registry at ``storage.id_registry_path``, by default ``id_registry.json`` under ``storage.base_path``"""
+        default_path = Path(config.get("storage.base_path", "./data")) / "id_registry.json"
+        return cls(config.get("storage.id_registry_path", default_path))
+
+    @staticmethod
+    def identity_key(server: MCPServer) -> str:
+        return f"{server.registry_source.value}:{server.id}"
+
+    def get(self, key: str) -> str | None:
+        return self.ids.get(key)
+
+    def assign(self, key: str, global_id: str):
+        self.ids[key] = global_id
+        self.assigned.add(global_id)
+
+    def save(self):
+        """Write the registry to its file, if it has one"""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self.ids, sort_keys=True, indent=0))
+        os.replace(tmp_path, self.path)
+
+
+def _id_source_data(server: MCPServer) -> dict[str, Any]:
+    return {
         "name": server.name,
         "author": server.author,
         "description": server.description,
@@ -166,8 +214,8 @@ def convert_server_to_global_id(server: MCPServer, id_generator: GlobalIDGenerat
         "tools": [{"name": tool.name} for tool in (server.tools or [])],
     }
 
-    global_id = id_generator.generate_global_id(server_data, server.registry_source)
 
+def _with_global_id(server: MCPServer, global_id: str) -> MCPServer:
     # Create new server instance with global ID
     server_dict = server.dict()
     server_dict["id"] = global_id
@@ -180,23 +228,55 @@ def convert_server_to_global_id(server: MCPServer, id_generator: GlobalIDGenerat
     return MCPServer(**server_dict)
 
 
-def batch_convert_to_global_ids(servers: list[MCPServer]) -> list[MCPServer]:
-    """Convert a batch of servers to use global IDs"""
-    id_generator = GlobalIDGenerator()
-    converted_servers = []
+def convert_server_to_global_id(server: MCPServer, id_generator: GlobalIDGenerator) -> MCPServer:
+    """Convert a server with registry-specific ID to use global ID"""
+    global_id = id_generator.generate_global_id(_id_source_data(server), server.registry_source)
+    return _with_global_id(server, global_id)
+
+
+def batch_convert_to_global_ids(servers: list[MCPServer], id_registry: IDRegistry | None = None) -> list[MCPServer]:
+    """Convert a batch of servers to use global IDs
+
+    Servers already in ``id_registry`` keep their recorded IDs. New servers are
+    named in identity-key order, so which of them wins a contested ID doesn't
+    depend on the order they arrive in, and are added to the registry, which is
+    then saved. Without ``id_registry`` the configured registry file is used;
+    pass ``IDRegistry()`` to keep the IDs in memory only.
+    """
+    if id_registry is None:
+        # Imported here so dedup, which uses IDRegistry.identity_key, doesn't pull in the scrapers
+        from scrapers import ConfigManager
+        id_registry = IDRegistry.from_config(ConfigManager())
+    id_generator = GlobalIDGenerator(id_registry.assigned)
 
     print(f"Converting {len(servers)} servers to global IDs...")
 
+    new_servers = sorted((server for server in servers if id_registry.get(IDRegistry.identity_key(server)) is None),
+                         key=IDRegistry.identity_key)
+    new_ids = 0
+    for server in new_servers:
+        key = IDRegistry.identity_key(server)
+        if id_registry.get(key) is not None:
+            continue  # The same registry entry twice in the batch
+        try:
+            id_registry.assign(key, id_generator.generate_global_id(_id_source_data(server), server.registry_source))
+            new_ids += 1
+        except Exception as e:
+            print(f"Error generating global ID for server {server.id}: {e}")
+
+    converted_servers = []
     for server in servers:
+        global_id = id_registry.get(IDRegistry.identity_key(server))
         try:
-            converted_server = convert_server_to_global_id(server, id_generator)
-            converted_servers.append(converted_server)
+            converted_servers.append(_with_global_id(server, global_id) if global_id else server)
         except Exception as e:
             print(f"Error converting server {server.id}: {e}")
             # Keep original server if conversion fails
             converted_servers.append(server)
 
-    print(f"Conversion complete. Generated {len(id_generator.used_ids)} unique global IDs.")
+    id_registry.save()
+    print(f"Conversion complete. Reused {len(servers) - len(new_servers):,} registered global IDs, "
+          f"generated {new_ids:,} new ones.")
 
     # Report on ID patterns
     id_patterns = analyze_id_patterns(converted_servers)
@@ -4,7 +4,7 @@
 This script:
 1. Checks if master data exists and is newer than registry data
 2. If current master data exists, loads it directly to Neo4j
-3. If master data is outdated/missing, runs full deduplication and saves new master data
+3. If master data is outdated/missing, deduplicates (incrementally against the saved dedup state when possible) and saves new master data
 4. Supports both local and remote Neo4j instances with fast/standard loading
 """
 
@@ -12,55 +12,27 @@ import argparse
 import asyncio
 import time
 from datetime import datetime
-from pathlib import Path
 from typing import List
 
+import batch_similarity
+import dedup_shards
+import dedup_state
+import deduplication
+import models
+import ngram_index
+import server_record
+from build_cache import BuildCache, cache_key, code_version, file_checksum, registry_checksums
 from deduplication import ServerDeduplicator
-from master_data import MasterDataManager
+from master_changelog import MasterChangelog
+from master_data import MasterDataManager, MasterDataReader
 from models import KnowledgeGraph, MCPServer, OntologyCategory, ServerCategory
 from neo4j_integration import Neo4jManager
+from registry_loader import load_registry_servers
 
 
-def load_all_registry_servers() -> list[MCPServer]:
+def load_all_registry_servers(workers: int | None = None) -> list[MCPServer]:
     """Load all servers from existing registry data"""
-    data_dir = Path("data/registries")
-    all_servers = []
-    registry_counts = {}
-
-    for registry_dir in data_dir.iterdir():
-        if not registry_dir.is_dir():
-            continue
-
-        registry_name = registry_dir.name
-        json_files = list(registry_dir.glob("*.json"))
-
-        if not json_files:
-            continue
-
-        # Get the latest file
-        latest_file = max(json_files, key=lambda f: f.stat().st_mtime)
-
-        print(f"📁 Loading {registry_name}: {latest_file.name}")
-
-        try:
-            import json
-            with open(latest_file) as f:
-                data = json.load(f)
-
-            servers_from_registry = []
-            for server_data in data.get("servers", []):
-                try:
-                    server = MCPServer(**server_data)
-                    servers_from_registry.append(server)
-                except Exception:
-                    continue
-
-            registry_counts[registry_name] = len(servers_from_registry)
-            all_servers.extend(servers_from_registry)
-            print(f"   ✅ Loaded {len(servers_from_registry):,} servers")
-
-        except Exception as e:
-            print(f"   ❌ Failed to load {registry_name}: {e}")
+    all_servers, registry_counts = load_registry_servers(workers=workers)
 
     print(f"\n📊 Total servers loaded: {len(all_servers):,}")
     for registry, count in sorted(registry_counts.items(), key=lambda x: x[1], reverse=True):
@@ -115,20 +87,67 @@ def assign_servers_to_categories(servers: list[MCPServer], categories: list[Onto
                 category_map[category_id].servers.append(server.id)
 
 
-async def run_full_deduplication_pipeline(master_manager: MasterDataManager) -> KnowledgeGraph:
-    """Run the complete deduplication pipeline and save master data"""
+def dedup_code_version() -> str:
+    """Version of the code that turns registry data into master data"""
+    return code_version(deduplication, models, server_record, ngram_index, batch_similarity, dedup_shards, dedup_state,
+                        create_basic_categories, assign_servers_to_categories)
+
+
+def dedup_stage_key(master_manager: MasterDataManager) -> str:
+    """Build cache key of the master data: registry contents plus dedup and categorization code
+
+    The key says whether the master data was built from these inputs, not
+    that it is the only output they could give: incremental deduplication also
+    depends on earlier runs (see ``run_full_deduplication_pipeline``).
+    """
+    return cache_key(registry_checksums(master_manager.registries_dir), dedup_code_version())
+
+
+async def run_full_deduplication_pipeline(master_manager: MasterDataManager,
+                                          load_workers: int | None = None,
+                                          dedup_workers: int | None = 1,
+                                          incremental: bool = True) -> KnowledgeGraph:
+    """Run the complete deduplication pipeline and save master data
+
+    With ``incremental``, servers are matched against the dedup state saved
+    with the latest master data when there is one from the same code, so only
+    new and changed servers are deduplicated.
+
+    Incremental output depends on the run history, not only on the registry
+    data and code that ``dedup_stage_key`` covers: servers are matched
+    against merged clusters from earlier runs, so a few clusters can differ
+    from a full rebuild (7 of 12,292 in a 25k-server benchmark). Pass
+    ``incremental=False`` (``--force-rebuild``) for the output of the
+    inputs alone.
+    """
     print("🔄 Running full deduplication pipeline...")
 
     # Load all registry data
-    all_servers = load_all_registry_servers()
+    all_servers = load_all_registry_servers(load_workers)
 
     if not all_servers:
         raise ValueError("No servers found in registry data!")
 
     # Run deduplication
     print(f"\n🔧 Starting deduplication of {len(all_servers):,} servers...")
-    deduplicator = ServerDeduplicator()
-    unique_servers = deduplicator.deduplicate_servers(all_servers)
+    deduplicator = ServerDeduplicator(workers=dedup_workers)
+    code = dedup_code_version()
+    unique_servers = None
+
+    state = master_manager.load_dedup_state() if incremental else None
+    if state is not None and state.code_version != code:
+        print("⚠️  Dedup code changed since the saved dedup state, deduplicating everything")
+    elif state is not None:
+        previous = master_manager.load_master_data()
+        if previous is not None:
+            try:
+                unique_servers = deduplicator.deduplicate_incremental(all_servers, previous[0], state)
+            except ValueError as e:
+                print(f"⚠️  Can't deduplicate incrementally, deduplicating everything: {e}")
+
+    if unique_servers is None:
+        unique_servers = deduplicator.deduplicate_servers(all_servers)
+    deduplicator.state.code_version = code
 
     print(f"✅ Deduplication complete: {len(unique_servers):,} unique servers")
 
@@ -145,7 +164,7 @@ async def run_full_deduplication_pipeline(master_manager: MasterDataManager) ->
 
     # Save master data
     print("\n💾 Saving master data...")
-    master_file = master_manager.save_master_data(unique_servers, categories)
+    master_file = master_manager.save_master_data(unique_servers, categories, deduplicator.state)
 
     # Clean up old master data files
     master_manager.cleanup_old_master_data(keep_count=3)
@@ -181,24 +200,82 @@ async def load_to_neo4j(kg: KnowledgeGraph, neo4j_instance: str, fast_mode: bool
                 neo4j.load_knowledge_graph(kg)
 
         print(f"✅ Successfully loaded {len(kg.servers):,} servers to Neo4j ({neo4j_instance})")
+        verify_neo4j(neo4j_instance)
 
-        # Verify loading
-        print("\n🔍 Verifying data in Neo4j...")
-        with Neo4jManager(instance=neo4j_instance) as neo4j:
-            with neo4j.driver.session() as session:
-                result = session.run("MATCH (s:Server) RETURN count(s) as count")
-                count = result.single()["count"]
-                print(f"   📊 Servers in Neo4j: {count:,}")
+    except Exception as e:
+        print(f"❌ Error loading to Neo4j: {e}")
+        raise
 
-                result = session.run("MATCH (c:Category) RETURN count(c) as count")
-                category_count = result.single()["count"]
-                print(f"   📁 Categories in Neo4j: {category_count}")
+
+async def stream_master_to_neo4j(master: MasterDataReader, neo4j_instance: str, batch_size: int) -> int:
+    """Stream master data into Neo4j batch by batch, without loading it all first
+
+    Returns:
+        Number of servers loaded
+
+    """
+    print(f"\n📤 Streaming master data to Neo4j ({neo4j_instance}, fast mode)...")
+
+    try:
+        with master, Neo4jManager(instance=neo4j_instance) as neo4j:
+            # Clear existing data
+            print("🗑️  Clearing existing Neo4j data...")
+            neo4j.clear_database()
+
+            total_servers = master.metadata().get("total_servers")
+            server_count = neo4j.load_streams_fast(master.servers(), master.categories(),
+                                                   batch_size=batch_size, total_servers=total_servers)
+
+        print(f"✅ Successfully loaded {server_count:,} servers to Neo4j ({neo4j_instance})")
+        verify_neo4j(neo4j_instance)
+        return server_count
 
     except Exception as e:
         print(f"❌ Error loading to Neo4j: {e}")
         raise
 
 
+async def sync_changelog_to_neo4j(master_manager: MasterDataManager, changelog: MasterChangelog,
+                                  neo4j_instance: str, batch_size: int) -> int:
+    """Apply a master data change log to Neo4j, assuming it holds the previous version
+
+    Returns:
+        Number of servers in the synced master data version
+
+    """
+    print(f"\n🔄 Syncing changes since {changelog.from_version} to Neo4j ({neo4j_instance})...")
+    print(f"   • {changelog.summary()}")
+
+    try:
+        with Neo4jManager(instance=neo4j_instance) as neo4j:
+            upserted = neo4j.sync_server_changes(master_manager.iter_changed_servers(changelog),
+                                                 changelog.removed, batch_size=batch_size)
+
+        print(f"✅ Synced {upserted:,} changed and {len(changelog.removed):,} removed servers to Neo4j")
+        verify_neo4j(neo4j_instance)
+
+        with MasterDataReader(master_manager.master_dir / changelog.to_version) as master:
+            return master.metadata().get("total_servers", upserted)
+
+    except Exception as e:
+        print(f"❌ Error syncing to Neo4j: {e}")
+        raise
+
+
+def verify_neo4j(neo4j_instance: str):
+    """Print the server and category counts now in Neo4j"""
+    print("\n🔍 Verifying data in Neo4j...")
+    with Neo4jManager(instance=neo4j_instance) as neo4j:
+        with neo4j.driver.session() as session:
+            result = session.run("MATCH (s:Server) RETURN count(s) as count")
+            count = result.single()["count"]
+            print(f"   📊 Servers in Neo4j: {count:,}")
+
+            result = session.run("MATCH (c:Category) RETURN count(c) as count")
+            category_count = result.single()["count"]
+            print(f"   📁 Categories in Neo4j: {category_count}")
+
+
 async def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description="Smart Neo4j loader with master data support")
@@ -215,12 +292,20 @@ async def main():
                        help="Use fast batch loading for better performance")
     parser.add_argument("--batch-size", type=int, default=500,
                        help="Batch size for fast loading (default: 500)")
+    parser.add_argument("--load-workers", type=int,
+                       help="Processes for decoding registry snapshots (default: CPU count)")
+    parser.add_argument("--dedup-workers", type=int, default=1,
+                       help="Processes for deduplicating independent shards, 0 for CPU count (default: 1)")
 
     # Master data options
     parser.add_argument("--force-rebuild", action="store_true",
-                       help="Force rebuild of master data even if current")
+                       help="Force a full rebuild of master data, ignoring the saved dedup state, even if current")
     parser.add_argument("--status-only", action="store_true",
                        help="Only show master data status, don't load")
+    parser.add_argument("--incremental", action="store_true",
+                       help="Apply only the latest master data change log, for a database holding the previous version")
+    parser.add_argument("--force-load", action="store_true",
+                       help="Load into Neo4j even if it already holds the current master data")
 
     args = parser.parse_args()
 
@@ -236,8 +321,16 @@ async def main():
     # Initialize master data manager
     master_manager = MasterDataManager()
 
+    # Master data is current if the registry contents and dedup code match its last build
+    build_cache = BuildCache(master_manager.data_dir / "build_cache")
+    dedup_key = dedup_stage_key(master_manager)
+    # main.py caches its own dedup output as "dedup:snapshots"; separate stages keep them from evicting each other
+    built = build_cache.get("dedup:master", dedup_key)
+    latest_master = master_manager.latest_master_file()
+    is_current = built is not None and latest_master is not None and built["master_file"] == latest_master.name
+
     # Show status
-    master_manager.print_status()
+    master_manager.print_status(build_current=is_current)
 
     if args.status_only:
         print("\n📊 Status check complete.")
@@ -246,29 +339,57 @@ async def main():
     print()
 
     try:
-        # Check if we can use existing master data
-        is_current, info = master_manager.is_master_data_current()
+        kg = None
+        server_count = None
 
         if is_current and not args.force_rebuild:
-            print("✅ Using current master data (skipping deduplication)")
-            kg = master_manager.create_knowledge_graph_from_master()
-
-            if kg is None:
-                print("❌ Failed to load master data, falling back to full pipeline")
-                kg = await run_full_deduplication_pipeline(master_manager)
+            print("✅ Using current master data (registry data and dedup code unchanged, skipping deduplication)")
         else:
             if args.force_rebuild:
                 print("🔄 Force rebuild requested")
             else:
-                print("⚠️  Master data is outdated or missing")
+                print("⚠️  Registry data or dedup code changed since the last build")
+
+            kg = await run_full_deduplication_pipeline(master_manager, args.load_workers, args.dedup_workers,
+                                                       incremental=not args.force_rebuild)
+            latest_master = master_manager.latest_master_file()
+            build_cache.put("dedup:master", dedup_key, {"master_file": latest_master.name})
 
-            kg = await run_full_deduplication_pipeline(master_manager)
+        # Neo4j is current if it was last loaded from this exact master data with the same loader
+        load_stage = f"load:{neo4j_instance}"
+        load_key = cache_key(file_checksum(latest_master), code_version(Neo4jManager))
+        loaded = None if args.force_load else build_cache.get(load_stage, load_key)
+
+        if loaded is not None:
+            print(f"✅ Neo4j ({neo4j_instance}) already holds this master data, skipping load")
+            server_count = loaded["servers"]
+        else:
+            changelog = master_manager.latest_changelog() if args.incremental else None
+            last_loaded = build_cache.last_output(load_stage)
+            if changelog is not None and (last_loaded or {}).get("master_file") != changelog.from_version:
+                print(f"⚠️  Neo4j wasn't last loaded from {changelog.from_version}, can't apply its change log")
+                changelog = None
+            elif args.incremental and changelog is None:
+                print("⚠️  No change log for the latest master data, loading everything")
+
+            if changelog is not None:
+                server_count = await sync_changelog_to_neo4j(master_manager, changelog, neo4j_instance,
+                                                             args.batch_size)
+            elif kg is None and args.fast:
+                # Batches go straight from the file to Neo4j, keeping memory flat
+                server_count = await stream_master_to_neo4j(master_manager.open_master_data(), neo4j_instance,
+                                                            args.batch_size)
+            else:
+                kg = kg or master_manager.create_knowledge_graph_from_master()
+                if kg is None:
+                    raise ValueError("Failed to load master data, rerun with --force-rebuild")
+                await load_to_neo4j(kg, neo4j_instance, args.fast, args.batch_size)
+                server_count = len(kg.servers)
 
-        # Load to Neo4j
-        await load_to_neo4j(kg, neo4j_instance, args.fast, args.batch_size)
+            build_cache.put(load_stage, load_key, {"master_file": latest_master.name, "servers": server_count})
 
         # Show example queries
-        print(f"\n🔍 Example Neo4j queries for your {len(kg.servers):,} servers:")
+        print(f"\n🔍 Example Neo4j queries for your {server_count:,} servers:")
         print("   MATCH (s:Server) WHERE 'database' IN s.categories RETURN s.name LIMIT 10")
         print("   MATCH (s:Server) RETURN s.registry_source, count(s) ORDER BY count(s) DESC")
         print("   MATCH (s:Server) WHERE s.popularity_score IS NOT NULL RETURN s.name, s.popularity_score ORDER BY s.popularity_score DESC LIMIT 10")
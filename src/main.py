@@ -12,10 +12,23 @@ from datetime import datetime
 from pathlib import Path
 from typing import List
 
+from pydantic import TypeAdapter
+
+import batch_similarity
+import dedup_shards
+import dedup_state
+import deduplication
+import models
+import ngram_index
+import server_record
+from build_cache import BuildCache, cache_key, code_version, snapshot_checksums
 from deduplication import ServerDeduplicator
-from models import KnowledgeGraph, OntologyCategory, ServerCategory
+from models import KnowledgeGraph, MCPServer, OntologyCategory, ServerRelationship
 from neo4j_integration import Neo4jManager, RelationshipInferencer
-from scrapers import RegistrySource, ScrapingOrchestrator
+from scrapers import ConfigManager, RegistrySource, ScrapingOrchestrator
+
+SERVER_LIST = TypeAdapter(list[MCPServer])
+RELATIONSHIP_LIST = TypeAdapter(list[ServerRelationship])
 
 
 def create_ontology_categories() -> list[OntologyCategory]:
@@ -94,8 +107,14 @@ def create_ontology_categories() -> list[OntologyCategory]:
     return categories
 
 
-async def build_knowledge_graph(force_refresh: bool = False, registries: list[str] = None, neo4j_instance: str = "local") -> KnowledgeGraph:
-    """Build the complete knowledge graph"""
+async def build_knowledge_graph(force_refresh: bool = False, registries: list[str] = None, neo4j_instance: str = "local",
+                                concurrent_scraping: bool = True, resume: bool = False,
+                                build_cache: BuildCache | None = None) -> KnowledgeGraph:
+    """Build the complete knowledge graph
+
+    With a ``build_cache``, deduplication and relationship inference are
+    skipped when their inputs and code are unchanged since the last run.
+    """
     pipeline_start = time.time()
     print("🚀 Starting MCP Knowledge Graph construction...")
 
@@ -110,13 +129,10 @@ async def build_knowledge_graph(force_refresh: bool = False, registries: list[st
 
     print(f"📋 Target registries: {[r.value for r in registry_sources]}")
 
-    # Scrape all registries
+    # Scrape all registries (concurrently unless disabled)
     scraping_start = time.time()
-    snapshots = []
-    for registry in registry_sources:
-        snapshot = await orchestrator.scrape_registry(registry, force_refresh)
-        if snapshot:
-            snapshots.append(snapshot)
+    snapshots = await orchestrator.scrape_registries(registry_sources, force_refresh, concurrent=concurrent_scraping,
+                                                     resume=resume)
 
     scraping_time = time.time() - scraping_start
 
@@ -130,17 +146,31 @@ async def build_knowledge_graph(force_refresh: bool = False, registries: list[st
     print(f"   • Scraping time: {scraping_time:.1f}s")
     print(f"   • Rate: {len(all_servers)/scraping_time:.1f} servers/sec")
 
-    # Robust deduplication using multiple criteria
-    print("\n🔧 Starting deduplication process...")
-    dedup_start = time.time()
-    deduplicator = ServerDeduplicator()
-    unique_servers = deduplicator.deduplicate_servers(all_servers)
-    dedup_time = time.time() - dedup_start
+    # Stages are keyed on the checksums of their inputs and the code that produces their output
+    deduplicator = ServerDeduplicator(scoring_backend=orchestrator.config.get("deduplication.scoring_backend", "sequence"),
+                                      workers=orchestrator.config.get("deduplication.workers", 1))
+    dedup_key = cache_key(snapshot_checksums(snapshots), deduplicator.scoring_backend,
+                          code_version(deduplication, models, server_record, ngram_index, batch_similarity, dedup_shards,
+                                       dedup_state))
+    # load_to_neo4j.py records its master data build as "dedup:master" in the same cache
+    unique_servers = build_cache.load_output("dedup:snapshots", dedup_key, SERVER_LIST) if build_cache else None
+
+    if unique_servers is not None:
+        print(f"\n♻️  Registry data unchanged, reusing {len(unique_servers)} deduplicated servers from the build cache")
+    else:
+        # Robust deduplication using multiple criteria
+        print("\n🔧 Starting deduplication process...")
+        dedup_start = time.time()
+        unique_servers = deduplicator.deduplicate_servers(all_servers)
+        dedup_time = time.time() - dedup_start
+
+        duplicates_found = len(all_servers) - len(unique_servers)
+        print(f"   • Duplicates removed: {duplicates_found}")
+        print(f"   • Unique servers: {len(unique_servers)}")
+        print(f"   • Deduplication time: {dedup_time:.1f}s")
 
-    duplicates_found = len(all_servers) - len(unique_servers)
-    print(f"   • Duplicates removed: {duplicates_found}")
-    print(f"   • Unique servers: {len(unique_servers)}")
-    print(f"   • Deduplication time: {dedup_time:.1f}s")
+        if build_cache:
+            build_cache.save_output("dedup:snapshots", dedup_key, SERVER_LIST, unique_servers)
 
     # Create ontology categories
     print("\n📂 Creating ontology categories...")
@@ -148,30 +178,36 @@ async def build_knowledge_graph(force_refresh: bool = False, registries: list[st
 
     # Assign servers to categories
     categorization_start = time.time()
-    for category in categories:
-        category_enum = None
-        try:
-            category_enum = ServerCategory(category.id)
-        except ValueError:
-            continue
+    server_ids_by_category = {}
+    for server in unique_servers:
+        for server_category in dict.fromkeys(server.categories):
+            server_ids_by_category.setdefault(server_category.value, []).append(server.id)
 
-        for server in unique_servers:
-            if category_enum in server.categories:
-                category.servers.append(server.id)
+    for category in categories:
+        category.servers.extend(server_ids_by_category.get(category.id, []))
 
     categorization_time = time.time() - categorization_start
     print(f"   • Categorization time: {categorization_time:.1f}s")
 
-    # Infer relationships between servers
-    print("\n🔗 Inferring relationships between servers...")
-    relationships_start = time.time()
-    with Neo4jManager(instance=neo4j_instance) as neo4j:
-        inferencer = RelationshipInferencer(neo4j)
-        relationships = inferencer.infer_all_relationships(unique_servers)
+    infer_key = cache_key(dedup_key, code_version(RelationshipInferencer))
+    relationships = build_cache.load_output("infer", infer_key, RELATIONSHIP_LIST) if build_cache else None
 
-    relationships_time = time.time() - relationships_start
-    print(f"   • Relationships generated: {len(relationships)}")
-    print(f"   • Relationship inference time: {relationships_time:.1f}s")
+    if relationships is not None:
+        print(f"\n♻️  Reusing {len(relationships)} inferred relationships from the build cache")
+    else:
+        # Infer relationships between servers
+        print("\n🔗 Inferring relationships between servers...")
+        relationships_start = time.time()
+        with Neo4jManager(instance=neo4j_instance) as neo4j:
+            inferencer = RelationshipInferencer(neo4j)
+            relationships = inferencer.infer_all_relationships(unique_servers)
+
+        relationships_time = time.time() - relationships_start
+        print(f"   • Relationships generated: {len(relationships)}")
+        print(f"   • Relationship inference time: {relationships_time:.1f}s")
+
+        if build_cache:
+            build_cache.save_output("infer", infer_key, RELATIONSHIP_LIST, relationships)
 
     # Create knowledge graph
     kg = KnowledgeGraph(
@@ -220,10 +256,7 @@ def print_statistics(kg: KnowledgeGraph):
 
     # Category breakdown
     print("\n📊 Servers by Category:")
-    category_counts = {}
-    for server in kg.servers:
-        for category in server.categories:
-            category_counts[category.value] = category_counts.get(category.value, 0) + 1
+    category_counts = {category.value: count for category, count in kg.category_counts().items()}
 
     for category, count in sorted(category_counts.items(), key=lambda x: x[1], reverse=True):
         print(f"  {category}: {count}")
@@ -264,6 +297,12 @@ async def main():
                        help="Clear Neo4j database before loading")
     parser.add_argument("--stats-only", action="store_true",
                        help="Only show statistics, don't scrape or load")
+    parser.add_argument("--sequential-scraping", action="store_true",
+                       help="Scrape registries one after another instead of concurrently")
+    parser.add_argument("--resume", action="store_true",
+                       help="Continue interrupted scrapes from their checkpoint journals")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Rerun deduplication, inference and loading even if their inputs are unchanged")
 
     # Neo4j instance selection
     neo4j_group = parser.add_mutually_exclusive_group()
@@ -291,11 +330,18 @@ async def main():
             print("Stats-only mode not yet implemented")
             return
 
+        build_cache = None
+        if not args.no_cache:
+            build_cache = BuildCache(ConfigManager().get("storage.build_cache_path", "./data/build_cache"))
+
         # Build knowledge graph
         kg = await build_knowledge_graph(
             force_refresh=args.force_refresh,
             registries=args.registries,
             neo4j_instance=neo4j_instance,
+            concurrent_scraping=not args.sequential_scraping,
+            resume=args.resume,
+            build_cache=build_cache,
         )
 
         # Print statistics
@@ -303,12 +349,22 @@ async def main():
 
         # Load into Neo4j
         if not args.skip_neo4j:
+            load_stage = f"load:{neo4j_instance}"
+            load_key = None
+            if build_cache:
+                load_key = cache_key(build_cache.key_of("infer"), code_version(create_ontology_categories, Neo4jManager))
+
             if args.clear_neo4j:
                 print(f"🗑️  Clearing Neo4j database ({neo4j_instance})...")
                 with Neo4jManager(instance=neo4j_instance) as neo4j:
                     neo4j.clear_database()
 
-            await load_to_neo4j(kg, neo4j_instance, fast_mode=args.fast, batch_size=args.batch_size)
+            if build_cache and not args.clear_neo4j and build_cache.get(load_stage, load_key) is not None:
+                print(f"\n♻️  Neo4j ({neo4j_instance}) already holds this knowledge graph, skipping load")
+            else:
+                await load_to_neo4j(kg, neo4j_instance, fast_mode=args.fast, batch_size=args.batch_size)
+                if build_cache:
+                    build_cache.put(load_stage, load_key, {"servers": len(kg.servers)})
 
             # Show some example queries
             print("\n🔍 Example Neo4j queries you can run:")
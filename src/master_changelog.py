@@ -0,0 +1,122 @@
+"""Change logs between consecutive master data versions.
+
+Each master data file is a full copy of the deduplicated servers, which on
+its own says nothing about what changed since the previous run. Alongside
+each version a change log records the servers that were added or removed, and
+for every modified server the old and new value of each changed field.
+Consumers that already hold the previous version, such as Neo4j, can apply
+just the delta. Any version can be rebuilt by replaying change logs over an
+earlier one.
+"""
+
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+from models import MCPServer
+
+
+class FieldChange(BaseModel):
+    old: Any = None
+    new: Any = None
+
+
+class MasterChangelog(BaseModel):
+    from_version: str  # Master data file the changes apply to
+    to_version: str  # Master data file they produce
+    created_at: datetime
+    added: list[dict[str, Any]] = []  # Full records of new servers
+    removed: list[str] = []  # Server IDs
+    modified: dict[str, dict[str, FieldChange]] = {}  # Server ID -> field -> change
+
+    @property
+    def changed_ids(self) -> set[str]:
+        """IDs of servers that were added or modified"""
+        return {record["id"] for record in self.added} | self.modified.keys()
+
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.modified)
+
+    def summary(self) -> str:
+        return f"+{len(self.added):,} added, -{len(self.removed):,} removed, ~{len(self.modified):,} modified"
+
+
+def server_record(server: MCPServer) -> dict[str, Any]:
+    """A server as the JSON-compatible dict stored in master data and change logs"""
+    return server.model_dump(mode="json")
+
+
+def diff_records(old: dict[str, Any], new: dict[str, Any]) -> dict[str, FieldChange]:
+    """Field-level differences between two server records"""
+    return {
+        field: FieldChange(old=old.get(field), new=new.get(field))
+        for field in dict.fromkeys([*old, *new])
+        if old.get(field) != new.get(field)
+    }
+
+
+def diff_master_data(old_records: dict[str, dict[str, Any]], new_records: Iterable[dict[str, Any]],
+                     from_version: str, to_version: str) -> MasterChangelog:
+    """Compare two versions given as server records, the old ones keyed by ID
+
+    ``old_records`` is consumed: entries are removed as they are matched.
+    """
+    added = []
+    modified = {}
+    for record in new_records:
+        old = old_records.pop(record["id"], None)
+        if old is None:
+            added.append(record)
+        elif old != record:
+            modified[record["id"]] = diff_records(old, record)
+
+    return MasterChangelog(
+        from_version=from_version,
+        to_version=to_version,
+        created_at=datetime.now(),
+        added=added,
+        removed=list(old_records),
+        modified=modified,
+    )
+
+
+def apply_changelog(servers: Iterable[MCPServer], changelog: MasterChangelog) -> list[MCPServer]:
+    """Apply a change log to the servers of its ``from_version``
+
+    Unchanged servers are passed through as they are; added servers come last.
+    """
+    removed = set(changelog.removed)
+    result = {}
+    for server in servers:
+        if server.id in removed:
+            continue
+        changes = changelog.modified.get(server.id)
+        if changes:
+            record = server_record(server)
+            record.update({field: change.new for field, change in changes.items()})
+            server = MCPServer.model_validate(record)
+        result[server.id] = server
+
+    for record in changelog.added:
+        result[record["id"]] = MCPServer.model_validate(record)
+
+    return list(result.values())
+
+
+def replay_changelogs(servers: Iterable[MCPServer], changelogs: Iterable[MasterChangelog]) -> list[MCPServer]:
+    """Apply consecutive change logs in order
+
+    Raises ValueError if a change log doesn't start from the version the
+    previous one produced.
+    """
+    servers = list(servers)
+    previous = None
+    for changelog in changelogs:
+        if previous is not None and changelog.from_version != previous.to_version:
+            raise ValueError(f"Change log for {changelog.to_version} starts from {changelog.from_version}, "
+                             f"not {previous.to_version}")
+        servers = apply_changelog(servers, changelog)
+        previous = changelog
+    return servers
@@ -8,11 +8,194 @@ timestamp checking to avoid unnecessary reprocessing.
 import json
 import os
 import time
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from pydantic import BaseModel
+
+from dedup_state import DedupState
+from master_changelog import MasterChangelog, diff_master_data, server_record
 from models import KnowledgeGraph, MCPServer, OntologyCategory
+from snapshot_io import latest_snapshot_entry, paused_gc
+
+
+# Read size for streaming master data; memory use is bounded by this plus the largest single record
+STREAM_CHUNK_SIZE = 1 << 20
+
+
+class _JSONObjectStream:
+    """Incremental reader for a JSON document whose top level is an object.
+
+    Values are decoded one at a time with ``JSONDecoder.raw_decode`` from a
+    buffer refilled in ``chunk_size`` reads, and array values can be walked
+    item by item, so only one record of the document is in memory at once.
+    """
+
+    def __init__(self, f, chunk_size: int = STREAM_CHUNK_SIZE):
+        self._f = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Read another chunk, dropping what has been consumed."""
+        if self._eof:
+            return False
+        chunk = self._f.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Next non-whitespace character, or "" at the end of the input."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if not char or char not in chars:
+            raise ValueError(f"Expected one of {chars!r} in master data, found {char!r}")
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next complete value."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # The value runs on into the next chunk
+                if self._fill():
+                    continue
+                raise
+            # A number could continue past the end of the buffer
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def keys(self) -> Iterator[str]:
+        """Top-level keys in order. Consume each value before asking for the next key."""
+        self._expect("{")
+        if self._peek() == "}":
+            return
+        while True:
+            key = self.value()
+            self._expect(":")
+            yield key
+            if self._expect(",}") == "}":
+                return
+
+    def items(self) -> Iterator[Any]:
+        """Items of the array that is the next value, one at a time."""
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self._expect(",]") == "]":
+                return
+
+    def skip(self):
+        """Step over the next value without holding all of it in memory."""
+        if self._peek() == "[":
+            for _ in self.items():
+                pass
+        else:
+            self.value()
+
+
+class MasterDataReader:
+    """Streams a master data file one server or category at a time.
+
+    This is the bounded-memory alternative to ``load_master_data``: only the
+    current read buffer and the record being handed out are held, whatever
+    the size of the file. Sections are read in file order (metadata, servers,
+    categories); going back to an earlier section reopens the file.
+    """
+
+    def __init__(self, path: Path, chunk_size: int = STREAM_CHUNK_SIZE):
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self._file = None
+        self._stream = None
+        self._keys = None
+        self._seen: set[str] = set()
+        self._metadata: dict[str, Any] | None = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def _open(self):
+        self.close()
+        self._file = open(self.path)
+        self._stream = _JSONObjectStream(self._file, self.chunk_size)
+        self._keys = self._stream.keys()
+        self._seen = set()
+
+    def _seek(self, section: str) -> bool:
+        """Position the stream at the value of ``section``; False if the file has none."""
+        if self._stream is None or section in self._seen:
+            self._open()
+        for key in self._keys:
+            self._seen.add(key)
+            if key == section:
+                return True
+            if key == "metadata":
+                self._metadata = self._stream.value()
+            else:
+                self._stream.skip()
+        return False
+
+    def metadata(self) -> dict[str, Any]:
+        """The file's metadata block (creation time, totals)."""
+        if self._metadata is None:
+            self._metadata = self._stream.value() if self._seek("metadata") else {}
+        return self._metadata
+
+    def _iter_section(self, section: str, model: type[BaseModel]) -> Iterator[BaseModel]:
+        if not self._seek(section):
+            return
+        finished = False
+        try:
+            for data in self._stream.items():
+                try:
+                    yield model(**data)
+                except Exception as e:
+                    print(f"   ⚠️  Skipped invalid {model.__name__}: {e}")
+            finished = True
+        finally:
+            if not finished:
+                # Abandoned mid-array; start from the top next time
+                self._stream = None
+
+    def servers(self) -> Iterator[MCPServer]:
+        return self._iter_section("servers", MCPServer)
+
+    def categories(self) -> Iterator[OntologyCategory]:
+        return self._iter_section("categories", OntologyCategory)
 
 
 class MasterDataManager:
@@ -21,6 +204,8 @@ class MasterDataManager:
     def __init__(self, data_dir: str = "data"):
         self.data_dir = Path(data_dir)
         self.master_dir = self.data_dir / "master"
+        self.changelog_dir = self.master_dir / "changelogs"
+        self.dedup_state_dir = self.master_dir / "dedup_state"
         self.registries_dir = self.data_dir / "registries"
 
         # Ensure master directory exists
@@ -34,13 +219,11 @@ class MasterDataManager:
             if not registry_dir.is_dir():
                 continue
 
-            registry_name = registry_dir.name
-            json_files = list(registry_dir.glob("*.json"))
+            # Read from the registry manifest, without touching the snapshots
+            latest = latest_snapshot_entry(registry_dir)
 
-            if json_files:
-                # Get the most recent file
-                latest_file = max(json_files, key=lambda f: f.stat().st_mtime)
-                timestamps[registry_name] = latest_file.stat().st_mtime
+            if latest:
+                timestamps[registry_dir.name] = latest["written_at"]
 
         return timestamps
 
@@ -90,9 +273,13 @@ class MasterDataManager:
 
         return is_current, info
 
-    def save_master_data(self, servers: list[MCPServer], categories: list[OntologyCategory]) -> str:
+    def save_master_data(self, servers: list[MCPServer], categories: list[OntologyCategory],
+                         dedup_state: DedupState | None = None) -> str:
         """Save deduplicated servers and categories as master data
-        
+
+        A change log against the previous version is saved alongside it, and
+        ``dedup_state`` if given, for deduplicating the next snapshot incrementally.
+
         Returns:
             Path to the saved master data file
 
@@ -101,6 +288,12 @@ class MasterDataManager:
         filename = f"deduplicated_servers_{timestamp}.json"
         filepath = self.master_dir / filename
 
+        # Read the previous version before a save within the same second overwrites it
+        previous_master = self.latest_master_file()
+        previous_records = self._read_server_records(previous_master) if previous_master else None
+
+        records = [server_record(server) for server in servers]
+
         # Prepare data for serialization
         data = {
             "metadata": {
@@ -109,7 +302,7 @@ class MasterDataManager:
                 "total_categories": len(categories),
                 "version": "1.0",
             },
-            "servers": [server.dict() for server in servers],
+            "servers": records,
             "categories": [category.dict() for category in categories],
         }
 
@@ -120,9 +313,120 @@ class MasterDataManager:
         with open(filepath, "w") as f:
             json.dump(data, f, indent=2, default=str)
 
+        if previous_records is not None and previous_master.name != filename:
+            changelog = diff_master_data(previous_records, records, previous_master.name, filename)
+            self.save_changelog(changelog)
+            print(f"   • Changes since {previous_master.name}: {changelog.summary()}")
+
+        if dedup_state is not None:
+            self.save_dedup_state(dedup_state, filename)
+        else:
+            # A state left by an earlier save within the same second no longer matches
+            self._dedup_state_path(filename).unlink(missing_ok=True)
+
         print("✅ Master data saved successfully")
         return str(filepath)
 
+    def _read_server_records(self, path: Path) -> dict[str, dict[str, Any]] | None:
+        """Server records of a master data file keyed by ID, or None if it can't be read"""
+        try:
+            with paused_gc(), MasterDataReader(path) as master:
+                return {server.id: server_record(server) for server in master.servers()}
+        except Exception as e:
+            print(f"   ⚠️  Could not read previous master data for the change log: {e}")
+            return None
+
+    def _changelog_path(self, version: str) -> Path:
+        return self.changelog_dir / version.replace("deduplicated_servers_", "changes_")
+
+    def save_changelog(self, changelog: MasterChangelog) -> Path:
+        """Save the change log that produces ``changelog.to_version``"""
+        self.changelog_dir.mkdir(exist_ok=True)
+        path = self._changelog_path(changelog.to_version)
+        path.write_text(changelog.model_dump_json())
+        return path
+
+    def load_changelog(self, version: str) -> MasterChangelog | None:
+        """The change log that produced a master data version, if there is one"""
+        path = self._changelog_path(version)
+        if not path.exists():
+            return None
+        return MasterChangelog.model_validate_json(path.read_bytes())
+
+    def latest_changelog(self) -> MasterChangelog | None:
+        """The change log that produced the latest master data, if there is one"""
+        latest_master = self.latest_master_file()
+        return self.load_changelog(latest_master.name) if latest_master else None
+
+    def load_changelogs(self, since_version: str | None = None) -> list[MasterChangelog]:
+        """Change logs in version order, starting after ``since_version`` if given
+
+        Raises ValueError if no change log starts from ``since_version``.
+        """
+        changelogs = sorted(
+            (MasterChangelog.model_validate_json(path.read_bytes())
+             for path in self.changelog_dir.glob("changes_*.json")),
+            key=lambda changelog: changelog.to_version,
+        )
+        if since_version is None:
+            return changelogs
+
+        for i, changelog in enumerate(changelogs):
+            if changelog.from_version == since_version:
+                return changelogs[i:]
+        latest_master = self.latest_master_file()
+        if latest_master and latest_master.name == since_version:
+            return []
+        raise ValueError(f"No change logs start from {since_version}")
+
+    def iter_changed_servers(self, changelog: MasterChangelog) -> Iterator[MCPServer]:
+        """Stream the servers a change log added or modified from its master data file"""
+        changed_ids = changelog.changed_ids
+        with MasterDataReader(self.master_dir / changelog.to_version) as master:
+            for server in master.servers():
+                if server.id in changed_ids:
+                    yield server
+
+    def _dedup_state_path(self, version: str) -> Path:
+        return self.dedup_state_dir / version.replace("deduplicated_servers_", "dedup_state_")
+
+    def save_dedup_state(self, state: DedupState, version: str) -> Path:
+        """Save the dedup state that produced a master data version"""
+        self.dedup_state_dir.mkdir(exist_ok=True)
+        path = self._dedup_state_path(version)
+        path.write_text(state.model_dump_json())
+        return path
+
+    def load_dedup_state(self, version: str | None = None) -> DedupState | None:
+        """The dedup state that produced a master data version (the latest by default), if it was saved"""
+        if version is None:
+            latest_master = self.latest_master_file()
+            if latest_master is None:
+                return None
+            version = latest_master.name
+        path = self._dedup_state_path(version)
+        if not path.exists():
+            return None
+        return DedupState.model_validate_json(path.read_bytes())
+
+    def latest_master_file(self) -> Path | None:
+        """The most recent master data file, if any"""
+        master_files = list(self.master_dir.glob("deduplicated_servers_*.json"))
+        return max(master_files, key=lambda f: f.stat().st_mtime) if master_files else None
+
+    def open_master_data(self, chunk_size: int = STREAM_CHUNK_SIZE) -> MasterDataReader | None:
+        """Stream the latest master data instead of loading it all at once
+
+        Returns:
+            A MasterDataReader (use it as a context manager) or None if no master data exists
+
+        """
+        latest_master = self.latest_master_file()
+        if latest_master is None:
+            return None
+        print(f"📂 Streaming master data from: {latest_master.name}")
+        return MasterDataReader(latest_master, chunk_size)
+
     def load_master_data(self) -> tuple[list[MCPServer], list[OntologyCategory]] | None:
         """Load the latest master data
         
@@ -130,28 +434,27 @@ class MasterDataManager:
             (servers, categories) tuple or None if no master data exists
 
         """
-        master_files = list(self.master_dir.glob("deduplicated_servers_*.json"))
+        latest_master = self.latest_master_file()
 
-        if not master_files:
+        if latest_master is None:
             return None
 
-        # Get the most recent master data file
-        latest_master = max(master_files, key=lambda f: f.stat().st_mtime)
-
         print(f"📂 Loading master data from: {latest_master.name}")
 
         try:
-            with open(latest_master) as f:
-                data = json.load(f)
-
-            # Load servers
-            servers = []
-            for server_data in data.get("servers", []):
-                try:
-                    server = MCPServer(**server_data)
-                    servers.append(server)
-                except Exception as e:
-                    print(f"   ⚠️  Skipped invalid server: {e}")
+            # Collection passes during the load would cost more than the load itself
+            with paused_gc():
+                with open(latest_master) as f:
+                    data = json.load(f)
+
+                # Load servers
+                servers = []
+                for server_data in data.get("servers", []):
+                    try:
+                        server = MCPServer(**server_data)
+                        servers.append(server)
+                    except Exception as e:
+                        print(f"   ⚠️  Skipped invalid server: {e}")
 
             # Load categories
             categories = []
@@ -214,12 +517,23 @@ class MasterDataManager:
         for file_path in files_to_remove:
             print(f"   • Removing: {file_path.name}")
             file_path.unlink()
+            # Its change log only applies on top of an even older version
+            self._changelog_path(file_path.name).unlink(missing_ok=True)
+            self._dedup_state_path(file_path.name).unlink(missing_ok=True)
 
         print(f"✅ Cleanup complete, kept {keep_count} most recent files")
 
-    def print_status(self):
-        """Print detailed status of master data vs registry data"""
+    def print_status(self, build_current: bool | None = None):
+        """Print detailed status of master data vs registry data
+
+        ``build_current``, when given, is the build cache's verdict on whether
+        the master data matches the registry contents; it replaces the
+        timestamp comparison.
+        """
         is_current, info = self.is_master_data_current()
+        if build_current is not None:
+            is_current = build_current
+            info["status"] = "current" if is_current else "outdated"
 
         print("📊 Master Data Status:")
         print(f"   • Master data exists: {info['master_exists']}")
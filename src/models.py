@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, HttpUrl, validator
+from pydantic import BaseModel, HttpUrl, PrivateAttr, validator
 
 
 class ServerCategory(str, Enum):
@@ -91,6 +91,8 @@ class MCPServer(BaseModel):
 
     # Raw data for reference
     raw_metadata: dict[str, Any] | None = None
+    # Hash of the registry payload in the BlobStore when it isn't kept inline
+    raw_metadata_ref: str | None = None
 
 
 class RelationshipType(str, Enum):
@@ -147,6 +149,15 @@ class RegistrySnapshot(BaseModel):
 
 
 class KnowledgeGraph(BaseModel):
+    """Servers, relationships and categories with indexed lookups
+
+    The indexes follow appends to ``servers`` and ``relationships`` and a
+    reassignment of either list. Add servers and relationships with
+    ``add_server`` / ``add_relationship`` or by appending. After editing
+    the lists in place any other way (replacing or removing items, changing
+    a server's ID or categories), call ``reindex``.
+    """
+
     created_at: datetime
     last_updated: datetime
     servers: list[MCPServer]
@@ -154,12 +165,70 @@ class KnowledgeGraph(BaseModel):
     categories: list[OntologyCategory]
     registry_snapshots: list[RegistrySnapshot]
 
+    # Lookup indexes over servers and relationships, extended as they are added
+    _servers_by_id: dict[str, MCPServer] = PrivateAttr(default_factory=dict)
+    _servers_by_category: dict[ServerCategory, list[MCPServer]] = PrivateAttr(default_factory=dict)
+    _relationships_by_server: dict[str, list[ServerRelationship]] = PrivateAttr(default_factory=dict)
+    # The list objects the indexes were built from; ids alone could be reused by a new list
+    _indexed_lists: tuple[list, list] | None = PrivateAttr(default=None)
+    _indexed_servers: int = PrivateAttr(default=0)
+    _indexed_relationships: int = PrivateAttr(default=0)
+
+    def model_post_init(self, __context: Any):
+        self._update_indexes()
+
+    def _update_indexes(self):
+        """Index servers and relationships appended since the last call."""
+        indexed = self._indexed_lists
+        if (indexed is None or indexed[0] is not self.servers or indexed[1] is not self.relationships
+                or self._indexed_servers > len(self.servers)
+                or self._indexed_relationships > len(self.relationships)):
+            # The lists were replaced or shrunk; start over
+            self.reindex()
+            return
+
+        for server in self.servers[self._indexed_servers:]:
+            self._servers_by_id.setdefault(server.id, server)
+            for category in dict.fromkeys(server.categories):
+                self._servers_by_category.setdefault(category, []).append(server)
+        self._indexed_servers = len(self.servers)
+
+        for relationship in self.relationships[self._indexed_relationships:]:
+            self._relationships_by_server.setdefault(relationship.source_server_id, []).append(relationship)
+            if relationship.target_server_id != relationship.source_server_id:
+                self._relationships_by_server.setdefault(relationship.target_server_id, []).append(relationship)
+        self._indexed_relationships = len(self.relationships)
+
+    def reindex(self):
+        """Rebuild the indexes from scratch, e.g. after editing the lists in place"""
+        self._servers_by_id.clear()
+        self._servers_by_category.clear()
+        self._relationships_by_server.clear()
+        self._indexed_lists = (self.servers, self.relationships)
+        self._indexed_servers = self._indexed_relationships = 0
+        self._update_indexes()
+
+    def add_server(self, server: MCPServer):
+        self.servers.append(server)
+        self._update_indexes()
+
+    def add_relationship(self, relationship: ServerRelationship):
+        self.relationships.append(relationship)
+        self._update_indexes()
+
     def get_server_by_id(self, server_id: str) -> MCPServer | None:
-        return next((s for s in self.servers if s.id == server_id), None)
+        self._update_indexes()
+        return self._servers_by_id.get(server_id)
 
     def get_servers_by_category(self, category: ServerCategory) -> list[MCPServer]:
-        return [s for s in self.servers if category in s.categories]
+        self._update_indexes()
+        return list(self._servers_by_category.get(category, []))
 
     def get_relationships_for_server(self, server_id: str) -> list[ServerRelationship]:
-        return [r for r in self.relationships
-                if r.source_server_id == server_id or r.target_server_id == server_id]
+        self._update_indexes()
+        return list(self._relationships_by_server.get(server_id, []))
+
+    def category_counts(self) -> dict[ServerCategory, int]:
+        """Number of servers in each category that has any."""
+        self._update_indexes()
+        return {category: len(servers) for category, servers in self._servers_by_category.items()}
@@ -1,5 +1,7 @@
 import time
+from collections.abc import Iterable
 from datetime import datetime
+from itertools import islice
 from typing import Any, Dict, List, Optional
 
 import yaml
@@ -15,6 +17,7 @@ from models import (
     ServerCategory,
     ServerRelationship,
 )
+from server_record import CATEGORY_BITS, OPERATION_BITS, ServerRecord, mask_members
 
 
 class Neo4jManager:
@@ -121,10 +124,24 @@ class Neo4jManager:
 
     def load_knowledge_graph_fast(self, kg: KnowledgeGraph, batch_size: int = 500) -> None:
         """Load knowledge graph using batch processing for better performance"""
+        self.load_streams_fast(kg.servers, kg.categories, kg.relationships, batch_size=batch_size,
+                               total_servers=len(kg.servers))
+
+    def load_streams_fast(self, servers: Iterable[MCPServer], categories: Iterable[OntologyCategory],
+                          relationships: list[ServerRelationship] | None = None, batch_size: int = 500,
+                          total_servers: int | None = None) -> int:
+        """Batch load servers, then categories and relationships, from iterables
+
+        Servers are pulled from ``servers`` one batch at a time, so a streamed
+        source (e.g. ``MasterDataReader.servers()``) is never held in memory
+        all at once. Returns the number of servers loaded.
+        """
         start_time = time.time()
 
-        total_items = len(kg.servers) + len(kg.categories) + len(kg.relationships)
-        print(f"⚡ Fast loading knowledge graph: {total_items:,} total items")
+        if total_servers is not None:
+            print(f"⚡ Fast loading knowledge graph: {total_servers:,} servers")
+        else:
+            print("⚡ Fast loading knowledge graph")
         print(f"📦 Batch size: {batch_size}")
         print(f"🎯 Target Neo4j instance: {self.instance}")
         print()
@@ -136,44 +153,49 @@ class Neo4jManager:
         print()
 
         # Step 2: Batch load servers
-        if kg.servers:
-            print(f"⚡ Batch loading {len(kg.servers):,} servers...")
-
-            batches = [kg.servers[i:i + batch_size] for i in range(0, len(kg.servers), batch_size)]
-
-            progress_bar = tqdm(
-                batches,
-                desc="📥 Server Batches",
-                unit="batch",
-                colour="blue",
-                bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} batches [{elapsed}<{remaining}, {rate_fmt}]",
-            )
-
-            for batch in progress_bar:
-                progress_bar.set_postfix_str(f"Processing {len(batch)} servers")
-                self.create_servers_batch(batch)
+        print("⚡ Batch loading servers...")
+        total_batches = -(-total_servers // batch_size) if total_servers is not None else None
+        progress_bar = tqdm(
+            total=total_batches,
+            desc="📥 Server Batches",
+            unit="batch",
+            colour="blue",
+            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} batches [{elapsed}<{remaining}, {rate_fmt}]",
+        )
 
-            progress_bar.close()
-            print(f"   ✅ {len(kg.servers):,} servers loaded in {len(batches)} batches")
-            print()
+        server_count = 0
+        batch_count = 0
+        server_iter = iter(servers)
+        while batch := list(islice(server_iter, batch_size)):
+            progress_bar.set_postfix_str(f"Processing {len(batch)} servers")
+            self.create_servers_batch(batch)
+            server_count += len(batch)
+            batch_count += 1
+            progress_bar.update(1)
+
+        progress_bar.close()
+        print(f"   ✅ {server_count:,} servers loaded in {batch_count} batches")
+        print()
 
         # Categories and relationships use regular loading since they're typically smaller
-        if kg.categories:
-            print(f"📂 Loading {len(kg.categories)} categories...")
-            for category in tqdm(kg.categories, desc="📁 Categories", colour="green"):
-                self.create_category_nodes([category])
-            print(f"   ✅ {len(kg.categories)} categories loaded")
-            print()
+        category_count = 0
+        print("📂 Loading categories...")
+        for category in tqdm(categories, desc="📁 Categories", colour="green"):
+            self.create_category_nodes([category])
+            category_count += 1
+        print(f"   ✅ {category_count} categories loaded")
+        print()
 
-        if kg.relationships:
-            print(f"🔗 Loading {len(kg.relationships):,} relationships...")
-            for relationship in tqdm(kg.relationships, desc="🔗 Relationships", colour="yellow"):
+        if relationships:
+            print(f"🔗 Loading {len(relationships):,} relationships...")
+            for relationship in tqdm(relationships, desc="🔗 Relationships", colour="yellow"):
                 self.create_relationship(relationship)
-            print(f"   ✅ {len(kg.relationships):,} relationships loaded")
+            print(f"   ✅ {len(relationships):,} relationships loaded")
             print()
 
         # Final summary
         elapsed_time = time.time() - start_time
+        total_items = server_count + category_count + len(relationships or [])
         rate = total_items / elapsed_time if elapsed_time > 0 else 0
 
         print("=" * 60)
@@ -183,6 +205,51 @@ class Neo4jManager:
         print(f"🎯 Instance: {self.instance}")
         print("=" * 60)
 
+        return server_count
+
+    def sync_server_changes(self, changed_servers: Iterable[MCPServer], removed_ids: list[str],
+                            batch_size: int = 500) -> int:
+        """Bring a database holding one master data version up to the next
+
+        Only the servers in a change log are touched: ``changed_servers`` (added
+        or modified) are upserted with their category links recreated, and
+        ``removed_ids`` are deleted. Returns the number of servers upserted.
+        """
+        with self.driver.session() as session:
+            for start in range(0, len(removed_ids), batch_size):
+                session.run("""
+                UNWIND $ids as id
+                MATCH (s:Server {id: id})
+                DETACH DELETE s
+                """, {"ids": removed_ids[start:start + batch_size]})
+
+        server_count = 0
+        server_iter = iter(changed_servers)
+        while batch := list(islice(server_iter, batch_size)):
+            self.create_servers_batch(batch)
+            self.link_server_categories(batch)
+            server_count += len(batch)
+
+        return server_count
+
+    def link_server_categories(self, servers: list[MCPServer]) -> None:
+        """Replace the category links of the given servers with their current categories"""
+        cypher = """
+        UNWIND $servers as server
+        MATCH (s:Server {id: server.id})
+        OPTIONAL MATCH (s)-[old:BELONGS_TO_CATEGORY]->(:Category)
+        DELETE old
+        WITH DISTINCT s, server
+        UNWIND server.categories as category_id
+        MATCH (c:Category {id: category_id})
+        MERGE (s)-[:BELONGS_TO_CATEGORY]->(c)
+        """
+
+        server_data = [{"id": server.id, "categories": [cat.value for cat in server.categories]} for server in servers]
+
+        with self.driver.session() as session:
+            session.run(cypher, {"servers": server_data})
+
     def create_servers_batch(self, servers: list[MCPServer]) -> None:
         """Create server nodes in a single batch operation"""
         if not servers:
@@ -558,73 +625,80 @@ class RelationshipInferencer:
     def infer_all_relationships(self, servers: list[MCPServer]) -> list[ServerRelationship]:
         """Infer relationships between all servers"""
         relationships = []
+        records = [ServerRecord(server) for server in servers]
 
-        for i, server1 in enumerate(servers):
-            for server2 in servers[i+1:]:
-                rels = self.infer_relationships(server1, server2)
-                relationships.extend(rels)
+        for i, record1 in enumerate(records):
+            for record2 in records[i+1:]:
+                # Every relationship needs a shared author, category or two operations
+                if (record1.category_mask & record2.category_mask
+                        or (record1.author is not None and record1.author == record2.author)
+                        or (record1.operation_mask & record2.operation_mask).bit_count() >= 2):
+                    relationships.extend(self._infer_record_relationships(record1, record2))
 
         return relationships
 
     def infer_relationships(self, server1: MCPServer, server2: MCPServer) -> list[ServerRelationship]:
         """Infer relationships between two servers"""
+        return self._infer_record_relationships(ServerRecord(server1), ServerRecord(server2))
+
+    def _infer_record_relationships(self, record1: ServerRecord, record2: ServerRecord) -> list[ServerRelationship]:
         relationships = []
 
         # Same author relationship
-        if server1.author and server2.author and server1.author == server2.author:
+        if record1.author is not None and record1.author == record2.author:
             relationships.append(ServerRelationship(
-                id=f"{server1.id}_same_author_{server2.id}",
-                source_server_id=server1.id,
-                target_server_id=server2.id,
+                id=f"{record1.id}_same_author_{record2.id}",
+                source_server_id=record1.id,
+                target_server_id=record2.id,
                 relationship_type=RelationshipType.SAME_AUTHOR,
                 confidence_score=1.0,
-                description=f"Both servers created by {server1.author}",
-                evidence=[f"Author: {server1.author}"],
+                description=f"Both servers created by {record1.author}",
+                evidence=[f"Author: {record1.author}"],
                 created_at=datetime.now(),
             ))
 
         # Category similarity
-        common_categories = set(server1.categories) & set(server2.categories)
+        common_categories = record1.category_mask & record2.category_mask
         if common_categories:
-            confidence = len(common_categories) / max(len(server1.categories), len(server2.categories))
+            common_count = common_categories.bit_count()
+            confidence = common_count / max(record1.category_count, record2.category_count)
             relationships.append(ServerRelationship(
-                id=f"{server1.id}_similar_{server2.id}",
-                source_server_id=server1.id,
-                target_server_id=server2.id,
+                id=f"{record1.id}_similar_{record2.id}",
+                source_server_id=record1.id,
+                target_server_id=record2.id,
                 relationship_type=RelationshipType.SIMILAR_FUNCTIONALITY,
                 confidence_score=confidence,
-                description=f"Share {len(common_categories)} common categories",
-                evidence=[f"Common categories: {', '.join(cat.value for cat in common_categories)}"],
+                description=f"Share {common_count} common categories",
+                evidence=[f"Common categories: {', '.join(cat.value for cat in mask_members(common_categories, CATEGORY_BITS))}"],
                 created_at=datetime.now(),
             ))
 
         # Operation similarity
-        common_operations = set(server1.operations) & set(server2.operations)
-        if common_operations and len(common_operations) >= 2:
-            confidence = len(common_operations) / max(len(server1.operations), len(server2.operations))
+        common_operations = record1.operation_mask & record2.operation_mask
+        common_count = common_operations.bit_count()
+        if common_count >= 2:
+            confidence = common_count / max(record1.operation_count, record2.operation_count)
             relationships.append(ServerRelationship(
-                id=f"{server1.id}_complementary_{server2.id}",
-                source_server_id=server1.id,
-                target_server_id=server2.id,
+                id=f"{record1.id}_complementary_{record2.id}",
+                source_server_id=record1.id,
+                target_server_id=record2.id,
                 relationship_type=RelationshipType.COMPLEMENTARY,
                 confidence_score=confidence * 0.8,  # Lower confidence than categories
-                description=f"Share {len(common_operations)} common operations",
-                evidence=[f"Common operations: {', '.join(op.value for op in common_operations)}"],
+                description=f"Share {common_count} common operations",
+                evidence=[f"Common operations: {', '.join(op.value for op in mask_members(common_operations, OPERATION_BITS))}"],
                 created_at=datetime.now(),
             ))
 
         # Language similarity (potential alternatives)
-        if (server1.implementation_language and server2.implementation_language and
-            server1.implementation_language == server2.implementation_language and
-            common_categories):
+        if record1.language is not None and record1.language == record2.language and common_categories:
             relationships.append(ServerRelationship(
-                id=f"{server1.id}_alternative_{server2.id}",
-                source_server_id=server1.id,
-                target_server_id=server2.id,
+                id=f"{record1.id}_alternative_{record2.id}",
+                source_server_id=record1.id,
+                target_server_id=record2.id,
                 relationship_type=RelationshipType.ALTERNATIVE_TO,
                 confidence_score=0.6,
-                description=f"Alternative implementations in {server1.implementation_language}",
-                evidence=[f"Same language: {server1.implementation_language}", "Similar categories"],
+                description=f"Alternative implementations in {record1.language}",
+                evidence=[f"Same language: {record1.language}", "Similar categories"],
                 created_at=datetime.now(),
             ))
 
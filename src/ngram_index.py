@@ -0,0 +1,119 @@
+"""Candidate index for fuzzy name matching.
+
+``SequenceMatcher(None, a, b).ratio()`` is ``2 * M / T``, where ``M`` is the
+number of characters in its matching blocks and ``T`` the combined length.
+Comparing a name against every indexed name to find ratios above a threshold
+is quadratic over a dedup run. This index returns only the names that can
+reach the threshold, using three necessary conditions:
+
+* Length: ``M <= min(len(a), len(b))``, so very different lengths can't match.
+* Shared characters: matched characters are distinct occurrences of the same
+  character in both names, so the names share at least ``M`` characters
+  (counted with multiplicity).
+* Shared bigrams: matching blocks appear in order in both names and
+  consecutive blocks are separated by at least one unmatched character, so
+  there are at most ``T - 2M + 1`` blocks. A block of ``L`` characters holds
+  ``L - 1`` bigrams common to both names, which gives at least ``3M - T - 1``
+  shared bigrams.
+
+All three are implied by the ratio, so no match is ever missed. They only
+decide which names are worth a ``SequenceMatcher`` call.
+"""
+
+from collections.abc import Iterator
+from functools import lru_cache
+
+
+def _gram_tokens(name: str, size: int) -> list[tuple[str, int]]:
+    """n-grams numbered by occurrence, so set overlap counts repeated n-grams"""
+    seen: dict[str, int] = {}
+    tokens = []
+    for i in range(len(name) - size + 1):
+        gram = name[i:i + size]
+        occurrence = seen[gram] = seen.get(gram, 0) + 1
+        tokens.append((gram, occurrence))
+    return tokens
+
+
+@lru_cache(maxsize=None)
+def _min_matches(total_length: int, threshold: float) -> int:
+    """Fewest matched characters for which SequenceMatcher's ratio exceeds ``threshold``"""
+    matches = int(threshold * total_length / 2)
+    # Step with the same float arithmetic ratio() uses
+    while 2.0 * matches / total_length <= threshold:
+        matches += 1
+    return matches
+
+
+class NgramCandidateIndex:
+    """Names indexed by length, character and bigram for similarity-threshold lookups"""
+
+    def __init__(self, threshold: float):
+        self.threshold = threshold
+        self.names: list[str] = []
+        self.chars: list[frozenset[tuple[str, int]]] = []
+        self.bigrams: list[frozenset[tuple[str, int]]] = []
+        self.by_length: dict[int, list[int]] = {}
+        # Per name length; character and bigram tokens share a map, their lengths keep them apart
+        self.postings: dict[int, dict[tuple[str, int], list[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(self, name: str):
+        name_id = len(self.names)
+        chars = _gram_tokens(name, 1)
+        bigrams = _gram_tokens(name, 2)
+        self.names.append(name)
+        self.chars.append(frozenset(chars))
+        self.bigrams.append(frozenset(bigrams))
+        self.by_length.setdefault(len(name), []).append(name_id)
+        postings = self.postings.setdefault(len(name), {})
+        for token in chars + bigrams:
+            postings.setdefault(token, []).append(name_id)
+
+    def _requirements(self, length1: int, length2: int) -> tuple[int, int] | None:
+        """Shared characters and bigrams needed for names of these lengths to match, None if they can't"""
+        total_length = length1 + length2
+        matches = _min_matches(total_length, self.threshold)
+        if matches > min(length1, length2):
+            return None
+        return matches, 3 * matches - total_length - 1
+
+    def _probe(self, postings: dict, tokens: list[tuple[str, int]], required: int) -> tuple[list[tuple[str, int]], int]:
+        """The rarest tokens of which a name sharing ``required`` of ``tokens`` must contain one, and their postings size"""
+        # Sharing `required` of the tokens means containing one of any len(tokens) - required + 1 of them
+        tokens = sorted(tokens, key=lambda token: len(postings.get(token, ())))
+        prefix = tokens[:len(tokens) - required + 1]
+        return prefix, sum(len(postings.get(token, ())) for token in prefix)
+
+    def candidates(self, name: str) -> Iterator[str]:
+        """Indexed names whose ratio with ``name`` can exceed the threshold, in no particular order"""
+        if not name:
+            # ratio() is 1.0 for two empty strings and 0.0 against anything else
+            for name_id in self.by_length.get(0, ()):
+                yield self.names[name_id]
+            return
+
+        chars = _gram_tokens(name, 1)
+        bigrams = _gram_tokens(name, 2)
+        char_set = frozenset(chars)
+        bigram_set = frozenset(bigrams)
+
+        for other_length, postings in self.postings.items():
+            requirements = self._requirements(len(name), other_length)
+            if requirements is None:
+                continue
+            required_chars, required_bigrams = requirements
+
+            # Probe on whichever kind of token touches fewer postings
+            prefix, cost = self._probe(postings, chars, required_chars)
+            if required_bigrams > 0:
+                bigram_prefix, bigram_cost = self._probe(postings, bigrams, required_bigrams)
+                if bigram_cost < cost:
+                    prefix = bigram_prefix
+
+            for name_id in set().union(*(postings.get(token, ()) for token in prefix)):
+                if (len(char_set & self.chars[name_id]) >= required_chars
+                        and len(bigram_set & self.bigrams[name_id]) >= required_bigrams):
+                    yield self.names[name_id]
@@ -0,0 +1,216 @@
+"""HTML parsing stage for the registry scrapers.
+
+Parsing pages with BeautifulSoup is CPU-bound, and on the event loop it stalls
+every download in flight. The functions here are plain module-level functions
+that take page text and return field dicts, so ``ParsePool`` can run them in
+worker processes (or threads) while the scrapers keep fetching. Each one uses
+a SoupStrainer so only the elements it reads are built into the tree.
+"""
+
+import asyncio
+import os
+import re
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+_TAG_CLASS_RE = re.compile(r"tag|label|badge")
+
+
+def _strainer(tags: set[str], classed_tags: set[str] = frozenset(),
+              class_match: Callable[[list[str]], bool] | None = None) -> SoupStrainer:
+    """Keep ``tags``, plus ``classed_tags`` whose classes satisfy ``class_match``.
+
+    Matching elements are kept with everything inside them. bs4 before 4.13
+    hands the filter the tag's attributes; newer releases only pass the name,
+    in which case classed tags are all kept and the find_all calls on the
+    parsed tree do the narrowing.
+    """
+
+    def keep(name: str, attrs: dict[str, Any] | None = None) -> bool:
+        if name in tags:
+            return True
+        if name not in classed_tags:
+            return False
+        if attrs is None or class_match is None:
+            return True
+        classes = attrs.get("class") or []
+        if isinstance(classes, str):
+            classes = classes.split()
+        return class_match(classes)
+
+    return SoupStrainer(keep)
+
+
+_SERVER_LINKS = SoupStrainer("a", href=True)
+_MCP_SO_DETAIL = _strainer(
+    {"title", "meta", "h1", "p", "a"}, {"span", "div"},
+    lambda classes: any(_TAG_CLASS_RE.search(c) for c in classes),
+)
+_GLAMA_CARDS = _strainer(set(), {"div"}, lambda classes: "server-card" in classes)
+_MCPMARKET_CARDS = _strainer(
+    {"article"}, {"div"}, lambda classes: bool({"server-card", "server", "card"} & set(classes)),
+)
+
+
+def parse_mcp_so_server_links(html: str) -> list[str]:
+    """Absolute URLs of all server pages linked from an mcp.so listing page."""
+    soup = BeautifulSoup(html, "html.parser", parse_only=_SERVER_LINKS)
+    server_urls = []
+
+    # Links shaped like /server/{name}/{author}, plus anything else under /server/
+    for link in soup.find_all("a", href=True):
+        href = link.get("href")
+        if href and "/server/" in href:
+            if href.startswith("/"):
+                server_urls.append(f"https://mcp.so{href}")
+            elif href.startswith("http"):
+                server_urls.append(href)
+
+    return server_urls
+
+
+def parse_mcp_so_detail(html: str, server_url: str) -> dict[str, Any] | None:
+    """Name, author, description, repository and tags from an mcp.so server page."""
+    soup = BeautifulSoup(html, "html.parser", parse_only=_MCP_SO_DETAIL)
+
+    name = None
+    author = None
+    description = None
+    repository = None
+    tags = []
+
+    # Extract name from title or h1
+    title_elem = soup.find("h1") or soup.find("title")
+    if title_elem:
+        title_text = title_elem.get_text(strip=True)
+        if " by " in title_text:
+            name, author = title_text.split(" by ", 1)
+        else:
+            name = title_text
+
+    # Extract description from meta or first paragraph
+    desc_meta = soup.find("meta", {"name": "description"})
+    if desc_meta:
+        description = desc_meta.get("content")
+    else:
+        desc_elem = soup.find("p")
+        if desc_elem:
+            description = desc_elem.get_text(strip=True)
+
+    # Extract repository URL
+    repo_link = soup.find("a", href=re.compile(r"github\.com"))
+    if repo_link:
+        repository = repo_link.get("href")
+
+    # Extract tags
+    for tag_elem in soup.find_all(["span", "div"], class_=_TAG_CLASS_RE):
+        tag_text = tag_elem.get_text(strip=True)
+        if tag_text.startswith("#"):
+            tags.append(tag_text[1:])
+        elif len(tag_text) < 20:  # Likely a tag
+            tags.append(tag_text)
+
+    # Extract from URL if name/author not found
+    if not name or not author:
+        url_parts = server_url.split("/")
+        if len(url_parts) >= 6:
+            if not name:
+                name = url_parts[-2]
+            if not author:
+                author = url_parts[-1]
+
+    if not name:
+        return None
+
+    return {"name": name, "author": author, "description": description, "repository": repository, "tags": tags}
+
+
+def _card_fields(element, headings: tuple[str, ...]) -> dict[str, Any] | None:
+    """Name, description, repository and author from a server card element.
+
+    The name comes from the first of ``headings`` present in the card.
+    """
+    name_elem = next((elem for elem in map(element.find, headings) if elem), None)
+    if not name_elem:
+        return None
+    name = name_elem.get_text(strip=True)
+
+    desc_elem = element.find("p") or element.find("div", class_="description")
+    description = desc_elem.get_text(strip=True) if desc_elem else ""
+
+    repo_elem = element.find("a", href=re.compile(r"github\.com"))
+    repository = repo_elem.get("href") if repo_elem else None
+
+    # Extract author from repository
+    author = None
+    if repository and "github.com" in repository:
+        parts = repository.split("/")
+        if len(parts) >= 5:
+            author = parts[3]
+
+    return {"name": name, "description": description, "repository": repository, "author": author}
+
+
+def parse_glama_cards(html: str) -> list[dict[str, Any]]:
+    """Fields of every server card on a Glama listing page."""
+    soup = BeautifulSoup(html, "html.parser", parse_only=_GLAMA_CARDS)
+    cards = []
+    for element in soup.find_all("div", class_="server-card"):
+        fields = _card_fields(element, ("h3", "h2", "h1"))
+        if fields and fields["name"]:
+            cards.append(fields)
+    return cards
+
+
+def parse_mcpmarket_cards(html: str) -> list[dict[str, Any]]:
+    """Fields of every server card on an MCP Market page."""
+    soup = BeautifulSoup(html, "html.parser", parse_only=_MCPMARKET_CARDS)
+
+    # Look for server cards/containers
+    server_elements = (
+        soup.find_all("div", class_="server-card") or
+        soup.find_all("div", class_="server") or
+        soup.find_all("article") or
+        soup.find_all("div", class_="card")
+    )
+
+    cards = []
+    for element in server_elements:
+        fields = _card_fields(element, ("h1", "h2", "h3"))
+        if fields and len(fields["name"]) >= 2:
+            cards.append(fields)
+    return cards
+
+
+class ParsePool:
+    """Runs parse functions off the event loop.
+
+    ``kind`` is "process" to spread parsing across cores or "thread" to keep
+    it in-process. The executor is started on first use.
+    """
+
+    def __init__(self, workers: int | None = None, kind: str = "process"):
+        self.workers = workers or os.cpu_count() or 1
+        self.kind = kind
+        self._executor: Executor | None = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="parse")
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run ``func(*args)`` in the pool and wait for its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), func, *args)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
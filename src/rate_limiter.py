@@ -0,0 +1,202 @@
+"""Rate limiting for registry scrapers.
+
+``HostRateLimiter`` paces plain HTML scraping to a fixed request rate per host.
+
+GitHub reports the state of each API quota in the ``X-RateLimit-*`` and
+``Retry-After`` response headers. ``GitHubRateLimiter`` keeps one token bucket
+per API resource (core, search, code search, GraphQL) and refills it from those
+headers, so requests run as fast as the quota allows and only wait when it is
+actually used up.
+"""
+
+import asyncio
+import time
+from collections.abc import Mapping
+from urllib.parse import urlparse
+
+# (requests per window, window seconds) for an authenticated token. These are
+# only starting points - the first response for each resource replaces them
+# with the real values for the token in use.
+GITHUB_DEFAULT_QUOTAS = {
+    "core": (5000, 3600),
+    "search": (30, 60),
+    "code_search": (10, 60),
+    "graphql": (5000, 3600),
+}
+
+# GitHub asks clients to wait at least a minute after a secondary rate limit
+# response that carries no Retry-After header.
+SECONDARY_RATE_LIMIT_WAIT = 60
+
+
+class QuotaBucket:
+    """Token bucket for a single GitHub API resource.
+
+    Tokens are the requests remaining in the current quota window. The bucket
+    refills to ``limit`` when the window resets.
+    """
+
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self.remaining = limit
+        self.reset_at = time.time() + window
+        self.blocked_until = 0.0
+        # Until the server first reports the quota, limit and window are only defaults
+        self.synced = False
+        self._lock = asyncio.Lock()
+
+    def _refill_if_reset(self, now: float):
+        if now >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at = now + self.window
+
+    def delay(self, now: float | None = None) -> float:
+        """Seconds until a request may be sent (0 if one can go right away)."""
+        now = time.time() if now is None else now
+        self._refill_if_reset(now)
+
+        if self.blocked_until > now:
+            return self.blocked_until - now
+        if self.remaining > 0:
+            return 0.0
+        return self.reset_at - now
+
+    async def acquire(self):
+        """Take one token, sleeping until the quota resets if none are left."""
+        async with self._lock:
+            while (wait := self.delay()) > 0:
+                await asyncio.sleep(wait)
+            self.remaining -= 1
+
+    def update(self, limit: int | None, remaining: int | None, reset_at: float | None):
+        """Apply quota values reported by the server."""
+        if limit is not None:
+            self.limit = limit
+
+        if not self.synced and remaining is not None:
+            # The defaults say nothing about this token's quota; take the server's values as they are
+            self.synced = True
+            self.remaining = remaining
+            if reset_at is not None:
+                self.reset_at = reset_at
+        elif reset_at is not None and reset_at > self.reset_at + 1:
+            # A new window has started since our last update
+            self.reset_at = reset_at
+            if remaining is not None:
+                self.remaining = remaining
+        elif remaining is not None:
+            # Responses can arrive out of order; never let a stale header
+            # hand back tokens that in-flight requests already used.
+            self.remaining = min(self.remaining, remaining)
+            if reset_at is not None:
+                self.reset_at = reset_at
+
+    def block(self, seconds: float):
+        """Hold all requests for this resource for ``seconds``."""
+        self.blocked_until = max(self.blocked_until, time.time() + seconds)
+
+    def refund(self):
+        """Return a token for a request the server did not count (e.g. a 304)."""
+        self.remaining = min(self.limit, self.remaining + 1)
+
+
+class GitHubRateLimiter:
+    """Header-driven rate limiter shared by everything that calls the GitHub API"""
+
+    def __init__(self, quotas: dict[str, tuple[int, float]] | None = None):
+        quotas = quotas or GITHUB_DEFAULT_QUOTAS
+        self.buckets = {resource: QuotaBucket(limit, window) for resource, (limit, window) in quotas.items()}
+
+    @staticmethod
+    def resource_for_url(url: str) -> str:
+        """Map a GitHub API URL to the rate limit resource it counts against."""
+        path = urlparse(url).path
+        if path.startswith("/search/code"):
+            return "code_search"
+        if path.startswith("/search/"):
+            return "search"
+        if path == "/graphql":
+            return "graphql"
+        return "core"
+
+    def _bucket(self, resource: str) -> QuotaBucket:
+        if resource not in self.buckets:
+            self.buckets[resource] = QuotaBucket(*GITHUB_DEFAULT_QUOTAS["core"])
+        return self.buckets[resource]
+
+    async def acquire(self, resource: str):
+        """Wait until a request against ``resource`` is allowed."""
+        await self._bucket(resource).acquire()
+
+    def update(self, resource: str, headers: Mapping[str, str], status: int) -> bool:
+        """Update the quota for ``resource`` from a response's headers.
+
+        Returns True if the response was rejected by a rate limit, in which
+        case the bucket has been set to wait for the right amount of time and
+        the request should be retried.
+        """
+        resource = headers.get("X-RateLimit-Resource", resource)
+        bucket = self._bucket(resource)
+
+        limit = _int_header(headers, "X-RateLimit-Limit")
+        remaining = _int_header(headers, "X-RateLimit-Remaining")
+        reset_at = _int_header(headers, "X-RateLimit-Reset")
+        bucket.update(limit, remaining, float(reset_at) if reset_at is not None else None)
+
+        if status not in (403, 429):
+            return False
+
+        retry_after = _int_header(headers, "Retry-After")
+        if retry_after is not None:
+            bucket.block(retry_after)
+            return True
+
+        if remaining == 0:
+            # Primary quota exhausted: delay() now waits until the reset time
+            return True
+
+        return False
+
+    def block(self, resource: str, seconds: float = SECONDARY_RATE_LIMIT_WAIT):
+        """Pause a resource after a rate limit response without usable headers."""
+        self._bucket(resource).block(seconds)
+
+    def refund(self, resource: str):
+        """Give back the token taken for a request that was answered with a 304."""
+        self._bucket(resource).refund()
+
+
+class HostRateLimiter:
+    """Spaces requests to each host evenly at ``requests_per_second``.
+
+    Every request reserves the next free time slot for its host, so any
+    number of concurrent workers together stay at the target rate.
+    """
+
+    def __init__(self, requests_per_second: float):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_slot: dict[str, float] = {}
+
+    async def acquire(self, url: str):
+        """Wait for this request's slot on the URL's host."""
+        if not self.interval:
+            return
+
+        host = urlparse(url).netloc
+        now = time.monotonic()
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + self.interval
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> int | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
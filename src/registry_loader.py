@@ -0,0 +1,88 @@
+"""Parallel loading of the latest snapshot of every registry.
+
+Decoding snapshot JSON into ``MCPServer`` objects is CPU-bound, so loading
+the registries one after another in a single process ties load time to the
+total size of the files. Here each registry's latest snapshot is split into
+byte ranges on line boundaries and decoded in a process pool. The servers come
+back pickled, which is several times cheaper to unpack than the JSON was to
+decode, and are merged in registry and file order.
+"""
+
+import os
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from pathlib import Path
+
+from models import MCPServer
+from snapshot_io import iter_snapshot_servers, latest_snapshot_file, paused_gc, snapshot_body_ranges
+
+# Large enough that pickling overhead per task stays small, small enough to
+# spread a single big registry over all cores
+CHUNK_BYTES = 16 * 1024 * 1024
+
+
+def _decode_range(path: Path, byte_range: tuple[int, int]) -> list[MCPServer]:
+    with paused_gc():
+        return list(iter_snapshot_servers(path, skip_invalid=True, byte_range=byte_range))
+
+
+class _InlineExecutor(Executor):
+    """Runs tasks immediately, for when a process pool isn't worth starting."""
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+def load_registry_servers(registries_path: Path = Path("data/registries"), workers: int | None = None,
+                          chunk_bytes: int = CHUNK_BYTES) -> tuple[list[MCPServer], dict[str, int]]:
+    """Load the servers of every registry's latest snapshot.
+
+    Returns all servers, in registry then file order, and the number loaded
+    per registry. Servers that fail validation are skipped. A registry whose
+    snapshot can't be read is reported and left out.
+    """
+    # Registry name -> latest snapshot and its byte ranges, or the error finding them
+    snapshots: dict[str, tuple[Path, list[tuple[int, int]]] | Exception] = {}
+    for registry_dir in sorted(Path(registries_path).iterdir()):
+        if not registry_dir.is_dir():
+            continue
+        try:
+            # The registry manifest names the latest snapshot
+            latest_file = latest_snapshot_file(registry_dir)
+            if latest_file:
+                snapshots[registry_dir.name] = (latest_file, snapshot_body_ranges(latest_file, chunk_bytes))
+        except Exception as e:
+            snapshots[registry_dir.name] = e
+
+    workers = workers or os.cpu_count() or 1
+    tasks = sum(len(found[1]) for found in snapshots.values() if not isinstance(found, Exception))
+    executor = ProcessPoolExecutor(max_workers=min(workers, tasks)) if workers > 1 and tasks > 1 else _InlineExecutor()
+
+    all_servers = []
+    registry_counts = {}
+    with executor, paused_gc():
+        # Submit everything up front so later registries decode while earlier ones are merged
+        futures = {
+            registry_name: [executor.submit(_decode_range, found[0], r) for r in found[1]]
+            for registry_name, found in snapshots.items() if not isinstance(found, Exception)
+        }
+
+        for registry_name, found in snapshots.items():
+            try:
+                if isinstance(found, Exception):
+                    raise found
+                print(f"📁 Loading {registry_name}: {found[0].name}")
+                servers_from_registry = [server for future in futures[registry_name] for server in future.result()]
+            except Exception as e:
+                print(f"   ❌ Failed to load {registry_name}: {e}")
+                continue
+
+            registry_counts[registry_name] = len(servers_from_registry)
+            all_servers.extend(servers_from_registry)
+            print(f"   ✅ Loaded {len(servers_from_registry):,} servers")
+
+    return all_servers, registry_counts
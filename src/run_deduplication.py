@@ -3,7 +3,6 @@
 """
 
 import asyncio
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import List
@@ -14,9 +13,9 @@ from models import (
     MCPServer,
     OntologyCategory,
     RegistrySource,
-    ServerCategory,
 )
 from neo4j_integration import Neo4jManager
+from snapshot_io import iter_snapshot_server_dicts, latest_snapshot_file
 
 
 def load_all_existing_servers() -> list[MCPServer]:
@@ -29,20 +28,15 @@ def load_all_existing_servers() -> list[MCPServer]:
             continue
 
         registry_name = registry_dir.name
-        json_files = list(registry_dir.glob("*.json"))
+        # The registry manifest names the latest snapshot
+        latest_file = latest_snapshot_file(registry_dir)
 
-        if not json_files:
+        if not latest_file:
             continue
 
-        # Get the latest file
-        latest_file = max(json_files, key=lambda f: f.stat().st_mtime)
-
         print(f"Loading from {registry_name}: {latest_file.name}")
 
-        with open(latest_file) as f:
-            data = json.load(f)
-
-        for server_data in data.get("servers", []):
+        for server_data in iter_snapshot_server_dicts(latest_file):
             try:
                 server = MCPServer(**server_data)
                 all_servers.append(server)
@@ -129,14 +123,13 @@ async def main():
     print("\n📂 Creating ontology categories...")
     categories = create_basic_ontology_categories()
 
+    server_ids_by_category = {}
+    for server in unique_servers:
+        for server_category in dict.fromkeys(server.categories):
+            server_ids_by_category.setdefault(server_category.value, []).append(server.id)
+
     for category in categories:
-        try:
-            category_enum = ServerCategory(category.id)
-            for server in unique_servers:
-                if category_enum in server.categories:
-                    category.servers.append(server.id)
-        except ValueError:
-            continue
+        category.servers.extend(server_ids_by_category.get(category.id, []))
 
     # Create knowledge graph
     kg = KnowledgeGraph(
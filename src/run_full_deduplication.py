@@ -4,9 +4,7 @@
 
 import argparse
 import asyncio
-import json
 from datetime import datetime
-from pathlib import Path
 from typing import List
 
 from deduplication import ServerDeduplicator
@@ -18,49 +16,12 @@ from models import (
     ServerCategory,
 )
 from neo4j_integration import Neo4jManager
+from registry_loader import load_registry_servers
 
 
-def load_all_servers_efficiently() -> list[MCPServer]:
+def load_all_servers_efficiently(workers: int | None = None) -> list[MCPServer]:
     """Load all servers from existing registry data efficiently"""
-    data_dir = Path("data/registries")
-    all_servers = []
-
-    registry_counts = {}
-
-    for registry_dir in data_dir.iterdir():
-        if not registry_dir.is_dir():
-            continue
-
-        registry_name = registry_dir.name
-        json_files = list(registry_dir.glob("*.json"))
-
-        if not json_files:
-            continue
-
-        # Get the latest file
-        latest_file = max(json_files, key=lambda f: f.stat().st_mtime)
-
-        print(f"📁 Loading {registry_name}: {latest_file.name}")
-
-        try:
-            with open(latest_file) as f:
-                data = json.load(f)
-
-            servers_from_registry = []
-            for server_data in data.get("servers", []):
-                try:
-                    server = MCPServer(**server_data)
-                    servers_from_registry.append(server)
-                except Exception:
-                    # Skip invalid servers but don't print every error
-                    continue
-
-            registry_counts[registry_name] = len(servers_from_registry)
-            all_servers.extend(servers_from_registry)
-            print(f"   ✅ Loaded {len(servers_from_registry)} servers")
-
-        except Exception as e:
-            print(f"   ❌ Failed to load {registry_name}: {e}")
+    all_servers, registry_counts = load_registry_servers(workers=workers)
 
     print("\n📊 Total servers loaded by registry:")
     for registry, count in sorted(registry_counts.items(), key=lambda x: x[1], reverse=True):
@@ -85,6 +46,8 @@ async def main():
                        help="Use fast batch loading for better performance")
     parser.add_argument("--batch-size", type=int, default=500,
                        help="Batch size for fast loading (default: 500)")
+    parser.add_argument("--load-workers", type=int,
+                       help="Processes for decoding registry snapshots (default: CPU count)")
 
     args = parser.parse_args()
 
@@ -99,7 +62,7 @@ async def main():
 
     # Load all servers
     print("🔍 Loading all server data...")
-    all_servers = load_all_servers_efficiently()
+    all_servers = load_all_servers_efficiently(args.load_workers)
     print(f"\n📊 Total servers loaded: {len(all_servers):,}")
 
     if not all_servers:
@@ -135,6 +98,10 @@ async def main():
     # Create basic categories
     print("\n📂 Creating basic ontology categories...")
     categories = []
+    server_ids_by_category = {}
+    for server in unique_servers:
+        for server_category in dict.fromkeys(server.categories):
+            server_ids_by_category.setdefault(server_category, []).append(server.id)
 
     # Create basic categories and assign servers
     for category_enum in ServerCategory:
@@ -142,13 +109,9 @@ async def main():
             id=category_enum.value,
             name=category_enum.value.replace("_", " ").title(),
             description=f"Servers in the {category_enum.value} category",
+            servers=server_ids_by_category.get(category_enum, []),
         )
 
-        # Find servers in this category
-        for server in unique_servers:
-            if category_enum in server.categories:
-                category.servers.append(server.id)
-
         if category.servers:  # Only add categories that have servers
             categories.append(category)
             print(f"   📁 {category.name}: {len(category.servers)} servers")
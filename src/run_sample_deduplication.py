@@ -4,7 +4,6 @@
 
 import argparse
 import asyncio
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import List
@@ -18,6 +17,7 @@ from models import (
     ServerCategory,
 )
 from neo4j_integration import Neo4jManager
+from snapshot_io import iter_snapshot_server_dicts, latest_snapshot_file
 
 
 def load_sample_servers(sample_size: int = 500) -> list[MCPServer]:
@@ -33,21 +33,16 @@ def load_sample_servers(sample_size: int = 500) -> list[MCPServer]:
             continue
 
         registry_name = registry_dir.name
-        json_files = list(registry_dir.glob("*.json"))
+        # The registry manifest names the latest snapshot
+        latest_file = latest_snapshot_file(registry_dir)
 
-        if not json_files:
+        if not latest_file:
             continue
 
-        # Get the latest file
-        latest_file = max(json_files, key=lambda f: f.stat().st_mtime)
-
         print(f"Loading sample from {registry_name}: {latest_file.name}")
 
-        with open(latest_file) as f:
-            data = json.load(f)
-
         servers_from_registry = []
-        for i, server_data in enumerate(data.get("servers", [])):
+        for i, server_data in enumerate(iter_snapshot_server_dicts(latest_file)):
             # Take a sample from each registry
             if i >= sample_size // 4:  # Divide sample across registries
                 break
@@ -2,10 +2,11 @@
 """Assessment of scale and deduplication capabilities for MCP server scraping
 """
 
-import json
 from collections import Counter
 from pathlib import Path
 
+from snapshot_io import latest_snapshot_entry
+
 
 def assess_current_scale():
     """Assess the current scale of server discovery"""
@@ -22,19 +23,13 @@ def assess_current_scale():
             continue
 
         registry_name = registry_dir.name
-        json_files = list(registry_dir.glob("*.json"))
+        latest = latest_snapshot_entry(registry_dir)
 
-        if not json_files:
+        if not latest:
             registry_counts[registry_name] = 0
             continue
 
-        # Get the latest file
-        latest_file = max(json_files, key=lambda f: f.stat().st_mtime)
-
-        with open(latest_file) as f:
-            data = json.load(f)
-
-        count = len(data.get("servers", []))
+        count = latest["servers_count"]
         registry_counts[registry_name] = count
         total_discovered += count
 
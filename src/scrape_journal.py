@@ -0,0 +1,121 @@
+"""Append-only checkpoint journal for resumable scraping.
+
+A scrape only produces its ``RegistrySnapshot`` at the very end, so a crash
+used to throw away hours of work. While a scraper runs it appends every
+finished item (a parsed server, a repo seen in search results) and its current
+position (search page, pagination cursor) to a JSONL journal. A resumed run
+replays the journal, skips everything already done and carries on from the last
+recorded position. The journal is deleted once the snapshot has been saved.
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from models import MCPServer
+
+
+class ScrapeJournal:
+    """JSONL journal of one scrape run of one registry.
+
+    With ``path=None`` the journal only lives in memory, so scrapers can
+    record progress unconditionally.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = Path(path) if path else None
+        self._items: dict[str, dict[str, Any]] = {}
+        self._positions: dict[str, Any] = {}
+        self._file = None
+
+        if self.path:
+            if self.path.exists():
+                self._replay()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a")
+
+    @staticmethod
+    def journal_dir(registry_path: Path) -> Path:
+        return Path(registry_path) / "journals"
+
+    @classmethod
+    def latest(cls, registry_path: Path) -> Path | None:
+        """The most recent unfinished journal for a registry, if any."""
+        journals = sorted(cls.journal_dir(registry_path).glob("*.jsonl"))
+        return journals[-1] if journals else None
+
+    @classmethod
+    def start(cls, registry_path: Path, resume: bool = False) -> "ScrapeJournal":
+        """Open the latest unfinished journal when resuming, otherwise a new one.
+
+        A new run discards unfinished journals of earlier runs, so a later
+        resume can't pick up a crash that this run has already superseded.
+        """
+        if resume:
+            latest = cls.latest(registry_path)
+            if latest:
+                return cls(latest)
+        else:
+            for stale in cls.journal_dir(registry_path).glob("*.jsonl"):
+                stale.unlink(missing_ok=True)
+        run_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        return cls(cls.journal_dir(registry_path) / f"{run_id}.jsonl")
+
+    def _replay(self):
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A crash can leave the last line half written
+                    break
+                if entry["type"] == "item":
+                    self._items.setdefault(entry["stage"], {})[entry["key"]] = entry["value"]
+                elif entry["type"] == "position":
+                    self._positions[entry["stage"]] = entry["value"]
+
+    def _append(self, entry: dict[str, Any]):
+        if self._file:
+            self._file.write(json.dumps(entry, default=str) + "\n")
+            self._file.flush()
+
+    @property
+    def resumed(self) -> bool:
+        return bool(self._items or self._positions)
+
+    def record_item(self, stage: str, key: str, value: Any):
+        """Record a finished unit of work (any JSON-serializable value)."""
+        self._append({"type": "item", "stage": stage, "key": key, "value": value})
+
+    def record_server(self, stage: str, key: str, server: MCPServer | None):
+        """Record a finished server (None for an item that turned out not to be one)."""
+        if self._file:
+            self.record_item(stage, key, server.dict() if server else None)
+
+    def record_position(self, stage: str, position: Any):
+        """Record how far a sequential stage (pagination, query list) has got."""
+        self._positions[stage] = position
+        self._append({"type": "position", "stage": stage, "value": position})
+
+    def items(self, stage: str) -> dict[str, Any]:
+        """Items replayed for ``stage``, in the order they were finished."""
+        return self._items.get(stage, {})
+
+    def servers(self, stage: str) -> dict[str, MCPServer | None]:
+        """Servers replayed for ``stage`` by key."""
+        return {key: MCPServer(**value) if value else None for key, value in self.items(stage).items()}
+
+    def position(self, stage: str) -> Any:
+        """Last recorded position for ``stage`` (None if it never recorded one)."""
+        return self._positions.get(stage)
+
+    def close(self):
+        if self._file and not self._file.closed:
+            self._file.close()
+
+    def complete(self):
+        """Discard the journal once its snapshot has been saved."""
+        self.close()
+        if self.path:
+            self.path.unlink(missing_ok=True)
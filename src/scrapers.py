@@ -5,6 +5,7 @@ import json
 import os
 import re
 import time
+from collections.abc import Iterator
 from datetime import UTC, datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
@@ -12,7 +13,7 @@ from urllib.parse import urljoin, urlparse
 
 import aiohttp
 import yaml
-from bs4 import BeautifulSoup
+from multidict import CIMultiDict
 from tqdm import tqdm
 from tqdm.asyncio import tqdm_asyncio
 
@@ -26,6 +27,20 @@ from models import (
     RegistrySource,
     ServerCategory,
 )
+import github_graphql
+import parsers
+from blob_store import BlobStore
+from http_cache import CachedResponse, HTTPCache
+from rate_limiter import GitHubRateLimiter, HostRateLimiter
+from scrape_journal import ScrapeJournal
+from snapshot_io import (
+    SnapshotWriter,
+    iter_snapshot_servers,
+    latest_snapshot_entry,
+    latest_snapshot_file,
+    load_snapshot,
+    write_snapshot,
+)
 
 
 class ConfigManager:
@@ -50,6 +65,9 @@ class StorageManager:
         self.base_path = Path(config.get("storage.base_path", "./data"))
         self.registries_path = Path(config.get("storage.registries_path", "./data/registries"))
         self.snapshots_path = Path(config.get("storage.snapshots_path", "./data/snapshots"))
+        self.http_cache_path = Path(config.get("storage.http_cache_path", self.base_path / "http_cache"))
+        # Registry payloads (raw_metadata) live here instead of inside every snapshot
+        self.blobs = BlobStore(config.get("storage.blob_store_path", self.base_path / "blobs"))
 
         # Create directories
         self.base_path.mkdir(exist_ok=True)
@@ -62,44 +80,74 @@ class StorageManager:
         return path
 
     def get_snapshot_filename(self, registry: RegistrySource, date: datetime) -> str:
-        return f"{registry.value}_{date.strftime('%Y%m%d_%H%M%S')}.json"
+        return f"{registry.value}_{date.strftime('%Y%m%d_%H%M%S')}.ndjson"
+
+    def open_snapshot_writer(self, registry: RegistrySource, date: datetime, url: str | None = None,
+                             metadata: dict[str, Any] | None = None) -> SnapshotWriter:
+        """Start a snapshot that is written server by server."""
+        filepath = self.get_registry_path(registry) / self.get_snapshot_filename(registry, date)
+        return SnapshotWriter(filepath, registry, date, url, metadata, blobs=self.blobs)
 
     def save_snapshot(self, snapshot: RegistrySnapshot) -> Path:
         filename = self.get_snapshot_filename(snapshot.registry_source, snapshot.snapshot_date)
         filepath = self.get_registry_path(snapshot.registry_source) / filename
+        return write_snapshot(snapshot, filepath, self.blobs)
 
-        with open(filepath, "w") as f:
-            json.dump(snapshot.dict(), f, indent=2, default=str)
+    def latest_snapshot_path(self, registry: RegistrySource) -> Path | None:
+        return latest_snapshot_file(self.get_registry_path(registry))
 
-        return filepath
+    def latest_snapshot_info(self, registry: RegistrySource) -> dict[str, Any] | None:
+        """Manifest entry (file, date, count, size, checksum) of the latest snapshot."""
+        return latest_snapshot_entry(self.get_registry_path(registry))
 
     def load_latest_snapshot(self, registry: RegistrySource) -> RegistrySnapshot | None:
-        registry_path = self.get_registry_path(registry)
-        snapshots = list(registry_path.glob(f"{registry.value}_*.json"))
-
-        if not snapshots:
-            return None
+        latest = self.latest_snapshot_path(registry)
+        return load_snapshot(latest) if latest else None
 
-        latest = max(snapshots, key=lambda p: p.stat().st_mtime)
-
-        with open(latest) as f:
-            data = json.load(f)
-
-        return RegistrySnapshot(**data)
+    def iter_latest_servers(self, registry: RegistrySource) -> Iterator[MCPServer]:
+        """Servers of the latest snapshot, loaded one at a time."""
+        latest = self.latest_snapshot_path(registry)
+        if latest:
+            yield from iter_snapshot_servers(latest)
 
     def calculate_checksum(self, data: str) -> str:
         return hashlib.sha256(data.encode()).hexdigest()
 
 
+# Config section name for each registry (``registries.<key>.*``)
+REGISTRY_CONFIG_KEYS = {
+    RegistrySource.GITHUB: "github",
+    RegistrySource.MCP_SO: "mcp_so",
+    RegistrySource.GLAMA: "glama",
+    RegistrySource.MCP_MARKET: "mcp_market",
+}
+
+
 class BaseScraper:
-    def __init__(self, config: ConfigManager, storage: StorageManager):
+    def __init__(self, config: ConfigManager, storage: StorageManager, max_concurrency: int | None = None,
+                 github_rate_limiter: GitHubRateLimiter | None = None, parse_pool: parsers.ParsePool | None = None,
+                 journal: ScrapeJournal | None = None):
         self.config = config
         self.storage = storage
         self.session = None
+        # Upper bound on simultaneous connections this scraper may open
+        self.max_concurrency = max_concurrency
+        # Shared across scrapers so they draw on the same GitHub quota
+        self.github_rate_limiter = github_rate_limiter or GitHubRateLimiter()
+        self.http_cache = HTTPCache(storage.http_cache_path) if config.get("scraping.http_cache", True) else None
+        # Checkpoints finished work so an interrupted run can be resumed
+        self.journal = journal or ScrapeJournal()
+        # HTML parsing runs here instead of on the event loop
+        self._owns_parse_pool = parse_pool is None
+        self.parse_pool = parse_pool or parsers.ParsePool(
+            config.get("scraping.parse_workers"), config.get("scraping.parse_executor", "process")
+        )
 
     async def __aenter__(self):
         timeout = aiohttp.ClientTimeout(total=self.config.get("scraping.timeout", 30))
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency or 100)
         self.session = aiohttp.ClientSession(
+            connector=connector,
             timeout=timeout,
             headers={"User-Agent": self.config.get("scraping.user_agent", "MCP-Scraper/1.0")},
         )
@@ -108,10 +156,83 @@ class BaseScraper:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.session:
             await self.session.close()
+        if self._owns_parse_pool:
+            self.parse_pool.close()
+
+        if self.http_cache and (self.http_cache.revalidated or self.http_cache.downloaded):
+            print(f"🗄️  HTTP cache: {self.http_cache.revalidated:,} not modified (304), "
+                  f"{self.http_cache.downloaded:,} downloaded")
+
+    async def _fetch(self, url: str, headers: dict[str, str] | None = None, method: str = "GET",
+                     **kwargs) -> CachedResponse:
+        """Request a URL, revalidating against the persistent HTTP cache.
+
+        GET requests send the stored ETag / Last-Modified validators. A 304
+        reply is returned as a 200 with the body from the local store.
+        """
+        request_headers = dict(headers or {})
+        use_cache = self.http_cache is not None and method == "GET"
+        # Responses differ by representation, e.g. GitHub raw vs JSON content
+        variant = request_headers.get("Accept", "")
+
+        cached = self.http_cache.lookup(url, variant) if use_cache else None
+        if cached:
+            request_headers.update(cached.validators())
+
+        async with self.session.request(method, url, headers=request_headers, **kwargs) as response:
+            response_headers = CIMultiDict(response.headers)
+
+            if response.status == 304 and cached:
+                self.http_cache.revalidated += 1
+                return CachedResponse(url, 200, response_headers, cached.body, from_cache=True)
+
+            body = await response.read()
+
+        if use_cache and response.status == 200:
+            self.http_cache.downloaded += 1
+            self.http_cache.store(url, response_headers, body, variant)
+
+        return CachedResponse(url, response.status, response_headers, body)
 
     async def scrape(self) -> RegistrySnapshot:
         raise NotImplementedError
 
+    async def _github_request(self, url: str, headers: dict[str, str], method: str = "GET",
+                              **kwargs) -> tuple[int, Any]:
+        """Send a GitHub API request through the shared rate limiter.
+
+        Rate-limited responses are retried once the quota allows it, so the
+        caller gets the page it asked for instead of losing it. Returns the
+        HTTP status and the decoded JSON body (None unless the status is 200).
+        """
+        resource = self.github_rate_limiter.resource_for_url(url)
+        max_retries = self.config.get("scraping.max_retries", 3)
+        status = 0
+
+        for _ in range(max_retries + 1):
+            await self.github_rate_limiter.acquire(resource)
+
+            # 304 revalidations from the HTTP cache don't count against the quota
+            response = await self._fetch(url, headers, method, **kwargs)
+            status = response.status
+            if response.from_cache:
+                self.github_rate_limiter.refund(resource)
+            rate_limited = self.github_rate_limiter.update(resource, response.headers, status)
+
+            if status == 200:
+                return status, response.json()
+
+            if not rate_limited and status in (403, 429):
+                # Secondary rate limits don't always come with headers
+                if "rate limit" in response.text().lower():
+                    self.github_rate_limiter.block(resource)
+                    rate_limited = True
+
+            if not rate_limited:
+                return status, None
+
+        return status, None
+
     def categorize_server(self, server_data: dict[str, Any]) -> list[ServerCategory]:
         categories = []
         description = (server_data.get("description", "") + " " +
@@ -164,7 +285,6 @@ class GitHubScraper(BaseScraper):
             raise ValueError("GitHub token is required")
 
         headers = {"Authorization": f"token {github_token}"}
-        servers = []
 
         # Enhanced search queries for comprehensive MCP server discovery
         search_queries = [
@@ -202,46 +322,7 @@ class GitHubScraper(BaseScraper):
             "user:modelcontextprotocol",
         ]
 
-        seen_repos = set()
-
-        # Progress bar for search queries
-        with tqdm(total=len(search_queries), desc="🔍 GitHub Search Queries", unit="query") as pbar:
-            for query in search_queries:
-                pbar.set_postfix_str(f"Searching: {query[:40]}...")
-
-                # Search repositories with pagination
-                for page in range(1, 6):  # First 5 pages (500 results max)
-                    url = f"https://api.github.com/search/repositories?q={query}&sort=stars&order=desc&page={page}&per_page=100"
-
-                    async with self.session.get(url, headers=headers) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            repos = data.get("items", [])
-
-                            if not repos:  # No more results
-                                break
-
-                            for repo in repos:
-                                repo_url = repo["html_url"]
-                                if repo_url not in seen_repos:
-                                    seen_repos.add(repo_url)
-                                    server = await self._process_github_repo(repo, headers)
-                                    if server:
-                                        servers.append(server)
-
-                        elif response.status == 403:  # Rate limit
-                            pbar.set_postfix_str("Rate limited, waiting...")
-                            await asyncio.sleep(60)
-                            break
-                        else:
-                            pbar.set_postfix_str(f"Error {response.status}")
-                            break
-
-                    # Respect rate limits
-                    await asyncio.sleep(1)
-
-                pbar.set_postfix_str(f"Found {len(servers)} servers so far")
-                pbar.update(1)
+        servers = await self._search_repositories(search_queries, headers)
 
         # Search for awesome MCP lists and parse them
         print("🔍 Searching awesome MCP lists...")
@@ -272,63 +353,248 @@ class GitHubScraper(BaseScraper):
             servers=unique_servers,
         )
 
+    async def _search_repositories(self, search_queries: list[str], headers: dict[str, str]) -> list[MCPServer]:
+        """Page through repository search results and enrich each new repo.
+
+        Search paging feeds a queue that a pool of enrichment workers drains,
+        so README and package probes for many repos are in flight at once
+        (all paced by the shared GitHub rate limiter). Servers are returned
+        in the order their repos first appeared in the search results.
+        """
+        worker_count = max(1, self.config.get("registries.github.enrichment_workers", 8))
+        batch_size = self._enrichment_batch_size()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=worker_count * 4)
+        enriched: dict[int, MCPServer] = {}
+        seen_repos = set()
+        pending: list[tuple[int, dict[str, Any]]] = []
+
+        # Replay a resumed run: repos already seen, and which of them were enriched
+        finished = self.journal.servers("github_servers")
+        for key, repo in self.journal.items("github_repos").items():
+            seen_repos.add(repo["html_url"])
+            if key not in finished:
+                pending.append((int(key), repo))
+            elif finished[key]:
+                enriched[int(key)] = finished[key]
+        position = self.journal.position("github_search") or {"query": 0, "page": 1}
+
+        async def enrichment_worker():
+            while True:
+                batch = await queue.get()
+                try:
+                    if batch is None:
+                        return
+                    servers = await self._enrich_repos([repo for _, repo in batch], headers)
+                    for (seq, _), server in zip(batch, servers):
+                        self.journal.record_server("github_servers", str(seq), server)
+                        if server:
+                            enriched[seq] = server
+                except Exception as e:
+                    # Keep the worker alive, or the search loop would block on a full queue
+                    print(f"Error enriching {len(batch)} GitHub repos: {e}")
+                finally:
+                    queue.task_done()
+
+        workers = [asyncio.create_task(enrichment_worker()) for _ in range(worker_count)]
+        try:
+            for i in range(0, len(pending), batch_size):
+                await queue.put(pending[i:i + batch_size])
+            pending = []
+
+            # Progress bar for search queries
+            with tqdm(total=len(search_queries), desc="🔍 GitHub Search Queries", unit="query") as pbar:
+                for query_index, query in enumerate(search_queries):
+                    if query_index < position["query"]:
+                        pbar.update(1)
+                        continue
+                    first_page = position["page"] if query_index == position["query"] else 1
+                    pbar.set_postfix_str(f"Searching: {query[:40]}...")
+
+                    # Search repositories with pagination
+                    for page in range(first_page, 6):  # First 5 pages (500 results max)
+                        url = f"https://api.github.com/search/repositories?q={query}&sort=stars&order=desc&page={page}&per_page=100"
+
+                        # Waits for the search quota if needed and retries the same page
+                        status, data = await self._github_request(url, headers)
+                        if status != 200:
+                            pbar.set_postfix_str(f"Error {status}")
+                            break
+
+                        repos = data.get("items", [])
+                        if not repos:  # No more results
+                            break
+
+                        for repo in repos:
+                            repo_url = repo["html_url"]
+                            if repo_url not in seen_repos:
+                                self.journal.record_item("github_repos", str(len(seen_repos)), repo)
+                                pending.append((len(seen_repos), repo))
+                                seen_repos.add(repo_url)
+                                if len(pending) >= batch_size:
+                                    await queue.put(pending)
+                                    pending = []
+                        self.journal.record_position("github_search", {"query": query_index, "page": page + 1})
+
+                    self.journal.record_position("github_search", {"query": query_index + 1, "page": 1})
+                    pbar.set_postfix_str(f"Found {len(enriched)} servers so far")
+                    pbar.update(1)
+
+            if pending:
+                await queue.put(pending)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+        return [enriched[seq] for seq in sorted(enriched)]
+
+    def _use_graphql(self) -> bool:
+        return self.config.get("registries.github.enrichment_backend", "rest") == "graphql"
+
+    def _enrichment_batch_size(self) -> int:
+        """Repos per enrichment call: one for REST, a whole query's worth for GraphQL"""
+        if not self._use_graphql():
+            return 1
+        return max(1, self.config.get("registries.github.graphql_batch_size", 50))
+
+    async def _enrich_repos(self, repos: list[dict[str, Any]], headers: dict[str, str]) -> list[MCPServer | None]:
+        """Turn repository objects into servers (None where a repo isn't one).
+
+        With the GraphQL backend the whole list is resolved in one request.
+        Repos the GraphQL request couldn't cover fall back to the REST probes.
+        """
+        details = {}
+        if self._use_graphql():
+            details = await self._fetch_repository_details(
+                [f"{repo['owner']['login']}/{repo['name']}" for repo in repos], headers
+            )
+
+        servers = []
+        for repo in repos:
+            path = f"{repo['owner']['login']}/{repo['name']}"
+            if path in details:
+                servers.append(self._server_from_details(repo, details[path]))
+                continue
+
+            if "html_url" not in repo:
+                # Bare owner/name reference (e.g. from an awesome list): get the repo first
+                status, repo = await self._github_request(f"https://api.github.com/repos/{path}", headers)
+                if status != 200:
+                    servers.append(None)
+                    continue
+            servers.append(await self._process_github_repo(repo, headers))
+        return servers
+
+    async def _fetch_repository_details(self, repo_paths: list[str],
+                                        headers: dict[str, str]) -> dict[str, github_graphql.RepositoryDetails | None]:
+        """Resolve ``owner/name`` paths with one GraphQL query.
+
+        Returns an empty dict if the query as a whole failed.
+        """
+        status, data = await self._github_request(
+            github_graphql.GRAPHQL_URL, headers, method="POST",
+            json={"query": github_graphql.build_query(repo_paths)},
+        )
+        if status != 200 or not data or not data.get("data"):
+            print(f"⚠️  GraphQL enrichment failed ({status}), falling back to REST for {len(repo_paths)} repos")
+            return {}
+        return github_graphql.parse_response(repo_paths, data)
+
+    def _server_from_details(self, repo: dict[str, Any],
+                             details: github_graphql.RepositoryDetails | None) -> MCPServer | None:
+        """Build a server from GraphQL results, applying the same checks as the REST path"""
+        if details is None:
+            return None
+
+        # Fields from the caller's object (e.g. a full search result) win;
+        # GraphQL fills whatever it lacks, such as for code search hits.
+        repo = {**details.repo, **{key: value for key, value in repo.items() if value is not None}}
+        try:
+            if details.readme is not None:
+                is_mcp = self._readme_mentions_mcp(details.readme)
+            else:
+                is_mcp = self._repo_mentions_mcp(repo)
+            if not is_mcp:
+                return None
+
+            package_info = {}
+            if "package.json" in details.files:
+                try:
+                    package_info = json.loads(details.files["package.json"])
+                except ValueError:
+                    pass
+
+            return self._build_github_server(repo, package_info)
+        except Exception as e:
+            print(f"Error processing GitHub repo {repo.get('name', 'unknown')}: {e}")
+            return None
+
     async def _process_github_repo(self, repo: dict[str, Any], headers: dict[str, str]) -> MCPServer | None:
         try:
             # Check if it's actually an MCP server
             if not await self._is_mcp_server(repo, headers):
                 return None
 
-            server_id = f"github_{repo['owner']['login']}_{repo['name']}"
-
             # Try to get package.json or pyproject.toml for more details
             package_info = await self._get_package_info(repo, headers)
 
-            categories = self.categorize_server(repo)
-            operations = self.determine_operations(package_info)
-
-            return MCPServer(
-                id=server_id,
-                name=repo["name"],
-                description=repo.get("description"),
-                author=repo["owner"]["login"],
-                homepage=repo.get("homepage") if repo.get("homepage") else None,
-                repository=repo["html_url"],
-                implementation_language=repo.get("language"),
-                categories=categories,
-                operations=operations,
-                registry_source=RegistrySource.GITHUB,
-                source_url=repo["html_url"],
-                last_updated=datetime.fromisoformat(repo["updated_at"].replace("Z", "+00:00")),
-                popularity_score=repo.get("stargazers_count", 0),
-                raw_metadata=repo,
-            )
+            return self._build_github_server(repo, package_info)
         except Exception as e:
             print(f"Error processing GitHub repo {repo.get('name', 'unknown')}: {e}")
             return None
 
+    def _build_github_server(self, repo: dict[str, Any], package_info: dict[str, Any]) -> MCPServer:
+        server_id = f"github_{repo['owner']['login']}_{repo['name']}"
+        categories = self.categorize_server(repo)
+        operations = self.determine_operations(package_info)
+
+        return MCPServer(
+            id=server_id,
+            name=repo["name"],
+            description=repo.get("description"),
+            author=repo["owner"]["login"],
+            homepage=repo.get("homepage") if repo.get("homepage") else None,
+            repository=repo["html_url"],
+            implementation_language=repo.get("language"),
+            categories=categories,
+            operations=operations,
+            registry_source=RegistrySource.GITHUB,
+            source_url=repo["html_url"],
+            last_updated=datetime.fromisoformat(repo["updated_at"].replace("Z", "+00:00")),
+            popularity_score=repo.get("stargazers_count", 0),
+            raw_metadata=repo,
+        )
+
     async def _is_mcp_server(self, repo: dict[str, Any], headers: dict[str, str]) -> bool:
         # Check README for MCP indicators
         readme_url = f"https://api.github.com/repos/{repo['owner']['login']}/{repo['name']}/readme"
 
         try:
-            async with self.session.get(readme_url, headers=headers) as response:
-                if response.status == 200:
-                    readme_data = await response.json()
-                    readme_content = readme_data.get("content", "")
-
-                    # Decode base64 content
-                    readme_text = base64.b64decode(readme_content).decode("utf-8").lower()
+            status, readme_data = await self._github_request(readme_url, headers)
+            if status == 200:
+                readme_content = readme_data.get("content", "")
 
-                    mcp_indicators = [
-                        "mcp server", "model context protocol", "mcp-server",
-                        "claude desktop", "mcp.json", "model-context-protocol",
-                    ]
-
-                    return any(indicator in readme_text for indicator in mcp_indicators)
+                # Decode base64 content
+                return self._readme_mentions_mcp(base64.b64decode(readme_content).decode("utf-8"))
         except Exception:
             pass
 
         # Fallback to description and topics
+        return self._repo_mentions_mcp(repo)
+
+    @staticmethod
+    def _readme_mentions_mcp(readme_text: str) -> bool:
+        readme_text = readme_text.lower()
+        mcp_indicators = [
+            "mcp server", "model context protocol", "mcp-server",
+            "claude desktop", "mcp.json", "model-context-protocol",
+        ]
+        return any(indicator in readme_text for indicator in mcp_indicators)
+
+    @staticmethod
+    def _repo_mentions_mcp(repo: dict[str, Any]) -> bool:
         description = repo.get("description")
         description = description.lower() if isinstance(description, str) else ""
         topics = repo.get("topics", [])
@@ -343,15 +609,13 @@ class GitHubScraper(BaseScraper):
             url = f"https://api.github.com/repos/{repo['owner']['login']}/{repo['name']}/contents/{filename}"
 
             try:
-                async with self.session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        file_data = await response.json()
-
-                        content = base64.b64decode(file_data["content"]).decode("utf-8")
+                status, file_data = await self._github_request(url, headers)
+                if status == 200:
+                    content = base64.b64decode(file_data["content"]).decode("utf-8")
 
-                        if filename == "package.json":
-                            return json.loads(content)
-                        # TODO: Parse TOML files for Rust/Python projects
+                    if filename == "package.json":
+                        return json.loads(content)
+                    # TODO: Parse TOML files for Rust/Python projects
 
             except Exception:
                 continue
@@ -368,32 +632,27 @@ class GitHubScraper(BaseScraper):
             "modelcontextprotocol/servers",
             "anthropics/mcp-servers",
         ]
+        batch_size = self._enrichment_batch_size()
 
         for repo_name in awesome_repos:
             try:
                 # Get README content
                 url = f"https://api.github.com/repos/{repo_name}/readme"
-                async with self.session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        readme_data = await response.json()
-
-                        readme_content = base64.b64decode(readme_data["content"]).decode("utf-8")
+                status, readme_data = await self._github_request(url, headers)
+                if status == 200:
+                    readme_content = base64.b64decode(readme_data["content"]).decode("utf-8")
 
-                        # Extract GitHub URLs from markdown
-                        import re
-                        github_urls = re.findall(r"https://github\.com/([^/]+/[^/\s\)]+)", readme_content)
+                    # Extract GitHub URLs from markdown
+                    github_urls = re.findall(r"https://github\.com/([^/]+/[^/\s\)]+)", readme_content)
 
-                        for repo_path in github_urls:
-                            # Get repo details
-                            repo_url = f"https://api.github.com/repos/{repo_path}"
-                            async with self.session.get(repo_url, headers=headers) as repo_response:
-                                if repo_response.status == 200:
-                                    repo_data = await repo_response.json()
-                                    server = await self._process_github_repo(repo_data, headers)
-                                    if server:
-                                        servers.append(server)
+                    listed_repos = []
+                    for repo_path in dict.fromkeys(github_urls):
+                        owner, _, name = repo_path.partition("/")
+                        listed_repos.append({"owner": {"login": owner}, "name": name})
 
-                            await asyncio.sleep(0.5)  # Rate limiting
+                    for i in range(0, len(listed_repos), batch_size):
+                        batch = await self._enrich_repos(listed_repos[i:i + batch_size], headers)
+                        servers.extend(server for server in batch if server)
 
             except Exception as e:
                 print(f"Error scraping awesome list {repo_name}: {e}")
@@ -414,22 +673,18 @@ class GitHubScraper(BaseScraper):
             '"from mcp" language:python',
             '"import mcp" language:python',
         ]
+        batch_size = self._enrichment_batch_size()
 
         for query in code_queries:
             try:
                 url = f"https://api.github.com/search/code?q={query}&per_page=100"
-                async with self.session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-
-                        for item in data.get("items", [])[:50]:  # Limit to avoid rate limits
-                            repo = item.get("repository", {})
-                            if repo:
-                                server = await self._process_github_repo(repo, headers)
-                                if server:
-                                    servers.append(server)
-
-                    await asyncio.sleep(2)  # Code search has stricter rate limits
+                # Code search has its own, much smaller quota
+                status, data = await self._github_request(url, headers)
+                if status == 200:
+                    repos = [item["repository"] for item in data.get("items", [])[:50] if item.get("repository")]
+                    for i in range(0, len(repos), batch_size):
+                        batch = await self._enrich_repos(repos[i:i + batch_size], headers)
+                        servers.extend(server for server in batch if server)
 
             except Exception as e:
                 print(f"Error in code search for {query}: {e}")
@@ -446,55 +701,22 @@ class MCPSoScraper(BaseScraper):
 
         # Get all server URLs from the main page and category pages
         print("🔍 Discovering server URLs on mcp.so...")
-        server_urls = await self._discover_all_server_urls(base_url)
-        print(f"📋 Found {len(server_urls)} server URLs on mcp.so")
-
-        # Scrape each server detail page with enhanced progress tracking
-        successful_count = 0
-        failed_count = 0
-
-        async def process_server_with_progress(server_url, pbar):
-            nonlocal successful_count, failed_count
-            try:
-                server = await self._scrape_server_detail(server_url)
-                if server:
-                    successful_count += 1
-                    pbar.set_postfix_str(f"✅ {successful_count} success, ❌ {failed_count} failed")
-                else:
-                    failed_count += 1
-                    pbar.set_postfix_str(f"✅ {successful_count} success, ❌ {failed_count} failed")
-                pbar.update(1)
-                await asyncio.sleep(0.5)  # Rate limiting
-                return server
-            except Exception:
-                failed_count += 1
-                pbar.set_postfix_str(f"✅ {successful_count} success, ❌ {failed_count} failed")
-                pbar.update(1)
-                return None
-
-        # Process with detailed progress bar
-        print(f"🌐 Starting detailed scraping of {len(server_urls)} servers...")
-        with tqdm(total=len(server_urls), desc="🌐 Scraping mcp.so servers", unit="server") as pbar:
-            # Process in smaller batches to avoid overwhelming the server
-            batch_size = 50
-            results = []
-
-            for i in range(0, len(server_urls), batch_size):
-                batch_urls = server_urls[i:i + batch_size]
-                pbar.set_description(f"🌐 Batch {i//batch_size + 1}/{(len(server_urls)-1)//batch_size + 1}")
+        sitemap_lastmod = await self._discover_all_server_urls(base_url)
+        print(f"📋 Found {len(sitemap_lastmod)} server URLs on mcp.so")
 
-                # Create tasks for this batch
-                batch_tasks = [process_server_with_progress(url, pbar) for url in batch_urls]
+        # Reuse servers whose sitemap <lastmod> hasn't moved since the last snapshot
+        carried_over = []
+        if self.config.get("registries.mcp_so.incremental", True):
+            carried_over = self._unchanged_servers(sitemap_lastmod)
+        carried_urls = {str(server.source_url) for server in carried_over}
+        server_urls = [url for url in sitemap_lastmod if url not in carried_urls]
+        if carried_over:
+            print(f"♻️  {len(carried_over)} servers unchanged since last snapshot, "
+                  f"{len(server_urls)} new or changed")
 
-                # Process batch concurrently
-                batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-                results.extend([r for r in batch_results if not isinstance(r, Exception)])
+        results = await self._scrape_server_details(server_urls)
 
-                # Small delay between batches
-                await asyncio.sleep(1)
-
-        # Filter out None results
-        servers = [server for server in results if server is not None]
+        servers = carried_over + results
 
         elapsed_time = time.time() - start_time
         print(f"✅ mcp.so scraping completed in {elapsed_time:.1f}s")
@@ -505,11 +727,101 @@ class MCPSoScraper(BaseScraper):
             url=base_url,
             servers_count=len(servers),
             servers=servers,
+            metadata={"sitemap_lastmod": {url: lastmod for url, lastmod in sitemap_lastmod.items() if lastmod}},
         )
 
-    async def _discover_all_server_urls(self, base_url: str) -> list[str]:
-        """Discover ALL server URLs from mcp.so using sitemaps (3,642+ servers)"""
-        server_urls = set()
+    async def _scrape_server_details(self, server_urls: list[str]) -> list[MCPServer]:
+        """Fetch detail pages with a pool of workers paced per host.
+
+        Workers pull the next URL as soon as they finish one, so a slow page
+        only occupies its own worker. Each page gets its own timeout. The
+        returned servers keep the order of ``server_urls``.
+        """
+        worker_count = max(1, self.config.get("registries.mcp_so.workers", self.max_concurrency or 20))
+        request_timeout = self.config.get("registries.mcp_so.request_timeout", 20)
+        host_limiter = HostRateLimiter(self.config.get("registries.mcp_so.requests_per_second", 10))
+
+        # Pages finished before an interruption aren't fetched again
+        finished = self.journal.servers("mcp_so_details")
+        results: dict[int, MCPServer] = {}
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, url in enumerate(server_urls):
+            if finished.get(url):
+                results[index] = finished[url]
+            else:
+                queue.put_nowait((index, url))
+        if results:
+            print(f"↩️  {len(results)} server pages already scraped before the interruption")
+
+        successful_count = 0
+        failed_count = 0
+        start_time = time.time()
+
+        print(f"🌐 Starting detailed scraping of {len(server_urls)} servers with {worker_count} workers...")
+        with tqdm(total=queue.qsize(), desc="🌐 Scraping mcp.so servers", unit="server") as pbar:
+
+            async def detail_worker():
+                nonlocal successful_count, failed_count
+                while not queue.empty():
+                    index, server_url = queue.get_nowait()
+                    await host_limiter.acquire(server_url)
+                    try:
+                        server = await asyncio.wait_for(self._scrape_server_detail(server_url), request_timeout)
+                    except Exception:
+                        # Includes timeouts: give up on this page and move on
+                        server = None
+
+                    if server:
+                        results[index] = server
+                        self.journal.record_server("mcp_so_details", server_url, server)
+                        successful_count += 1
+                    else:
+                        failed_count += 1
+
+                    rate = (successful_count + failed_count) / max(time.time() - start_time, 1e-6)
+                    pbar.set_postfix_str(f"✅ {successful_count} success, ❌ {failed_count} failed, {rate:.1f} pages/s")
+                    pbar.update(1)
+
+            await asyncio.gather(*(detail_worker() for _ in range(min(worker_count, queue.qsize()))))
+
+        return [results[index] for index in sorted(results)]
+
+    def _unchanged_servers(self, sitemap_lastmod: dict[str, str | None]) -> list[MCPServer]:
+        """Servers from the previous snapshot whose sitemap lastmod is unchanged"""
+        previous = self.storage.load_latest_snapshot(RegistrySource.MCP_SO)
+        if not previous or not previous.metadata:
+            return []
+
+        previous_lastmod = previous.metadata.get("sitemap_lastmod", {})
+        unchanged = []
+        for server in previous.servers:
+            url = str(server.source_url)
+            lastmod = sitemap_lastmod.get(url)
+            # Pages without a lastmod (homepage-only finds) are always refetched
+            if lastmod and previous_lastmod.get(url) == lastmod:
+                unchanged.append(server)
+        return unchanged
+
+    @staticmethod
+    def _parse_sitemap(xml_content: str, base_url: str) -> dict[str, str | None]:
+        """Map each server URL in a sitemap to its <lastmod> (None if absent)"""
+        entries = {}
+        server_prefix = re.escape(f"{base_url.rstrip('/')}/server/")
+        for block in re.findall(r"<url>(.*?)</url>", xml_content, re.DOTALL):
+            loc = re.search(rf"<loc>\s*({server_prefix}[^<]+?)\s*</loc>", block)
+            if not loc:
+                continue
+            lastmod = re.search(r"<lastmod>\s*([^<]+?)\s*</lastmod>", block)
+            entries[loc.group(1)] = lastmod.group(1) if lastmod else None
+        return entries
+
+    async def _discover_all_server_urls(self, base_url: str) -> dict[str, str | None]:
+        """Discover ALL server URLs from mcp.so using sitemaps (3,642+ servers)
+
+        Returns each URL with its sitemap <lastmod>, or None when the page
+        wasn't listed with one.
+        """
+        server_urls = {}
 
         print("🗂️  Extracting servers from MCP.so sitemaps...")
 
@@ -524,20 +836,15 @@ class MCPSoScraper(BaseScraper):
         for sitemap_url in sitemap_urls:
             try:
                 print(f"  📄 Processing {sitemap_url}...")
-                async with self.session.get(sitemap_url) as response:
-                    if response.status == 200:
-                        xml_content = await response.text()
-
-                        # Extract URLs from XML sitemap
-                        import re
-                        urls = re.findall(r"<loc>(https://mcp\.so/server/[^<]+)</loc>", xml_content)
-
-                        for url in urls:
-                            server_urls.add(url)
+                response = await self._fetch(sitemap_url)
+                if response.status == 200:
+                    # Extract URLs and their last modification dates from XML sitemap
+                    urls = self._parse_sitemap(response.text(), base_url)
+                    server_urls.update(urls)
 
-                        print(f"    ✅ Found {len(urls)} servers in this sitemap")
-                    else:
-                        print(f"    ⚠️  Failed to access {sitemap_url}: {response.status}")
+                    print(f"    ✅ Found {len(urls)} servers in this sitemap")
+                else:
+                    print(f"    ⚠️  Failed to access {sitemap_url}: {response.status}")
 
             except Exception as e:
                 print(f"    ❌ Error processing {sitemap_url}: {e}")
@@ -547,9 +854,10 @@ class MCPSoScraper(BaseScraper):
 
         # Also try the homepage for any additional servers not in sitemaps
         homepage_urls = await self._get_homepage_servers(base_url)
-        server_urls.update(homepage_urls)
+        for url in homepage_urls:
+            server_urls.setdefault(url, None)
 
-        return list(server_urls)
+        return server_urls
 
     async def _get_homepage_servers(self, base_url: str) -> list[str]:
         """Get servers from homepage tabs as fallback"""
@@ -568,37 +876,10 @@ class MCPSoScraper(BaseScraper):
 
         for page_url in pages_to_check:
             try:
-                async with self.session.get(page_url) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        soup = BeautifulSoup(html, "html.parser")
-
-                        # Find all server links (pattern: /server/{name}/{author})
-                        server_links = soup.find_all("a", href=re.compile(r"/server/"))
-
-                        for link in server_links:
-                            href = link.get("href")
-                            if href and "/server/" in href:
-                                if href.startswith("/"):
-                                    full_url = f"https://mcp.so{href}"
-                                elif href.startswith("http"):
-                                    full_url = href
-                                else:
-                                    continue
-                                server_urls.add(full_url)
-
-                        # Also look for any other patterns
-                        all_links = soup.find_all("a", href=True)
-                        for link in all_links:
-                            href = link.get("href")
-                            if href and "/server/" in href and href.count("/") >= 4:
-                                if href.startswith("/"):
-                                    full_url = f"https://mcp.so{href}"
-                                elif href.startswith("http"):
-                                    full_url = href
-                                else:
-                                    continue
-                                server_urls.add(full_url)
+                response = await self._fetch(page_url)
+                if response.status == 200:
+                    # Find all server links (pattern: /server/{name}/{author})
+                    server_urls.update(await self.parse_pool.run(parsers.parse_mcp_so_server_links, response.text()))
 
             except Exception as e:
                 print(f"  Error discovering servers from {page_url}: {e}")
@@ -611,79 +892,33 @@ class MCPSoScraper(BaseScraper):
     async def _scrape_server_detail(self, server_url: str) -> MCPServer | None:
         """Scrape detailed information from a server page"""
         try:
-            async with self.session.get(server_url) as response:
-                if response.status != 200:
-                    return None
-
-                html = await response.text()
-                soup = BeautifulSoup(html, "html.parser")
-
-                # Extract server metadata
-                name = None
-                author = None
-                description = None
-                repository = None
-                tags = []
-
-                # Extract name from title or h1
-                title_elem = soup.find("h1") or soup.find("title")
-                if title_elem:
-                    title_text = title_elem.get_text(strip=True)
-                    if " by " in title_text:
-                        name, author = title_text.split(" by ", 1)
-                    else:
-                        name = title_text
+            response = await self._fetch(server_url)
+            if response.status != 200:
+                return None
 
-                # Extract description from meta or first paragraph
-                desc_meta = soup.find("meta", {"name": "description"})
-                if desc_meta:
-                    description = desc_meta.get("content")
-                else:
-                    desc_elem = soup.find("p")
-                    if desc_elem:
-                        description = desc_elem.get_text(strip=True)
-
-                # Extract repository URL
-                repo_links = soup.find_all("a", href=re.compile(r"github\.com"))
-                if repo_links:
-                    repository = repo_links[0].get("href")
-
-                # Extract tags
-                tag_elements = soup.find_all(["span", "div"], class_=re.compile(r"tag|label|badge"))
-                for tag_elem in tag_elements:
-                    tag_text = tag_elem.get_text(strip=True)
-                    if tag_text.startswith("#"):
-                        tags.append(tag_text[1:])
-                    elif len(tag_text) < 20:  # Likely a tag
-                        tags.append(tag_text)
-
-                # Extract from URL if name/author not found
-                if not name or not author:
-                    url_parts = server_url.split("/")
-                    if len(url_parts) >= 6:
-                        if not name:
-                            name = url_parts[-2]
-                        if not author:
-                            author = url_parts[-1]
+            fields = await self.parse_pool.run(parsers.parse_mcp_so_detail, response.text(), server_url)
+            if not fields:
+                return None
 
-                if not name:
-                    return None
+            name = fields["name"]
+            description = fields["description"]
+            tags = fields["tags"]
 
-                server_id = f"mcp_so_{name.lower().replace(' ', '_').replace('-', '_')}"
-                categories = self.categorize_server({"name": name, "description": description or "", "tags": tags})
+            server_id = f"mcp_so_{name.lower().replace(' ', '_').replace('-', '_')}"
+            categories = self.categorize_server({"name": name, "description": description or "", "tags": tags})
 
-                return MCPServer(
-                    id=server_id,
-                    name=name,
-                    description=description,
-                    author=author,
-                    repository=repository,
-                    categories=categories,
-                    operations=self.determine_operations({"tags": tags}),
-                    data_types=tags,
-                    registry_source=RegistrySource.MCP_SO,
-                    source_url=server_url,
-                )
+            return MCPServer(
+                id=server_id,
+                name=name,
+                description=description,
+                author=fields["author"],
+                repository=fields["repository"],
+                categories=categories,
+                operations=self.determine_operations({"tags": tags}),
+                data_types=tags,
+                registry_source=RegistrySource.MCP_SO,
+                source_url=server_url,
+            )
 
         except Exception as e:
             print(f"Error scraping server detail {server_url}: {e}")
@@ -767,67 +1002,84 @@ class GlamaScraper(BaseScraper):
 
     async def _scrape_glama_api(self) -> list[MCPServer]:
         """Scrape servers using Glama's API with pagination."""
-        servers = []
         api_url = "https://glama.ai/api/mcp/servers"
 
+        # Pages fetched before an interruption, and where pagination stopped. A page
+        # journaled just before a crash is fetched again, so servers are keyed by page
+        # and index and a re-fetched page replaces its entries.
+        servers = {key: server for key, server in self.journal.servers("glama_api").items() if server}
+        position = self.journal.position("glama_api")
+
+        def process_page(page_number: int, page_servers: list[dict[str, Any]]):
+            for key in [key for key in servers if key.startswith(f"{page_number}:")]:
+                del servers[key]
+            for index, server_data in enumerate(page_servers):
+                server = self._process_glama_api_server(server_data)
+                if server:
+                    key = f"{page_number}:{index}"
+                    self.journal.record_server("glama_api", key, server)
+                    servers[key] = server
+
         try:
-            # First request to get total info
-            async with self.session.get(api_url) as response:
+            if position is None:
+                # First request to get total info
+                response = await self._fetch(api_url)
                 if response.status != 200:
-                    return []
+                    return list(servers.values())
 
-                data = await response.json()
+                data = response.json()
                 if not isinstance(data, dict) or "servers" not in data:
-                    return []
+                    return list(servers.values())
 
                 # Process first page
-                for server_data in data["servers"]:
-                    server = self._process_glama_api_server(server_data)
-                    if server:
-                        servers.append(server)
+                process_page(1, data["servers"])
 
                 # Handle pagination if available
                 cursor = data.get("cursor")
                 has_next = data.get("has_next", False)
                 page_count = 1
+                self.journal.record_position("glama_api", {"cursor": cursor, "has_next": has_next, "page": page_count})
+            else:
+                cursor, has_next, page_count = position["cursor"], position["has_next"], position["page"]
+                print(f"↩️  Resuming Glama API pagination after page {page_count}")
+
+            if cursor and has_next:
+                with tqdm(desc="📄 Glama API Pages", unit="page") as pbar:
+                    pbar.update(page_count)  # Pages already done
+
+                    while cursor and has_next and page_count < 1000:
+                        url = f"{api_url}?after={cursor}"
+                        try:
+                            response = await self._fetch(url)
+                            if response.status != 200:
+                                break
 
-                if cursor and has_next:
-                    with tqdm(desc="📄 Glama API Pages", unit="page") as pbar:
-                        pbar.update(1)  # First page already done
-
-                        while cursor and has_next and page_count < 1000:
-                            url = f"{api_url}?after={cursor}"
-                            try:
-                                async with self.session.get(url) as response:
-                                    if response.status != 200:
-                                        break
-
-                                    page_data = await response.json()
-                                    if not isinstance(page_data, dict):
-                                        break
-
-                                    # Process page servers
-                                    for server_data in page_data.get("servers", []):
-                                        server = self._process_glama_api_server(server_data)
-                                        if server:
-                                            servers.append(server)
-
-                                    # Update pagination info
-                                    cursor = page_data.get("cursor")
-                                    has_next = page_data.get("has_next", False)
-                                    page_count += 1
-                                    pbar.update(1)
-
-                                    # Rate limiting
-                                    await asyncio.sleep(0.5)
-
-                            except Exception:
+                            page_data = response.json()
+                            if not isinstance(page_data, dict):
                                 break
 
+                            # Process page servers
+                            process_page(page_count + 1, page_data.get("servers", []))
+
+                            # Update pagination info
+                            cursor = page_data.get("cursor")
+                            has_next = page_data.get("has_next", False)
+                            page_count += 1
+                            self.journal.record_position(
+                                "glama_api", {"cursor": cursor, "has_next": has_next, "page": page_count}
+                            )
+                            pbar.update(1)
+
+                            # Rate limiting
+                            await asyncio.sleep(0.5)
+
+                        except Exception:
+                            break
+
         except Exception:
             pass
 
-        return servers
+        return list(servers.values())
 
     def _process_glama_api_server(self, server_data: dict[str, Any]) -> MCPServer | None:
         """Process server data from Glama API."""
@@ -884,61 +1136,32 @@ class GlamaScraper(BaseScraper):
             while page <= 20:  # Limit to 20 pages per sort option
                 try:
                     url = f"{base_url}?sort={sort_by}&page={page}"
-                    async with self.session.get(url) as response:
-                        if response.status == 200:
-                            html = await response.text()
-                            soup = BeautifulSoup(html, "html.parser")
-
-                            # Find server elements
-                            server_elements = soup.find_all("div", class_="server-card")
-                            if not server_elements:
-                                break
+                    response = await self._fetch(url)
+                    if response.status == 200:
+                        # Find server elements
+                        cards = await self.parse_pool.run(parsers.parse_glama_cards, response.text())
+                        if not cards:
+                            break
 
-                            for element in server_elements:
-                                server = self._parse_glama_server_element(element)
-                                if server:
-                                    servers.append(server)
+                        for fields in cards:
+                            server = self._glama_server_from_card(fields)
+                            if server:
+                                servers.append(server)
 
-                            page += 1
-                        else:
-                            break
+                        page += 1
+                    else:
+                        break
 
                 except Exception:
                     break
 
         return servers
 
-    def _parse_glama_server_element(self, element) -> MCPServer | None:
-        """Parse a server element from Glama website."""
+    def _glama_server_from_card(self, fields: dict[str, Any]) -> MCPServer | None:
+        """Build a server from a parsed Glama website card."""
         try:
-            # Extract server name
-            name_elem = element.find("h3") or element.find("h2") or element.find("h1")
-            if not name_elem:
-                return None
-
-            name = name_elem.get_text(strip=True)
-            if not name:
-                return None
-
-            # Extract description
-            desc_elem = element.find("p") or element.find("div", class_="description")
-            description = desc_elem.get_text(strip=True) if desc_elem else ""
-
-            # Extract repository
-            repo_elem = element.find("a", href=re.compile(r"github\.com"))
-            repository = repo_elem.get("href") if repo_elem else None
-
-            # Extract author from repository
-            author = None
-            if repository and "github.com" in repository:
-                parts = repository.split("/")
-                if len(parts) >= 5:
-                    author = parts[3]
-
-            # Extract stats
-            # Note: These variables are intentionally unused for now
-            # star_elem = element.find(text=re.compile(r"star|★"))
-            # download_elem = element.find(text=re.compile(r"download|⬇"))
+            name = fields["name"]
+            description = fields["description"]
 
             server_id = f"glama_web_{name.lower().replace(' ', '_').replace('-', '_')}"
 
@@ -946,8 +1169,8 @@ class GlamaScraper(BaseScraper):
                 id=server_id,
                 name=name,
                 description=description,
-                author=author,
-                repository=repository,
+                author=fields["author"],
+                repository=fields["repository"],
                 categories=self.categorize_server({"name": name, "description": description}),
                 operations=self.determine_operations({"name": name, "description": description}),
                 registry_source=RegistrySource.GLAMA,
@@ -967,18 +1190,17 @@ class GlamaScraper(BaseScraper):
         }
 
         try:
-            async with self.session.get(search_url, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    for item in data.get("items", []):
-                        download_url = item.get("url")
-                        if download_url:
-                            async with self.session.get(download_url, headers=headers) as response:
-                                if response.status == 200:
-                                    glama_data = await response.json()
-                                    server = self._process_glama_json(glama_data)
-                                    if server:
-                                        servers.append(server)
+            # Both calls draw on the GitHub quota shared with the GitHub scraper
+            status, data = await self._github_request(search_url, headers)
+            if status == 200:
+                for item in data.get("items", []):
+                    download_url = item.get("url")
+                    if download_url:
+                        status, glama_data = await self._github_request(download_url, headers)
+                        if status == 200:
+                            server = self._process_glama_json(glama_data)
+                            if server:
+                                servers.append(server)
 
         except Exception:
             pass
@@ -1057,20 +1279,20 @@ class MCPMarketScraper(BaseScraper):
 
         for header in headers_list:
             try:
-                async with self.session.get(base_url, headers=header) as response:
-                    if response.status == 200:
-                        html = await response.text()
+                response = await self._fetch(base_url, headers=header)
+                if response.status == 200:
+                    html = response.text()
 
-                        # Check for security checkpoint
-                        if ("checking your browser" in html.lower() or
-                            "we're verifying your browser" in html.lower() or
-                            "data-astro-cid-nbv56vs3" in html or
-                            len(html) < 1000):  # Suspiciously small page
-                            continue
+                    # Check for security checkpoint
+                    if ("checking your browser" in html.lower() or
+                        "we're verifying your browser" in html.lower() or
+                        "data-astro-cid-nbv56vs3" in html or
+                        len(html) < 1000):  # Suspiciously small page
+                        continue
 
-                        servers = await self._parse_mcpmarket_html(html, base_url)
-                        if servers:
-                            return servers
+                    servers = await self._parse_mcpmarket_html(html, base_url)
+                    if servers:
+                        return servers
 
                 await asyncio.sleep(2)  # Rate limiting between attempts
 
@@ -1087,12 +1309,12 @@ class MCPMarketScraper(BaseScraper):
 
         for endpoint in api_endpoints:
             try:
-                async with self.session.get(endpoint) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        servers = await self._parse_mcpmarket_api(data)
-                        if servers:
-                            return servers
+                response = await self._fetch(endpoint)
+                if response.status == 200:
+                    data = response.json()
+                    servers = await self._parse_mcpmarket_api(data)
+                    if servers:
+                        return servers
             except Exception:
                 continue
 
@@ -1108,25 +1330,14 @@ class MCPMarketScraper(BaseScraper):
 
     async def _parse_mcpmarket_html(self, html: str, base_url: str) -> list[MCPServer]:
         """Parse HTML to extract MCP server information."""
-        servers = []
-
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, "html.parser")
-
-            # Look for server cards/containers
-            server_elements = (
-                soup.find_all("div", class_="server-card") or
-                soup.find_all("div", class_="server") or
-                soup.find_all("article") or
-                soup.find_all("div", class_="card")
-            )
+            cards = await self.parse_pool.run(parsers.parse_mcpmarket_cards, html)
 
             seen_names = set()
             unique_servers = []
 
-            for element in server_elements:
-                server = await self._parse_mcpmarket_element(element, base_url)
+            for fields in cards:
+                server = self._mcpmarket_server_from_card(fields, base_url)
                 if server and server.name not in seen_names:
                     unique_servers.append(server)
                     seen_names.add(server.name)
@@ -1136,32 +1347,11 @@ class MCPMarketScraper(BaseScraper):
         except Exception:
             return []
 
-    async def _parse_mcpmarket_element(self, element, base_url: str) -> MCPServer | None:
-        """Parse a single HTML element to extract server info."""
+    def _mcpmarket_server_from_card(self, fields: dict[str, Any], base_url: str) -> MCPServer | None:
+        """Build a server from a parsed MCP Market card."""
         try:
-            # Extract name
-            name_elem = element.find("h1") or element.find("h2") or element.find("h3")
-            if not name_elem:
-                return None
-
-            name = name_elem.get_text(strip=True)
-            if not name or len(name) < 2:
-                return None
-
-            # Extract description
-            desc_elem = element.find("p") or element.find("div", class_="description")
-            description = desc_elem.get_text(strip=True) if desc_elem else ""
-
-            # Extract repository
-            repo_elem = element.find("a", href=re.compile(r"github\.com"))
-            repository = repo_elem.get("href") if repo_elem else None
-
-            # Extract author from repository
-            author = None
-            if repository and "github.com" in repository:
-                parts = repository.split("/")
-                if len(parts) >= 5:
-                    author = parts[3]
+            name = fields["name"]
+            description = fields["description"]
 
             # Create temporary server ID (will be converted to global ID later)
             server_id = f"mcpmarket_{name.lower().replace(' ', '-').replace('_', '-')}"
@@ -1173,8 +1363,8 @@ class MCPMarketScraper(BaseScraper):
                 id=server_id,
                 name=name,
                 description=description,
-                author=author,
-                repository=repository,
+                author=fields["author"],
+                repository=fields["repository"],
                 categories=categories,
                 operations=self.determine_operations({"name": name, "description": description}),
                 registry_source=RegistrySource.MCP_MARKET,
@@ -1248,22 +1438,22 @@ class MCPMarketScraper(BaseScraper):
 
         for sitemap_url in sitemap_urls:
             try:
-                async with self.session.get(sitemap_url) as response:
-                    if response.status == 200:
-                        content = await response.text()
-
-                        if sitemap_url.endswith(".xml"):
-                            # Parse XML sitemap
-                            server_urls = re.findall(r"<loc>(.*?/server/.*?)</loc>", content)
-                            for _url in server_urls:
-                                # Could scrape individual server pages
-                                pass
-                        elif sitemap_url.endswith("robots.txt"):
-                            # Look for sitemap references
-                            sitemap_refs = re.findall(r"Sitemap: (.*)", content)
-                            for _ref in sitemap_refs:
-                                # Could recursively check sitemaps
-                                pass
+                response = await self._fetch(sitemap_url)
+                if response.status == 200:
+                    content = response.text()
+
+                    if sitemap_url.endswith(".xml"):
+                        # Parse XML sitemap
+                        server_urls = re.findall(r"<loc>(.*?/server/.*?)</loc>", content)
+                        for _url in server_urls:
+                            # Could scrape individual server pages
+                            pass
+                    elif sitemap_url.endswith("robots.txt"):
+                        # Look for sitemap references
+                        sitemap_refs = re.findall(r"Sitemap: (.*)", content)
+                        for _ref in sitemap_refs:
+                            # Could recursively check sitemaps
+                            pass
 
             except Exception:
                 continue
@@ -1279,6 +1469,13 @@ class ScrapingOrchestrator:
         self.config = ConfigManager(config_path)
         self.storage = StorageManager(self.config)
 
+        # One GitHub quota per token, so every scraper shares the same limiter
+        self.github_rate_limiter = GitHubRateLimiter()
+        # Registries scraped concurrently share one set of parser processes
+        self.parse_pool = parsers.ParsePool(
+            self.config.get("scraping.parse_workers"), self.config.get("scraping.parse_executor", "process")
+        )
+
         self.scrapers = {
             RegistrySource.GITHUB: GitHubScraper,
             RegistrySource.MCP_SO: MCPSoScraper,
@@ -1286,59 +1483,128 @@ class ScrapingOrchestrator:
             RegistrySource.MCP_MARKET: MCPMarketScraper,
         }
 
-    async def scrape_all(self, force_refresh: bool = False) -> list[RegistrySnapshot]:
-        """Scrape all configured registries."""
+    def get_concurrency_budget(self, registry: RegistrySource) -> int:
+        """Maximum number of simultaneous connections for one registry."""
+        default = self.config.get("scraping.max_concurrency_per_registry", 10)
+        return self.config.get(f"registries.{REGISTRY_CONFIG_KEYS[registry]}.max_concurrency", default)
+
+    def _get_cached_snapshot(self, registry: RegistrySource, force_refresh: bool) -> RegistrySnapshot | None:
+        """Return the latest snapshot if it is less than a day old."""
+        if force_refresh:
+            return None
+
+        # Check the age from the manifest so stale snapshots are never loaded
+        info = self.storage.latest_snapshot_info(registry)
+        if info and (datetime.now(tz=UTC) - datetime.fromisoformat(info["snapshot_date"])).days < 1:
+            return self.storage.load_latest_snapshot(registry)
+        return None
+
+    async def _scrape_fresh(self, registry: RegistrySource, resume: bool = False) -> RegistrySnapshot:
+        """Run a registry's scraper and persist the resulting snapshot.
+
+        Progress is checkpointed to a journal as the scraper goes. With
+        ``resume`` the latest unfinished journal is replayed first.
+        """
+        scraper_class = self.scrapers[registry]
+        budget = self.get_concurrency_budget(registry)
+        journal = ScrapeJournal.start(self.storage.get_registry_path(registry), resume)
+        if journal.resumed:
+            print(f"↩️  Resuming {registry.value} from {journal.path.name}")
+
+        try:
+            async with scraper_class(self.config, self.storage, max_concurrency=budget,
+                                     github_rate_limiter=self.github_rate_limiter,
+                                     parse_pool=self.parse_pool, journal=journal) as scraper:
+                snapshot = await scraper.scrape()
+        finally:
+            journal.close()
+
+        self.storage.save_snapshot(snapshot)
+        journal.complete()
+        return snapshot
+
+    async def scrape_registries(self, registries: list[RegistrySource], force_refresh: bool = False,
+                                concurrent: bool = True, resume: bool = False) -> list[RegistrySnapshot]:
+        """Scrape several registries, concurrently by default.
+
+        Each registry runs as its own task with its own connection budget. A
+        failing registry is reported and skipped without cancelling the others.
+        With ``resume``, registries with an unfinished journal pick up where
+        the interrupted run stopped. Snapshots are returned in the order of
+        ``registries``.
+        """
         overall_start = time.time()
-        snapshots = []
+        statuses = {registry.value: "queued" for registry in registries}
+        durations: dict[str, float] = {}
 
-        with tqdm(total=len(self.scrapers), desc="📦 Registry Progress", unit="registry") as pbar:
-            for registry, scraper_class in self.scrapers.items():
-                registry_start = time.time()
-                pbar.set_postfix_str(f"Processing {registry.value}")
+        with tqdm(total=len(registries), desc="📦 Registry Progress", unit="registry", position=0) as pbar:
 
+            def show_statuses():
+                pbar.set_postfix_str(" | ".join(f"{name}: {status}" for name, status in statuses.items()))
+
+            async def run(registry: RegistrySource) -> RegistrySnapshot | None:
+                registry_start = time.time()
                 try:
-                    # Check if we need to scrape
-                    if not force_refresh:
-                        latest = self.storage.load_latest_snapshot(registry)
-                        if latest and (datetime.now(tz=UTC) - latest.snapshot_date).days < 1:
-                            elapsed = datetime.now(tz=UTC) - latest.snapshot_date
-                            pbar.set_postfix_str(f"Using cache ({elapsed.seconds//3600}h old)")
-                            snapshots.append(latest)
-                            pbar.update(1)
-                            continue
+                    # An interrupted run takes precedence over a cached snapshot
+                    resuming = resume and ScrapeJournal.latest(self.storage.get_registry_path(registry))
+                    snapshot = None if resuming else self._get_cached_snapshot(registry, force_refresh)
+                    if snapshot:
+                        age = datetime.now(tz=UTC) - snapshot.snapshot_date
+                        statuses[registry.value] = f"cache ({age.seconds//3600}h old)"
+                        return snapshot
+
+                    statuses[registry.value] = "↩️ resuming" if resuming else "⏳ scraping"
+                    show_statuses()
+                    snapshot = await self._scrape_fresh(registry, resume)
+                    durations[registry.value] = time.time() - registry_start
+                    statuses[registry.value] = f"✅ {snapshot.servers_count} ({durations[registry.value]:.0f}s)"
+                    return snapshot
 
-                    async with scraper_class(self.config, self.storage) as scraper:
-                        snapshot = await scraper.scrape()
-                        self.storage.save_snapshot(snapshot)
-                        snapshots.append(snapshot)
+                except Exception as e:
+                    statuses[registry.value] = f"❌ {str(e)[:30]}"
+                    return None
 
-                    registry_time = time.time() - registry_start
-                    pbar.set_postfix_str(f"✅ {snapshot.servers_count} servers ({registry_time:.1f}s)")
+                finally:
+                    pbar.update(1)
+                    show_statuses()
 
-                except Exception as e:
-                    pbar.set_postfix_str(f"❌ Error: {str(e)[:30]}...")
+            show_statuses()
+            try:
+                if concurrent:
+                    results = await asyncio.gather(*(run(registry) for registry in registries))
+                else:
+                    results = [await run(registry) for registry in registries]
+            finally:
+                self.parse_pool.close()
 
-                pbar.update(1)
+        snapshots = [snapshot for snapshot in results if snapshot is not None]
 
         overall_time = time.time() - overall_start
         total_servers = sum(s.servers_count for s in snapshots)
+        print(f"✅ Scraped {len(snapshots)}/{len(registries)} registries ({total_servers:,} servers) in {overall_time:.1f}s")
+        if durations:
+            slowest, slowest_time = max(durations.items(), key=lambda item: item[1])
+            print(f"   • Slowest registry: {slowest} ({slowest_time:.1f}s), "
+                  f"sum of registry times: {sum(durations.values()):.1f}s")
+        for name, status in statuses.items():
+            if status.startswith("❌"):
+                print(f"   • {name} failed: {status[2:]}")
 
         return snapshots
 
+    async def scrape_all(self, force_refresh: bool = False, concurrent: bool = True,
+                         resume: bool = False) -> list[RegistrySnapshot]:
+        """Scrape all configured registries."""
+        return await self.scrape_registries(list(self.scrapers), force_refresh, concurrent, resume)
+
     async def scrape_registry(self, registry: RegistrySource, force_refresh: bool = False) -> RegistrySnapshot | None:
         """Scrape a specific registry."""
         if registry not in self.scrapers:
             error_msg = f"Unknown registry: {registry}"
             raise ValueError(error_msg)
 
-        if not force_refresh:
-            latest = self.storage.load_latest_snapshot(registry)
-            if latest and (datetime.now(tz=UTC) - latest.snapshot_date).days < 1:
-                return latest
-
-        scraper_class = self.scrapers[registry]
+        latest = self._get_cached_snapshot(registry, force_refresh)
+        if latest:
+            return latest
 
-        async with scraper_class(self.config, self.storage) as scraper:
-            snapshot = await scraper.scrape()
-            self.storage.save_snapshot(snapshot)
-            return snapshot
+        return await self._scrape_fresh(registry)
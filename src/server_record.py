@@ -0,0 +1,124 @@
+"""Compact per-server records for the deduplication and inference hot paths.
+
+``ServerDeduplicator`` and ``RelationshipInferencer`` compare servers pairwise
+and only look at a handful of derived values: normalized names, the
+repository, category and operation sets, the language and the start of the
+description. Deriving those from an ``MCPServer`` on every comparison means
+re-normalizing strings, re-parsing URLs and building sets in the inner loop.
+A ``ServerRecord`` derives them once into slots, with categories and
+operations as bitmasks, and keeps a reference to its server for merging and
+for building output.
+"""
+
+import hashlib
+import re
+import sys
+from urllib.parse import urlparse
+
+from models import MCPServer, OperationType, ServerCategory
+
+CATEGORY_BITS = {category: 1 << i for i, category in enumerate(ServerCategory)}
+OPERATION_BITS = {operation: 1 << i for i, operation in enumerate(OperationType)}
+
+_NON_ALPHANUMERIC = re.compile(r"[^a-z0-9\s]")
+_WHITESPACE = re.compile(r"\s+")
+_MCP_PREFIX = re.compile(r"^(mcp[-_\s]*)?")
+_SERVER_SUFFIX = re.compile(r"[-_\s]*(server|mcp)$")
+
+
+def normalize_name(name: str | None) -> str:
+    """Normalize a server or author name for comparison"""
+    if not name:
+        return ""
+
+    # Convert to lowercase, remove special chars, normalize spaces
+    normalized = _NON_ALPHANUMERIC.sub("", name.lower())
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+
+    # Remove common prefixes/suffixes
+    normalized = _MCP_PREFIX.sub("", normalized)
+    return _SERVER_SUFFIX.sub("", normalized)
+
+
+def normalize_repository_url(url: str) -> str:
+    """Normalize a repository URL to domain + path for comparison"""
+    # Remove trailing slashes, .git suffix, and normalize case
+    url = url.lower().rstrip("/").removesuffix(".git")
+
+    # Parse URL to get clean domain + path
+    parsed = urlparse(url)
+    return f"{parsed.netloc}{parsed.path}"
+
+
+def mask_members(mask: int, bits: dict) -> list:
+    """The enum members whose bits are set in ``mask``, in definition order"""
+    return [member for member, bit in bits.items() if mask & bit]
+
+
+class ServerRecord:
+    """The fields of an ``MCPServer`` that matching and inference compare
+
+    Optional values are None when the server's field is empty, so "both
+    present" checks stay the same as on the server itself.
+    """
+
+    __slots__ = (
+        "server", "id", "registry_source",
+        "name_key", "author", "author_key",
+        "repo_key", "repo_domain", "repo_owner",
+        "category_mask", "category_count", "operation_mask", "operation_count",
+        "language", "description", "description_prefix", "content_hash",
+    )
+
+    def __init__(self, server: MCPServer):
+        self.server = server
+        self.id = server.id
+        self.registry_source = server.registry_source
+        self.refresh()
+
+    def refresh(self):
+        """Re-derive the record after its server was changed (e.g. by a merge)"""
+        server = self.server
+
+        self.name_key = normalize_name(server.name) if server.name else None
+        self.author = server.author or None
+        self.author_key = normalize_name(server.author) if server.author else None
+
+        if server.repository:
+            repository = str(server.repository)
+            parts = repository.split("/")
+            self.repo_key = normalize_repository_url(repository)
+            self.repo_domain = urlparse(repository).netloc
+            self.repo_owner = parts[3] if len(parts) >= 4 else None
+        else:
+            self.repo_key = self.repo_domain = self.repo_owner = None
+
+        self.category_mask = 0
+        for category in server.categories:
+            self.category_mask |= CATEGORY_BITS[category]
+        self.category_count = len(server.categories)
+        self.operation_mask = 0
+        for operation in server.operations:
+            self.operation_mask |= OPERATION_BITS[operation]
+        self.operation_count = len(server.operations)
+
+        self.language = sys.intern(server.implementation_language) if server.implementation_language else None
+
+        description = server.description.lower() if server.description else None
+        self.description = description
+        self.description_prefix = description[:100] if description else None
+
+        content_parts = [
+            self.name_key or "",
+            self.author_key or "",
+            (description or "")[:200],  # First 200 chars
+            str(sorted(cat.value for cat in server.categories)),
+            str(sorted(op.value for op in server.operations)),
+        ]
+        self.content_hash = hashlib.md5("|".join(content_parts).encode()).hexdigest()
+
+    @property
+    def name_author_key(self) -> str | None:
+        if self.name_key is None or self.author_key is None:
+            return None
+        return f"{self.name_key}|{self.author_key}"
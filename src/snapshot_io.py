@@ -0,0 +1,305 @@
+"""Streaming registry snapshot files.
+
+Snapshots are stored as NDJSON: one header line with the snapshot's fields,
+then one compact JSON server per line. Writing never holds more than one
+serialized server in memory, and readers can yield servers one at a time
+instead of loading the whole file. Snapshots saved before this format, a single
+indented JSON document, can still be read.
+
+Each registry directory also keeps a ``manifest.json`` listing its snapshots
+(file, date, server count, size, checksum). Finding the latest snapshot or
+checking how fresh it is reads only the manifest, however many old snapshots
+have piled up.
+"""
+
+import gc
+import hashlib
+import json
+import os
+import shutil
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+
+from blob_store import BlobStore
+from models import MCPServer, RegistrySnapshot, RegistrySource
+
+SNAPSHOT_FORMAT = "askg-snapshot-ndjson"
+SNAPSHOT_SUFFIXES = (".ndjson", ".json")
+MANIFEST_NAME = "manifest.json"
+
+
+@contextmanager
+def paused_gc():
+    """Suspend cyclic garbage collection while loading servers in bulk.
+
+    Hydrating tens of thousands of servers allocates millions of dicts and
+    lists. Every collection pass they trigger rescans all of them, which
+    costs more than parsing and validating the data in the first place.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def find_snapshot_files(registry_dir: Path) -> list[Path]:
+    """Snapshot files of a registry in either format."""
+    registry_dir = Path(registry_dir)
+    return [
+        path for suffix in SNAPSHOT_SUFFIXES for path in registry_dir.glob(f"*{suffix}")
+        if path.name != MANIFEST_NAME
+    ]
+
+
+def _write_manifest(registry_dir: Path, manifest: dict[str, Any]):
+    path = Path(registry_dir) / MANIFEST_NAME
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def read_manifest(registry_dir: Path) -> dict[str, Any]:
+    """The registry's manifest, ``{"snapshots": [...]}`` oldest first."""
+    try:
+        with open(Path(registry_dir) / MANIFEST_NAME) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {"snapshots": []}
+
+
+def record_snapshot(registry_dir: Path, entry: dict[str, Any]):
+    """Add (or replace) a snapshot's manifest entry and save the manifest atomically."""
+    manifest = read_manifest(registry_dir)
+    snapshots = [e for e in manifest["snapshots"] if e["file"] != entry["file"]]
+    snapshots.append(entry)
+    manifest["snapshots"] = snapshots
+    _write_manifest(registry_dir, manifest)
+
+
+def _manifest_entry(path: Path, header: dict[str, Any], written_at: float) -> dict[str, Any]:
+    return {
+        "file": path.name,
+        "snapshot_date": header.get("snapshot_date"),
+        "servers_count": header.get("servers_count"),
+        "bytes": path.stat().st_size,
+        "checksum": header.get("checksum"),
+        "written_at": written_at,
+    }
+
+
+def rebuild_manifest(registry_dir: Path) -> dict[str, Any]:
+    """Recreate the manifest from the snapshot files themselves.
+
+    Only needed for directories written before manifests existed, or if the
+    manifest has gone out of step with the files.
+    """
+    files = sorted(find_snapshot_files(registry_dir), key=lambda p: p.stat().st_mtime)
+    manifest = {
+        "snapshots": [_manifest_entry(path, read_snapshot_header(path), path.stat().st_mtime) for path in files]
+    }
+    _write_manifest(registry_dir, manifest)
+    return manifest
+
+
+def latest_snapshot_entry(registry_dir: Path) -> dict[str, Any] | None:
+    """Manifest entry of the most recently written snapshot of a registry."""
+    registry_dir = Path(registry_dir)
+    if not (registry_dir / MANIFEST_NAME).exists():
+        snapshots = rebuild_manifest(registry_dir)["snapshots"]
+    else:
+        snapshots = read_manifest(registry_dir)["snapshots"]
+        if snapshots and not (registry_dir / snapshots[-1]["file"]).exists():
+            snapshots = rebuild_manifest(registry_dir)["snapshots"]
+    return snapshots[-1] if snapshots else None
+
+
+def latest_snapshot_file(registry_dir: Path) -> Path | None:
+    """Most recently written snapshot file of a registry."""
+    entry = latest_snapshot_entry(registry_dir)
+    return Path(registry_dir) / entry["file"] if entry else None
+
+
+class SnapshotWriter:
+    """Writes a snapshot server by server.
+
+    Servers go to a ``.part`` file as they arrive. ``close()`` prepends the
+    header (which needs the final count and checksum) and moves the result
+    into place atomically, so readers never see a half-written snapshot.
+    With ``blobs`` each server's ``raw_metadata`` is moved into the blob
+    store and only its reference is written.
+    """
+
+    def __init__(self, path: Path, registry_source: RegistrySource, snapshot_date: datetime,
+                 url: str | None = None, metadata: dict[str, Any] | None = None,
+                 blobs: BlobStore | None = None):
+        self.path = Path(path)
+        self.blobs = blobs
+        self.registry_source = registry_source
+        self.snapshot_date = snapshot_date
+        self.url = url
+        self.metadata = metadata
+        self.servers_count = 0
+
+        self._part_path = self.path.with_name(self.path.name + ".part")
+        self._part = open(self._part_path, "wb")
+        self._hash = hashlib.sha256()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, server: MCPServer):
+        if self.blobs:
+            self.blobs.offload(server)
+        line = server.model_dump_json().encode() + b"\n"
+        self._part.write(line)
+        self._hash.update(line)
+        self.servers_count += 1
+
+    def header(self) -> dict[str, Any]:
+        return {
+            "format": SNAPSHOT_FORMAT,
+            "version": 1,
+            "registry_source": self.registry_source.value,
+            "snapshot_date": self.snapshot_date.isoformat(),
+            "url": str(self.url) if self.url else None,
+            "servers_count": self.servers_count,
+            "metadata": self.metadata,
+            # Covers the server lines, so readers can check the body is intact
+            "checksum": self._hash.hexdigest(),
+        }
+
+    def close(self) -> Path:
+        self._part.close()
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "wb") as out, open(self._part_path, "rb") as body:
+            out.write(json.dumps(self.header(), default=str).encode() + b"\n")
+            shutil.copyfileobj(body, out)
+        os.replace(tmp_path, self.path)
+        self._part_path.unlink()
+        record_snapshot(self.path.parent, _manifest_entry(self.path, self.header(), time.time()))
+        return self.path
+
+    def abort(self):
+        self._part.close()
+        self._part_path.unlink(missing_ok=True)
+
+
+def write_snapshot(snapshot: RegistrySnapshot, path: Path, blobs: BlobStore | None = None) -> Path:
+    """Save a complete in-memory snapshot in the streaming format."""
+    with SnapshotWriter(path, snapshot.registry_source, snapshot.snapshot_date,
+                        snapshot.url, snapshot.metadata, blobs) as writer:
+        for server in snapshot.servers:
+            writer.write(server)
+    snapshot.checksum = writer.header()["checksum"]
+    return path
+
+
+def _is_legacy(path: Path) -> bool:
+    return Path(path).suffix == ".json"
+
+
+def read_snapshot_header(path: Path) -> dict[str, Any]:
+    """Snapshot fields other than the servers."""
+    if _is_legacy(path):
+        with open(path) as f:
+            data = json.load(f)
+        data.pop("servers", None)
+        return data
+
+    with open(path) as f:
+        return json.loads(f.readline())
+
+
+def iter_snapshot_server_dicts(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield raw server dicts one at a time."""
+    if _is_legacy(path):
+        with open(path) as f:
+            yield from json.load(f).get("servers", [])
+        return
+
+    with open(path) as f:
+        f.readline()  # header
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def snapshot_body_ranges(path: Path, chunk_bytes: int) -> list[tuple[int, int]]:
+    """Split the server lines of a snapshot into byte ranges of about ``chunk_bytes``.
+
+    Each range can be read with ``iter_snapshot_servers(byte_range=...)``
+    independently of the others. Legacy snapshots are one range.
+    """
+    size = Path(path).stat().st_size
+    if _is_legacy(path):
+        return [(0, size)]
+    with open(path, "rb") as f:
+        body_start = len(f.readline())
+    bounds = list(range(body_start, size, max(chunk_bytes, 1))) + [size]
+    return list(zip(bounds, bounds[1:])) or [(body_start, size)]
+
+
+def iter_snapshot_servers(path: Path, skip_invalid: bool = False,
+                          byte_range: tuple[int, int] | None = None) -> Iterator[MCPServer]:
+    """Yield ``MCPServer`` objects lazily.
+
+    NDJSON lines go straight to pydantic's JSON validator, which is faster
+    than ``json.loads`` followed by ``MCPServer(**data)``. With
+    ``skip_invalid`` servers that fail validation are left out. With
+    ``byte_range`` only the servers whose lines start inside it are read.
+    """
+    if _is_legacy(path):
+        records, hydrate = iter_snapshot_server_dicts(path), MCPServer.model_validate
+    else:
+        records, hydrate = _iter_body_lines(path, byte_range), MCPServer.model_validate_json
+
+    for record in records:
+        try:
+            yield hydrate(record)
+        except ValidationError:
+            if not skip_invalid:
+                raise
+
+
+def _iter_body_lines(path: Path, byte_range: tuple[int, int] | None = None) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        if byte_range is None:
+            f.readline()  # header
+            end = None
+        else:
+            start, end = byte_range
+            # Finish the line running into the range; it belongs to the previous one
+            f.seek(start - 1)
+            f.readline()
+        while end is None or f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            if line.strip():
+                yield line
+
+
+def load_snapshot(path: Path) -> RegistrySnapshot:
+    """Load a whole snapshot file in either format."""
+    header = read_snapshot_header(path)
+    header.pop("format", None)
+    header.pop("version", None)
+    with paused_gc():
+        servers = list(iter_snapshot_servers(path))
+    return RegistrySnapshot(**header, servers=servers)
@@ -0,0 +1,35 @@
+"""
+Shared fixtures for the scraper and storage tests
+"""
+
+import pytest
+import yaml
+
+from scrapers import ConfigManager
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    return tmp_path / "config.yaml"
+
+
+@pytest.fixture
+def make_config(tmp_path, config_path):
+    """Factory for a ConfigManager with all storage under tmp_path
+
+    Keyword arguments are per-registry settings, e.g.
+    ``make_config(github={"enrichment_workers": 4})``.
+    """
+
+    def make(**registries) -> ConfigManager:
+        config = {"storage": {
+            "base_path": str(tmp_path),
+            "registries_path": str(tmp_path / "registries"),
+            "snapshots_path": str(tmp_path / "snapshots"),
+        }}
+        if registries:
+            config["registries"] = registries
+        config_path.write_text(yaml.safe_dump(config))
+        return ConfigManager(str(config_path))
+
+    return make
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test vectorized TF-IDF similarity scoring for the deduplication merge pass
+"""
+
+import pytest
+
+from batch_similarity import VECTOR_SCORING_AVAILABLE
+from deduplication import MERGE_SCORE_THRESHOLD, SIMILAR_SCORE_THRESHOLD, ServerDeduplicator
+from models import MCPServer, RegistrySource, ServerCategory
+from server_record import ServerRecord
+
+
+def make_server(server_id, name, registry, **fields):
+    return MCPServer(id=server_id, name=name, registry_source=registry, **fields)
+
+
+SERVERS = [
+    make_server("github:1", "weather forecast", RegistrySource.GITHUB, author="jo", description="Weather forecasts",
+                repository="https://github.com/jo/weather-forecast", categories=[ServerCategory.AI_ML],
+                implementation_language="python"),
+    make_server("glama:1", "weather forecasts", RegistrySource.GLAMA, author="jo", description="Weather forecasts",
+                repository="https://github.com/jo/forecasts", categories=[ServerCategory.AI_ML],
+                implementation_language="python"),
+    make_server("github:2", "weather forecaster", RegistrySource.GITHUB, author="jo", description="Weather forecasts",
+                repository="https://github.com/jo/forecaster", categories=[ServerCategory.AI_ML]),
+    make_server("mcp.so:1", "stock prices", RegistrySource.MCP_SO, author="sam", description="Stock market quotes",
+                repository="https://github.com/sam/stocks"),
+]
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        ServerDeduplicator(scoring_backend="cosine")
+
+
+@pytest.mark.skipif(VECTOR_SCORING_AVAILABLE, reason="NumPy and SciPy are installed")
+def test_tfidf_backend_falls_back_without_numpy():
+    assert ServerDeduplicator(scoring_backend="tfidf").scoring_backend == "sequence"
+
+
+@pytest.mark.skipif(not VECTOR_SCORING_AVAILABLE, reason="NumPy and SciPy are not installed")
+def test_tfidf_scores_follow_pairwise_scores():
+    from batch_similarity import TfidfScorer, tfidf_matrix
+
+    names = tfidf_matrix(["weather", "weather", "stocks", None])
+    assert TfidfScorer._cosines(names, [0, 0, 0], [1, 2, 3]).round(6).tolist() == [1.0, 0.0, 0.0]
+
+    deduplicator = ServerDeduplicator()
+    records = [ServerRecord(server) for server in SERVERS]
+    scorer = TfidfScorer(records)
+    pairs = [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3)]
+    left = [i for i, _ in pairs]
+    right = [j for _, j in pairs]
+
+    assert scorer.highly_similar(left, right, SIMILAR_SCORE_THRESHOLD, MERGE_SCORE_THRESHOLD) == [
+        deduplicator._servers_are_highly_similar(records[i], records[j]) for i, j in pairs
+    ]
+    merge_scores = scorer.merge_scores(left, right)
+    pairwise = [deduplicator._calculate_similarity_score(records[i], records[j]) for i, j in pairs]
+    assert merge_scores.tolist() == pytest.approx(pairwise, abs=0.1)
+
+
+@pytest.mark.skipif(not VECTOR_SCORING_AVAILABLE, reason="NumPy and SciPy are not installed")
+def test_tfidf_backend_merges_like_sequence_backend():
+    sequence = ServerDeduplicator().deduplicate_servers([server.model_copy(deep=True) for server in SERVERS])
+    tfidf = ServerDeduplicator(scoring_backend="tfidf").deduplicate_servers(
+        [server.model_copy(deep=True) for server in SERVERS])
+
+    assert [s.id for s in tfidf] == [s.id for s in sequence]
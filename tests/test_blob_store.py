@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test the content-addressed raw_metadata blob store
+"""
+
+from datetime import datetime
+
+import pytest
+
+from blob_store import BlobStore
+from models import MCPServer, RegistrySnapshot, RegistrySource
+from scrapers import StorageManager
+from snapshot_io import iter_snapshot_server_dicts
+
+
+def make_repo(i):
+    return {
+        "full_name": f"acme/server-{i}",
+        "owner": {"login": "acme", "avatar_url": "https://avatars.example.com/acme"},
+        "stargazers_count": i,
+        "topics": ["mcp", "server"],
+        **{f"{name}_url": f"https://api.github.com/repos/acme/server-{i}/{name}" for name in
+           ["forks", "keys", "hooks", "issues", "pulls", "tags", "branches", "releases", "commits", "contents"]},
+    }
+
+
+def test_put_get_and_dedup(tmp_path):
+    store = BlobStore(tmp_path / "blobs")
+
+    ref = store.put({"b": 1, "a": [1, 2]})
+    assert store.put({"a": [1, 2], "b": 1}) == ref  # key order doesn't matter
+    assert ref in store
+    assert store.get(ref) == {"a": [1, 2], "b": 1}
+    assert len(list((tmp_path / "blobs").rglob("*.json.z"))) == 1
+
+    with pytest.raises(KeyError):
+        store.get("0" * 64)
+
+
+def test_snapshots_store_references(make_config):
+    storage = StorageManager(make_config())
+
+    servers = [
+        MCPServer(id=f"github:acme/server-{i}", name=f"server-{i}", registry_source=RegistrySource.GITHUB,
+                  raw_metadata=make_repo(i))
+        for i in range(3)
+    ]
+    path = storage.save_snapshot(RegistrySnapshot(registry_source=RegistrySource.GITHUB,
+                                                  snapshot_date=datetime(2025, 6, 1), servers_count=3, servers=servers))
+
+    records = list(iter_snapshot_server_dicts(path))
+    assert all(record["raw_metadata"] is None and record["raw_metadata_ref"] for record in records)
+
+    loaded = list(storage.iter_latest_servers(RegistrySource.GITHUB))
+    assert storage.blobs.raw_metadata(loaded[1]) == make_repo(1)
+
+    # Small inline additions are kept alongside the stored payload
+    loaded[1].raw_metadata = {"github_id": "acme/server-1"}
+    assert storage.blobs.raw_metadata(loaded[1]) == {**make_repo(1), "github_id": "acme/server-1"}
+
+    # Saving the same payloads again adds no blobs
+    storage.save_snapshot(RegistrySnapshot(registry_source=RegistrySource.GITHUB, snapshot_date=datetime(2025, 6, 2),
+                                           servers_count=1, servers=[MCPServer(
+                                               id="x", name="x", registry_source=RegistrySource.GITHUB,
+                                               raw_metadata=make_repo(0))]))
+    assert len(list(storage.blobs.root.rglob("*.json.z"))) == 3
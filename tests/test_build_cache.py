@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test the content-keyed pipeline build cache
+"""
+
+import os
+from datetime import datetime
+
+from pydantic import TypeAdapter
+
+from build_cache import BuildCache, cache_key, code_version, registry_checksums
+from models import MCPServer, RegistrySnapshot, RegistrySource
+from snapshot_io import write_snapshot
+
+SERVER_LIST = TypeAdapter(list[MCPServer])
+
+
+def write_registry(registries_path, servers, timestamp):
+    registry_dir = registries_path / "github"
+    registry_dir.mkdir(parents=True, exist_ok=True)
+    snapshot = RegistrySnapshot(registry_source=RegistrySource.GITHUB, snapshot_date=datetime(2025, 6, 1),
+                                servers_count=len(servers), servers=servers)
+    return write_snapshot(snapshot, registry_dir / f"github_{timestamp}.ndjson")
+
+
+def make_servers(*names):
+    return [MCPServer(id=name, name=name, registry_source=RegistrySource.GITHUB) for name in names]
+
+
+def test_registry_checksums_follow_content_not_mtime(tmp_path):
+    path = write_registry(tmp_path, make_servers("a", "b"), "20250601_000000")
+    checksums = registry_checksums(tmp_path)
+
+    os.utime(path, (0, 0))
+    assert registry_checksums(tmp_path) == checksums
+
+    # A new scrape with identical contents keeps the key
+    write_registry(tmp_path, make_servers("a", "b"), "20250602_000000")
+    assert registry_checksums(tmp_path) == checksums
+
+    write_registry(tmp_path, make_servers("a", "c"), "20250603_000000")
+    assert registry_checksums(tmp_path) != checksums
+
+
+def test_code_version_tracks_source():
+    def dedup_v1(servers):
+        return servers
+
+    def dedup_v2(servers):
+        return servers[:1]
+
+    assert code_version(dedup_v1) == code_version(dedup_v1)
+    assert code_version(dedup_v1) != code_version(dedup_v2)
+
+
+def test_stage_outputs(tmp_path):
+    cache = BuildCache(tmp_path)
+    key = cache_key({"github": "abc"}, "v1")
+    servers = make_servers("a", "b")
+
+    assert cache.load_output("dedup", key, SERVER_LIST) is None
+    cache.save_output("dedup", key, SERVER_LIST, servers)
+    assert cache.load_output("dedup", key, SERVER_LIST) == servers
+    assert BuildCache(tmp_path).key_of("dedup") == key
+
+    # A new key replaces the stage's previous output
+    new_key = cache_key({"github": "abd"}, "v1")
+    cache.save_output("dedup", new_key, SERVER_LIST, servers[:1])
+    assert cache.load_output("dedup", key, SERVER_LIST) is None
+    assert len(list((tmp_path / "dedup").iterdir())) == 1
+
+    cache.put("load:local", new_key, {"servers": 1})
+    assert cache.get("load:local", new_key) == {"servers": 1}
+    assert cache.get("load:local", key) is None
+    assert cache.last_output("load:local") == {"servers": 1}
+
+
+def test_pipelines_keep_their_own_dedup_stage(tmp_path):
+    # main.py and load_to_neo4j.py share data/build_cache
+    cache = BuildCache(tmp_path)
+    servers = make_servers("a", "b")
+    snapshots_key, master_key = cache_key("snapshots"), cache_key("master")
+
+    cache.put("dedup:master", master_key, {"master_file": "deduplicated_servers_1.json"})
+    cache.save_output("dedup:snapshots", snapshots_key, SERVER_LIST, servers)
+
+    assert cache.get("dedup:master", master_key) == {"master_file": "deduplicated_servers_1.json"}
+    assert cache.load_output("dedup:snapshots", snapshots_key, SERVER_LIST) == servers
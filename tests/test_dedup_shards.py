@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Test partitioning of deduplication input into independent shards
+"""
+
+from dedup_shards import DisjointSet, dedup_components, init_name_links, pack_shards
+from deduplication import FUZZY_NAME_THRESHOLD, MERGE_NAME_THRESHOLD, ServerDeduplicator
+from models import MCPServer, RegistrySource
+from server_record import ServerRecord
+
+
+class InlineExecutor:
+    def map(self, fn, *iterables):
+        return map(fn, *iterables)
+
+
+def make_record(server_id, name, registry=RegistrySource.GITHUB, **fields):
+    return ServerRecord(MCPServer(id=server_id, name=name, registry_source=registry, **fields))
+
+
+def test_disjoint_set():
+    components = DisjointSet(5)
+    components.union(3, 1)
+    components.union(4, 3)
+    assert components.find(4) == components.find(1) == 1
+    assert components.find(0) == 0 and components.find(2) == 2
+
+
+def test_components_follow_keys_and_names():
+    records = [
+        make_record("a", "postgres", repository="https://github.com/acme/pg"),
+        make_record("b", "pg tools", RegistrySource.GLAMA, repository="https://github.com/acme/pg.git"),
+        make_record("c", "postgresql"),  # Fuzzy match for "postgres"
+        make_record("d", "weather", author="jo", repository="https://github.com/jo/weather"),
+        # Names close enough for the similarity merge with "d", which needs another registry
+        make_record("e", "weatherapi", author="jo", repository="https://github.com/jo/weatherapi"),
+        make_record("f", "weathernow", RegistrySource.GLAMA, author="jo", repository="https://github.com/jo/now"),
+        make_record("g", "slack"),
+    ]
+    names = list(dict.fromkeys(record.name_key or "" for record in records))
+    init_name_links(names, MERGE_NAME_THRESHOLD, FUZZY_NAME_THRESHOLD)
+
+    components = dedup_components(records, names, InlineExecutor(), 2, ServerDeduplicator._could_merge)
+
+    assert sorted(components) == [[0, 1, 2], [3, 5], [4], [6]]
+
+
+def test_pack_shards_balances_components():
+    shards = pack_shards([[0, 4, 5, 6], [1], [2, 7], [3]], 2)
+    assert sorted(shards) == [[0, 4, 5, 6], [1, 2, 3, 7]]
+    assert pack_shards([[1], [0]], 8) == [[1], [0]]
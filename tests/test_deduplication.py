@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Test server deduplication and relationship inference on compact records
+"""
+
+import pytest
+
+from dedup_state import DedupState, member_key
+from deduplication import ServerDeduplicator
+from models import MCPServer, OperationType, RegistrySource, RelationshipType, ServerCategory
+from neo4j_integration import RelationshipInferencer
+from server_record import CATEGORY_BITS, ServerRecord, mask_members
+
+
+def make_server(server_id, name, registry=RegistrySource.GITHUB, **fields):
+    return MCPServer(id=server_id, name=name, registry_source=registry, **fields)
+
+
+def test_record_fields():
+    server = make_server("a", "MCP Postgres Server", author="Acme", description="Query Postgres",
+                         repository="https://github.com/Acme/postgres-mcp.git/",
+                         categories=[ServerCategory.DATABASE, ServerCategory.SEARCH, ServerCategory.DATABASE],
+                         operations=[OperationType.QUERY])
+    record = ServerRecord(server)
+
+    assert record.name_key == "postgres"
+    assert record.name_author_key == "postgres|acme"
+    assert record.repo_key == "github.com/acme/postgres-mcp"
+    assert record.repo_owner == "Acme"
+    assert mask_members(record.category_mask, CATEGORY_BITS) == [ServerCategory.DATABASE, ServerCategory.SEARCH]
+    assert record.category_count == 3
+    assert record.description_prefix == "query postgres"
+    assert record.server is server
+
+    # Empty fields stay distinguishable from fields that normalize to nothing
+    bare = ServerRecord(make_server("b", "!!!"))
+    assert bare.name_key == ""
+    assert bare.author_key is None and bare.repo_key is None and bare.language is None
+
+
+def test_deduplicates_and_merges_metadata():
+    servers = [
+        make_server("github:1", "postgres-mcp", repository="https://github.com/acme/postgres-mcp",
+                    categories=[ServerCategory.DATABASE], popularity_score=5),
+        # Same repository, spelled differently
+        make_server("glama:1", "Postgres MCP", RegistrySource.GLAMA, repository="https://github.com/ACME/postgres-mcp.git",
+                    description="Query Postgres", categories=[ServerCategory.SEARCH], popularity_score=9),
+        # Same name and author, no repository
+        make_server("mcp.so:1", "weather", RegistrySource.MCP_SO, author="jo"),
+        make_server("glama:2", "Weather Server", RegistrySource.GLAMA, author="Jo"),
+        make_server("github:2", "slack", repository="https://github.com/other/slack"),
+    ]
+
+    unique = ServerDeduplicator().deduplicate_servers(servers)
+
+    assert [s.id for s in unique] == ["github:1", "mcp.so:1", "github:2"]
+    assert set(unique[0].categories) == {ServerCategory.DATABASE, ServerCategory.SEARCH}
+    assert unique[0].description == "Query Postgres"
+    assert unique[0].popularity_score == 9
+
+
+def test_inferred_relationships():
+    servers = [
+        make_server("a", "a", author="jo", implementation_language="python",
+                    categories=[ServerCategory.DATABASE, ServerCategory.SEARCH],
+                    operations=[OperationType.READ, OperationType.QUERY]),
+        make_server("b", "b", author="jo", implementation_language="python", categories=[ServerCategory.DATABASE],
+                    operations=[OperationType.READ, OperationType.QUERY, OperationType.WRITE]),
+        make_server("c", "c", author="sam", categories=[ServerCategory.AI_ML]),
+    ]
+
+    relationships = RelationshipInferencer(None).infer_all_relationships(servers)
+
+    assert [(r.id, r.relationship_type) for r in relationships] == [
+        ("a_same_author_b", RelationshipType.SAME_AUTHOR),
+        ("a_similar_b", RelationshipType.SIMILAR_FUNCTIONALITY),
+        ("a_complementary_b", RelationshipType.COMPLEMENTARY),
+        ("a_alternative_b", RelationshipType.ALTERNATIVE_TO),
+    ]
+    assert relationships[1].confidence_score == 0.5
+    assert relationships[2].evidence == ["Common operations: read, query"]
+    assert RelationshipInferencer(None).infer_relationships(servers[0], servers[2]) == []
+
+
+def test_similarity_merge_only_scores_candidate_pairs():
+    servers = [
+        make_server("github:1", "weather forecast", author="jo", description="Weather forecasts",
+                    repository="https://github.com/jo/weather-forecast", categories=[ServerCategory.AI_ML]),
+        make_server("glama:1", "weather forecasts", RegistrySource.GLAMA, author="jo", description="Weather forecasts",
+                    repository="https://github.com/jo/forecasts", categories=[ServerCategory.AI_ML]),
+        # Close name but same registry
+        make_server("github:2", "weather forecaster", author="jo", description="Weather forecasts",
+                    repository="https://github.com/jo/forecaster", categories=[ServerCategory.AI_ML]),
+        make_server("glama:2", "slack", RegistrySource.GLAMA, author="jo", repository="https://github.com/jo/slack"),
+    ]
+    deduplicator = ServerDeduplicator()
+    records = [ServerRecord(server) for server in servers]
+    scored = []
+    score = deduplicator._calculate_similarity_score
+
+    def recording_score(record1, record2):
+        scored.append((record1.id, record2.id))
+        return score(record1, record2)
+
+    deduplicator._calculate_similarity_score = recording_score
+    groups = deduplicator._merge_similar_servers(records)
+
+    assert [(indices, s.id) for indices, s in groups] == [([0, 1], "github:1"), ([2], "github:2"), ([3], "glama:2")]
+    # Same-registry and dissimilar names never reach scoring, merged servers drop out
+    assert scored == [("github:1", "glama:1")]
+
+
+def make_catalogue():
+    words = ["postgres", "redis", "slack", "github", "weather", "search", "notion", "docker"]
+    registries = list(RegistrySource)
+    servers = []
+    for i in range(120):
+        first, second = words[i % 8], words[(i * 3 + 1) % 8]
+        name = f"{first}-{second}" + (" server" if i % 5 == 0 else "") + ("s" if i % 7 == 0 else "")
+        owner = f"owner{i % 11}"
+        servers.append(make_server(
+            f"s{i}", name, registries[i % len(registries)], author=owner if i % 6 else None,
+            description=f"{first} and {second} tools" if i % 4 else None,
+            repository=f"https://github.com/{owner}/{first}-{second}" if i % 3 else None,
+            categories=[list(ServerCategory)[i % 5]],
+        ))
+    return servers
+
+
+def test_sharded_deduplication_matches_single_process():
+    def summary(servers):
+        return [(s.id, s.name, s.description, sorted(c.value for c in s.categories)) for s in servers]
+
+    single = ServerDeduplicator().deduplicate_servers(make_catalogue())
+    sharded = ServerDeduplicator(workers=2).deduplicate_servers(make_catalogue())
+
+    assert len(single) < 120
+    assert summary(sharded) == summary(single)
+
+
+def next_snapshot():
+    """The catalogue after a refresh: one server edited, one removed"""
+    servers = make_catalogue()
+    servers[10].description = "postgres and redis tooling"
+    del servers[20]
+    return servers
+
+
+def clusters(state):
+    members = {}
+    for member, cluster in state.assignments.items():
+        members.setdefault(cluster, set()).add(member)
+    return sorted(sorted(group) for group in members.values())
+
+
+def test_incremental_deduplication_matches_full_run():
+    previous = ServerDeduplicator()
+    previous_servers = previous.deduplicate_servers(make_catalogue()[:100])
+    # Saved state is read back from JSON
+    state = DedupState.model_validate_json(previous.state.model_dump_json())
+
+    incremental = ServerDeduplicator()
+    servers = incremental.deduplicate_incremental(next_snapshot(), previous_servers, state)
+    full = ServerDeduplicator()
+    expected = full.deduplicate_servers(next_snapshot())
+
+    assert clusters(incremental.state) == clusters(full.state)
+    assert sorted(s.id for s in servers) == sorted(s.id for s in expected)
+    assert set(incremental.state.assignments.values()) == {s.id for s in servers}
+
+
+def test_incremental_deduplication_only_matches_changes():
+    previous = ServerDeduplicator()
+    previous_servers = previous.deduplicate_servers(make_catalogue())
+    state = previous.state
+
+    matched = []
+    incremental = ServerDeduplicator()
+    find = incremental._find_saved_duplicate_of
+
+    def recording_find(record, saved):
+        matched.append(record.id)
+        return find(record, saved)
+
+    incremental._find_saved_duplicate_of = recording_find
+    servers = incremental.deduplicate_incremental(make_catalogue(), list(previous_servers), state)
+
+    assert matched == []
+    assert [s.id for s in servers] == [s.id for s in previous_servers]
+
+    # An edited server's whole cluster is matched again
+    snapshot = make_catalogue()
+    snapshot[10].description = "postgres and redis tooling"
+    cluster = state.assignments[member_key(snapshot[10])]
+    members = [s.id for s in snapshot if state.assignments[member_key(s)] == cluster]
+    incremental.deduplicate_incremental(snapshot, servers, state)
+
+    assert len(members) > 1
+    assert matched == members
+
+
+def test_incremental_deduplication_remerges_metadata_changes():
+    previous = ServerDeduplicator()
+    previous_servers = previous.deduplicate_servers(make_catalogue())
+    state = previous.state
+
+    matched = []
+    incremental = ServerDeduplicator()
+    find = incremental._find_saved_duplicate_of
+
+    def recording_find(record, saved):
+        matched.append(record.id)
+        return find(record, saved)
+
+    incremental._find_saved_duplicate_of = recording_find
+
+    # A refresh that only moves star counts keeps every cluster
+    snapshot = make_catalogue()
+    for i, server in enumerate(snapshot):
+        server.popularity_score = 1000 + i
+    servers = incremental.deduplicate_incremental(snapshot, list(previous_servers), state)
+
+    assert matched == []
+    assert clusters(incremental.state) == clusters(previous.state)
+    assert [s.id for s in servers] == [s.id for s in previous_servers]
+
+    # Each output carries its members' new scores, as a full run would merge them
+    full = ServerDeduplicator()
+    rescored = make_catalogue()
+    for i, server in enumerate(rescored):
+        server.popularity_score = 1000 + i
+    assert ([(s.id, s.popularity_score) for s in servers]
+            == [(s.id, s.popularity_score) for s in full.deduplicate_servers(rescored)])
+
+
+def test_incremental_deduplication_refuses_shared_registry_ids():
+    # mcp.so derives IDs from names, so different servers can share one
+    def snapshot():
+        return [make_server("mcp_so_filesystem", "filesystem", RegistrySource.MCP_SO, author="alice"),
+                make_server("mcp_so_filesystem", "filesystem", RegistrySource.MCP_SO, author="bob"),
+                make_server("github_carol_weather", "weather", author="carol")]
+
+    previous = ServerDeduplicator()
+    previous_servers = previous.deduplicate_servers(snapshot())
+    assert [s.author for s in previous_servers] == ["alice", "bob", "carol"]
+    state_json = previous.state.model_dump_json()
+
+    # Rather than silently dropping alice, fail so the pipeline deduplicates everything
+    with pytest.raises(ValueError, match="shared by several servers"):
+        ServerDeduplicator().deduplicate_incremental(snapshot(), list(previous_servers),
+                                                     DedupState.model_validate_json(state_json))
+    with pytest.raises(ValueError, match="previous output servers"):
+        ServerDeduplicator().deduplicate_incremental(snapshot()[1:], list(previous_servers),
+                                                     DedupState.model_validate_json(state_json))
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Test the GitHub repo enrichment worker pool
+"""
+
+import asyncio
+import random
+import time
+
+from models import MCPServer, RegistrySource
+from scrapers import GitHubScraper, StorageManager
+
+
+class FakeSearchScraper(GitHubScraper):
+    """Serves canned search pages and slow, jittery enrichment"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _github_request(self, url, headers, method="GET", **kwargs):
+        query = url.split("q=")[1].split("&")[0]
+        if "page=1&" not in url:
+            return 200, {"items": []}
+        # Overlapping results across queries exercise the de-duplication
+        base = int(query[1:])
+        return 200, {"items": [
+            {"html_url": f"https://github.com/acme/repo{i}", "name": f"repo{i}", "owner": {"login": "acme"}}
+            for i in range(base, base + 10)
+        ]}
+
+    async def _process_github_repo(self, repo, headers):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(random.uniform(0.01, 0.05))
+        self.in_flight -= 1
+        if repo["name"].endswith("3"):
+            return None
+        return MCPServer(id=repo["name"], name=repo["name"], registry_source=RegistrySource.GITHUB,
+                         repository=repo["html_url"])
+
+
+async def run_search(make_config, workers):
+    config = make_config(github={"enrichment_workers": workers})
+    async with FakeSearchScraper(config, StorageManager(config)) as scraper:
+        start = time.time()
+        servers = await scraper._search_repositories(["q0", "q5", "q20"], {})
+        return [server.name for server in servers], scraper.max_in_flight, time.time() - start
+
+
+async def test_results_keep_search_order(make_config):
+    """Worker count changes throughput but not the order of the results"""
+    serial, serial_peak, serial_time = await run_search(make_config, 1)
+    pooled, pooled_peak, pooled_time = await run_search(make_config, 8)
+
+    expected = [f"repo{i}" for i in [*range(0, 15), *range(20, 30)] if not str(i).endswith("3")]
+    assert serial == expected
+    assert pooled == expected
+    assert serial_peak == 1
+    assert pooled_peak > 1
+    assert pooled_time < serial_time
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test GraphQL batch enrichment of GitHub repositories
+"""
+
+import re
+
+import github_graphql
+from scrapers import GitHubScraper, StorageManager
+
+
+GRAPHQL_SETTINGS = {"enrichment_backend": "graphql", "graphql_batch_size": 50}
+
+
+def repository_node(owner, name, readme=None, package_json=None):
+    node = {
+        "name": name,
+        "owner": {"login": owner},
+        "url": f"https://github.com/{owner}/{name}",
+        "description": "A tool",
+        "homepageUrl": None,
+        "stargazerCount": 42,
+        "forkCount": 1,
+        "primaryLanguage": {"name": "Python"},
+        "pushedAt": "2025-03-01T00:00:00Z",
+        "updatedAt": "2025-03-02T00:00:00Z",
+        "repositoryTopics": {"nodes": [{"topic": {"name": "tools"}}]},
+    }
+    paths = github_graphql.README_PATHS + github_graphql.PACKAGE_FILES
+    if readme is not None:
+        node[f"blob{paths.index('README.md')}"] = {"text": readme}
+    if package_json is not None:
+        node[f"blob{paths.index('package.json')}"] = {"text": package_json}
+    return node
+
+
+class FakeGraphQLScraper(GitHubScraper):
+    """Answers GraphQL queries from ``self.repos`` and records every request"""
+
+    def __init__(self, *args, repos=None, graphql_status=200, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.repos = repos or {}
+        self.graphql_status = graphql_status
+        self.requests = []
+
+    async def _github_request(self, url, headers, method="GET", **kwargs):
+        self.requests.append((method, url))
+        if url == github_graphql.GRAPHQL_URL:
+            if self.graphql_status != 200:
+                return self.graphql_status, None
+            query = kwargs["json"]["query"]
+            data = {}
+            for alias, owner, name in re.findall(r'(r\d+): repository\(owner: "(.*?)", name: "(.*?)"\)', query):
+                data[alias] = self.repos.get(f"{owner}/{name}")
+            return 200, {"data": data}
+        return 404, None
+
+
+def test_parse_response_handles_missing_repos():
+    """Found repos are converted to REST-shaped dicts; missing ones map to None"""
+    paths = ["acme/found", "acme/missing"]
+    query = github_graphql.build_query(paths)
+    assert 'r0: repository(owner: "acme", name: "found")' in query
+    assert 'object(expression: "HEAD:package.json")' in query
+
+    details = github_graphql.parse_response(paths, {"data": {
+        "r0": repository_node("acme", "found", readme="# MCP server", package_json="{}"),
+        "r1": None,
+    }})
+    assert details["acme/missing"] is None
+    found = details["acme/found"]
+    assert found.readme == "# MCP server"
+    assert found.files == {"package.json": "{}"}
+    assert found.repo["html_url"] == "https://github.com/acme/found"
+    assert found.repo["topics"] == ["tools"]
+    assert found.repo["language"] == "Python"
+    assert found.repo["pushed_at"] == "2025-03-01T00:00:00Z"
+
+
+async def test_batch_resolved_in_one_request(make_config):
+    """A batch of repos costs a single GraphQL request and applies the REST checks"""
+    repos = {
+        "acme/server": repository_node("acme", "server", readme="An MCP server",
+                                       package_json='{"tools": [{"name": "query_db"}]}'),
+        "acme/library": repository_node("acme", "library", readme="Just a library"),
+        "acme/no-readme": repository_node("acme", "no-readme"),
+    }
+    repos["acme/no-readme"]["description"] = "Model Context Protocol bridge"
+
+    config = make_config(github=GRAPHQL_SETTINGS)
+    stubs = [{"owner": {"login": "acme"}, "name": name} for name in ["server", "library", "no-readme", "gone"]]
+    async with FakeGraphQLScraper(config, StorageManager(config), repos=repos) as scraper:
+        servers = await scraper._enrich_repos(stubs, {})
+
+    assert scraper.requests == [("POST", github_graphql.GRAPHQL_URL)]
+    assert [server.name if server else None for server in servers] == ["server", None, "no-readme", None]
+    assert servers[0].popularity_score == 42
+    assert servers[0].operations[0].value == "query"
+
+
+async def test_failed_query_falls_back_to_rest(make_config):
+    """If the GraphQL request fails the repos go through the REST probes"""
+    config = make_config(github=GRAPHQL_SETTINGS)
+    stubs = [{"owner": {"login": "acme"}, "name": "server"}]
+    async with FakeGraphQLScraper(config, StorageManager(config), graphql_status=502) as scraper:
+        servers = await scraper._enrich_repos(stubs, {})
+
+    assert servers == [None]
+    assert scraper.requests == [
+        ("POST", github_graphql.GRAPHQL_URL),
+        ("GET", "https://api.github.com/repos/acme/server"),
+    ]
@@ -10,7 +10,7 @@ from typing import Dict, List
 from datetime import datetime
 
 from models import MCPServer, RegistrySource
-from id_standardization import batch_convert_to_global_ids, GlobalIDGenerator
+from id_standardization import batch_convert_to_global_ids, GlobalIDGenerator, IDRegistry
 from deduplication import ServerDeduplicator
 
 
@@ -98,7 +98,7 @@ def test_global_id_generation():
     print(f"📊 Original data: {len(all_servers)} servers with registry-specific IDs")
     
     # Convert to global IDs
-    global_servers = batch_convert_to_global_ids(all_servers)
+    global_servers = batch_convert_to_global_ids(all_servers, IDRegistry())
     
     print(f"\n🔧 Testing deduplication with global IDs...")
     deduplicator = ServerDeduplicator()
@@ -159,8 +159,8 @@ def test_id_stability():
         all_servers.extend(servers)
     
     # Convert to global IDs multiple times
-    global_servers_1 = batch_convert_to_global_ids(all_servers)
-    global_servers_2 = batch_convert_to_global_ids(all_servers)
+    global_servers_1 = batch_convert_to_global_ids(all_servers, IDRegistry())
+    global_servers_2 = batch_convert_to_global_ids(all_servers, IDRegistry())
     
     # Check that IDs are stable
     for i, (server1, server2) in enumerate(zip(global_servers_1, global_servers_2)):
@@ -169,6 +169,54 @@ def test_id_stability():
     print(f"✅ Global IDs are stable across multiple runs")
 
 
+def make_contested_servers():
+    """Servers from different registries that all want the ID test/server-1"""
+    return [
+        MCPServer(id=f"{registry.value}_1", name="Server 1", author="test", repository="https://github.com/test/server-1",
+                  registry_source=registry)
+        for registry in [RegistrySource.GLAMA, RegistrySource.MCP_SO, RegistrySource.GITHUB]
+    ]
+
+
+def test_ids_do_not_depend_on_input_order():
+    servers = make_contested_servers()
+
+    forward = {s.name + s.registry_source.value: s.id for s in batch_convert_to_global_ids(servers, IDRegistry())}
+    backward = {s.name + s.registry_source.value: s.id for s in batch_convert_to_global_ids(servers[::-1], IDRegistry())}
+
+    assert forward == backward
+    assert len(set(forward.values())) == 3
+
+
+def test_registered_ids_survive_new_servers(tmp_path):
+    registry_path = tmp_path / "id_registry.json"
+    glama, mcp_so, github = make_contested_servers()
+
+    first = batch_convert_to_global_ids([glama, mcp_so], IDRegistry(registry_path))
+    assert first[0].id == "test/server-1"
+
+    # github sorts first and would have won test/server-1 on a fresh run
+    second = batch_convert_to_global_ids([github, mcp_so, glama], IDRegistry(registry_path))
+    assert [s.id for s in second[1:]] == [first[1].id, first[0].id]
+    assert second[0].id not in {first[0].id, first[1].id}
+    assert second[0].raw_metadata["github_id"] == "github_1"
+
+    assert IDRegistry(registry_path).get("github:github_1") == second[0].id
+
+
 if __name__ == "__main__":
     test_global_id_generation()
-    test_id_stability()
\ No newline at end of file
+    test_id_stability()
+
+def test_default_registry_is_the_configured_file(make_config, config_path, monkeypatch, tmp_path):
+    # ConfigManager() reads .config.yaml from the working directory
+    make_config()
+    (tmp_path / ".config.yaml").write_text(config_path.read_text())
+    monkeypatch.chdir(tmp_path)
+    glama, mcp_so, github = make_contested_servers()
+
+    first = batch_convert_to_global_ids([glama, mcp_so])
+    second = batch_convert_to_global_ids([github, mcp_so, glama])
+
+    assert [s.id for s in second[1:]] == [first[1].id, first[0].id]
+    assert IDRegistry(tmp_path / "id_registry.json").get("glama:glama_1") == first[0].id
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test the conditional-request HTTP cache used by the scrapers
+"""
+
+from aiohttp import web
+
+from http_cache import HTTPCache
+from scrapers import BaseScraper, StorageManager
+
+
+def test_store_requires_validators(tmp_path):
+    """Responses without ETag or Last-Modified are not cached"""
+    cache = HTTPCache(tmp_path)
+    assert cache.store("https://example.com/a", {}, b"body") is False
+    assert cache.lookup("https://example.com/a") is None
+
+    assert cache.store("https://example.com/a", {"ETag": '"v1"'}, b"body") is True
+    entry = cache.lookup("https://example.com/a")
+    assert entry.body == b"body"
+    assert entry.validators() == {"If-None-Match": '"v1"'}
+
+    # Variants (e.g. different Accept headers) are stored separately
+    assert cache.lookup("https://example.com/a", variant="application/json") is None
+
+
+async def test_unchanged_page_is_revalidated(make_config):
+    """The second run sends If-None-Match and serves the 304 from disk"""
+    seen = []
+
+    async def page(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"abc"':
+            return web.Response(status=304, headers={"ETag": '"abc"'})
+        return web.Response(text="<html>server</html>", headers={"ETag": '"abc"'})
+
+    app = web.Application()
+    app.router.add_get("/server/x", page)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    url = f"http://127.0.0.1:{port}/server/x"
+
+    config = make_config()
+    try:
+        async with BaseScraper(config, StorageManager(config)) as scraper:
+            first = await scraper._fetch(url)
+
+        # A fresh scraper (i.e. the next run) picks the entry up from disk
+        async with BaseScraper(config, StorageManager(config)) as scraper:
+            second = await scraper._fetch(url)
+            assert scraper.http_cache.revalidated == 1
+    finally:
+        await runner.cleanup()
+
+    assert seen == [None, '"abc"']
+    assert first.status == 200 and not first.from_cache
+    assert second.status == 200 and second.from_cache
+    assert second.text() == first.text() == "<html>server</html>"
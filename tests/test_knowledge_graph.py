@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test the KnowledgeGraph lookup indexes
+"""
+
+from datetime import datetime
+
+from models import (
+    KnowledgeGraph,
+    MCPServer,
+    RegistrySource,
+    RelationshipType,
+    ServerCategory,
+    ServerRelationship,
+)
+
+
+def make_server(server_id, *categories):
+    return MCPServer(id=server_id, name=server_id, registry_source=RegistrySource.GITHUB, categories=list(categories))
+
+
+def make_relationship(source, target):
+    return ServerRelationship(id=f"{source}->{target}", source_server_id=source, target_server_id=target,
+                              relationship_type=RelationshipType.COMPLEMENTARY, confidence_score=0.5,
+                              created_at=datetime(2025, 1, 1))
+
+
+def make_graph(servers, relationships=()):
+    return KnowledgeGraph(created_at=datetime(2025, 1, 1), last_updated=datetime(2025, 1, 1), servers=servers,
+                          relationships=list(relationships), categories=[], registry_snapshots=[])
+
+
+def test_lookups():
+    kg = make_graph(
+        [make_server("a", ServerCategory.DATABASE, ServerCategory.SEARCH), make_server("b", ServerCategory.DATABASE),
+         make_server("c")],
+        [make_relationship("a", "b"), make_relationship("b", "c"), make_relationship("a", "a")],
+    )
+
+    assert kg.get_server_by_id("b").id == "b"
+    assert kg.get_server_by_id("missing") is None
+    assert [s.id for s in kg.get_servers_by_category(ServerCategory.DATABASE)] == ["a", "b"]
+    assert kg.get_servers_by_category(ServerCategory.AI_ML) == []
+    assert [r.id for r in kg.get_relationships_for_server("a")] == ["a->b", "a->a"]
+    assert [r.id for r in kg.get_relationships_for_server("b")] == ["a->b", "b->c"]
+    assert kg.category_counts() == {ServerCategory.DATABASE: 2, ServerCategory.SEARCH: 1}
+
+
+def test_indexes_follow_additions():
+    kg = make_graph([make_server("a", ServerCategory.DATABASE)])
+
+    kg.add_server(make_server("b", ServerCategory.DATABASE))
+    kg.add_relationship(make_relationship("a", "b"))
+    # Appending to the lists directly is picked up too
+    kg.servers.append(make_server("c", ServerCategory.SEARCH))
+
+    assert kg.get_server_by_id("c").id == "c"
+    assert [s.id for s in kg.get_servers_by_category(ServerCategory.DATABASE)] == ["a", "b"]
+    assert [r.id for r in kg.get_relationships_for_server("b")] == ["a->b"]
+
+    # Replacing a list rebuilds the indexes
+    kg.servers = [make_server("d"), make_server("e"), make_server("f")]
+    assert kg.get_server_by_id("a") is None
+    assert kg.get_servers_by_category(ServerCategory.DATABASE) == []
+
+
+def test_replaced_list_of_same_length_rebuilds_indexes():
+    kg = make_graph([make_server("a")])
+    kg.get_server_by_id("a")
+
+    # A new list may reuse the old one's id() once that is freed
+    kg.servers = [make_server("b")]
+    assert kg.get_server_by_id("a") is None
+    assert kg.get_server_by_id("b").id == "b"
+
+
+def test_reindex_after_in_place_edit():
+    kg = make_graph([make_server("a", ServerCategory.DATABASE)])
+    assert kg.category_counts() == {ServerCategory.DATABASE: 1}
+
+    kg.servers[0] = make_server("b", ServerCategory.SEARCH)
+    kg.reindex()
+
+    assert kg.get_server_by_id("a") is None
+    assert kg.get_server_by_id("b").id == "b"
+    assert kg.category_counts() == {ServerCategory.SEARCH: 1}
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test master data change logs between versions
+"""
+
+from datetime import datetime
+
+import pytest
+
+from dedup_state import DedupState
+from master_changelog import apply_changelog, replay_changelogs
+from master_data import MasterDataManager
+from models import MCPServer, RegistrySource, ServerCategory
+from neo4j_integration import Neo4jManager
+
+
+def make_server(server_id, **fields):
+    return MCPServer(id=server_id, name=server_id, registry_source=RegistrySource.GITHUB, **fields)
+
+
+def save_version(manager, servers, timestamp, monkeypatch, dedup_state=None):
+    # Master files are named by the second they were saved in
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return timestamp
+
+    monkeypatch.setattr("master_data.datetime", FixedDatetime)
+    return manager.save_master_data(servers, [], dedup_state)
+
+
+@pytest.fixture
+def versions(tmp_path, monkeypatch):
+    """Three master data versions with adds, removals and edits between them"""
+    manager = MasterDataManager(str(tmp_path))
+    v1 = [make_server("a", description="first"), make_server("b"), make_server("c")]
+    v2 = [make_server("a", description="second", categories=[ServerCategory.DATABASE]), make_server("c"),
+          make_server("d", last_updated=datetime(2025, 1, 1))]
+    v3 = [make_server("a", description="second", categories=[ServerCategory.DATABASE]), make_server("e"),
+          make_server("d", last_updated=datetime(2025, 2, 1))]
+
+    for day, servers in enumerate([v1, v2, v3], start=1):
+        save_version(manager, servers, datetime(2025, 6, day), monkeypatch)
+    return manager, v1, v2, v3
+
+
+def test_changelog_records_changes(versions):
+    manager, v1, v2, v3 = versions
+
+    changelogs = manager.load_changelogs()
+    assert [c.to_version for c in changelogs] == ["deduplicated_servers_20250602_000000.json",
+                                                  "deduplicated_servers_20250603_000000.json"]
+
+    first = changelogs[0]
+    assert first.from_version == "deduplicated_servers_20250601_000000.json"
+    assert [record["id"] for record in first.added] == ["d"]
+    assert first.removed == ["b"]
+    assert set(first.modified) == {"a"}
+    assert set(first.modified["a"]) == {"description", "categories"}
+    assert first.modified["a"]["description"].old == "first"
+    assert first.modified["a"]["description"].new == "second"
+    assert first.changed_ids == {"a", "d"}
+
+    assert manager.latest_changelog() == changelogs[1]
+    assert set(changelogs[1].modified["d"]) == {"last_updated"}
+
+
+def test_replay_rebuilds_each_version(versions):
+    manager, v1, v2, v3 = versions
+
+    def by_id(servers):
+        return {s.id: s for s in servers}
+
+    assert by_id(apply_changelog(v1, manager.load_changelogs()[0])) == by_id(v2)
+    assert by_id(replay_changelogs(v1, manager.load_changelogs())) == by_id(v3)
+    assert by_id(replay_changelogs(v2, manager.load_changelogs("deduplicated_servers_20250602_000000.json"))) == by_id(v3)
+    assert manager.load_changelogs("deduplicated_servers_20250603_000000.json") == []
+
+    with pytest.raises(ValueError):
+        replay_changelogs(v1, reversed(manager.load_changelogs()))
+
+
+def test_changed_servers_stream_from_the_new_version(versions):
+    manager, v1, v2, v3 = versions
+    changelog = manager.latest_changelog()
+
+    assert sorted(s.id for s in manager.iter_changed_servers(changelog)) == ["d", "e"]
+
+
+def test_cleanup_drops_changelogs_of_removed_versions(versions):
+    manager, *_ = versions
+    manager.cleanup_old_master_data(keep_count=1)
+
+    assert [c.to_version for c in manager.load_changelogs()] == ["deduplicated_servers_20250603_000000.json"]
+
+
+def test_dedup_state_is_saved_with_its_version(tmp_path, monkeypatch):
+    manager = MasterDataManager(str(tmp_path))
+    state = DedupState(assignments={"github:a": "a"}, repository_index={"github.com/x/a": "a"})
+    save_version(manager, [make_server("a")], datetime(2025, 6, 1), monkeypatch, state)
+
+    assert manager.load_dedup_state() == state
+    assert manager.load_dedup_state("deduplicated_servers_20250601_000000.json") == state
+    # A version saved without one has no state, and cleanup removes old ones
+    save_version(manager, [make_server("a")], datetime(2025, 6, 2), monkeypatch)
+    assert manager.load_dedup_state() is None
+    manager.cleanup_old_master_data(keep_count=1)
+    assert list(manager.dedup_state_dir.iterdir()) == []
+
+
+class RecordingSession:
+    def __init__(self, queries):
+        self.queries = queries
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def run(self, cypher, parameters=None):
+        self.queries.append(parameters)
+
+
+class RecordingNeo4j(Neo4jManager):
+    """Neo4jManager that records what it would send instead of connecting"""
+
+    def __init__(self):
+        self.instance = "test"
+        self.queries = []
+        self.driver = self
+
+    def session(self):
+        return RecordingSession(self.queries)
+
+
+def test_neo4j_sync_touches_only_changed_servers(versions):
+    manager, *_ = versions
+    changelog = manager.load_changelogs()[0]
+    neo4j = RecordingNeo4j()
+
+    upserted = neo4j.sync_server_changes(manager.iter_changed_servers(changelog), changelog.removed, batch_size=1)
+
+    assert upserted == 2
+    assert neo4j.queries[0] == {"ids": ["b"]}
+    upserts = [[s["id"] for s in query["servers"]] for query in neo4j.queries[1:]]
+    # Each batch is written, then its category links are replaced
+    assert upserts == [["a"], ["a"], ["d"], ["d"]]
+    assert neo4j.queries[2]["servers"] == [{"id": "a", "categories": ["database"]}]
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test streaming master data one record at a time
+"""
+
+from datetime import datetime
+
+import pytest
+
+from master_data import MasterDataManager, MasterDataReader
+from models import MCPServer, OntologyCategory, RegistrySource
+from neo4j_integration import Neo4jManager
+
+
+def make_servers(count):
+    return [
+        MCPServer(id=f"s{i}", name=f"server {i} \"quoted\" ✓", registry_source=RegistrySource.GLAMA,
+                  repository=f"https://github.com/acme/s{i}", popularity_score=i * 1001,
+                  last_updated=datetime(2025, 1, 1), raw_metadata={"nested": {"values": list(range(i))}})
+        for i in range(count)
+    ]
+
+
+def make_categories():
+    return [
+        OntologyCategory(id="database", name="Database", description="DBs", servers=["s0", "s2"]),
+        OntologyCategory(id="search", name="Search", description="Search", servers=[]),
+    ]
+
+
+@pytest.fixture
+def manager(tmp_path, capsys):
+    manager = MasterDataManager(str(tmp_path))
+    manager.save_master_data(make_servers(25), make_categories())
+    capsys.readouterr()
+    return manager
+
+
+# Tiny chunks make records straddle buffer refills at every possible offset
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 20])
+def test_stream_matches_full_load(manager, chunk_size):
+    servers, categories = manager.load_master_data()
+
+    with manager.open_master_data(chunk_size=chunk_size) as master:
+        assert master.metadata()["total_servers"] == 25
+        assert list(master.servers()) == servers
+        assert list(master.categories()) == categories
+
+
+def test_sections_in_any_order(manager):
+    with manager.open_master_data(chunk_size=16) as master:
+        # Categories come after the servers in the file, which are skipped
+        assert [c.id for c in master.categories()] == ["database", "search"]
+        # Going back reopens the file
+        assert len(list(master.servers())) == 25
+        assert master.metadata()["total_categories"] == 2
+
+
+def test_abandoned_iteration_restarts(manager):
+    with manager.open_master_data(chunk_size=16) as master:
+        servers = master.servers()
+        assert [next(servers).id for _ in range(3)] == ["s0", "s1", "s2"]
+        servers.close()
+        assert [c.id for c in master.categories()] == ["database", "search"]
+
+
+def test_invalid_records_are_skipped(tmp_path, capsys):
+    path = tmp_path / "master.json"
+    path.write_text('{"servers": [{"id": "a", "name": "A", "registry_source": "glama"}, {"id": "b"}], '
+                    '"categories": [], "metadata": {"total_servers": 2}}')
+
+    with MasterDataReader(path) as master:
+        assert [s.id for s in master.servers()] == ["a"]
+        assert master.metadata() == {"total_servers": 2}
+    assert "Skipped invalid MCPServer" in capsys.readouterr().out
+
+
+class RecordingNeo4j(Neo4jManager):
+    """Neo4jManager that records what it would send instead of connecting"""
+
+    def __init__(self):
+        self.instance = "test"
+        self.batches = []
+        self.categories = []
+
+    def create_constraints_and_indexes(self):
+        pass
+
+    def create_servers_batch(self, servers):
+        self.batches.append([s.id for s in servers])
+
+    def create_category_nodes(self, categories):
+        self.categories.extend(c.id for c in categories)
+
+
+def test_neo4j_loads_streamed_batches(manager):
+    neo4j = RecordingNeo4j()
+    with manager.open_master_data(chunk_size=64) as master:
+        count = neo4j.load_streams_fast(master.servers(), master.categories(), batch_size=10,
+                                        total_servers=master.metadata()["total_servers"])
+
+    assert count == 25
+    assert [len(batch) for batch in neo4j.batches] == [10, 10, 5]
+    assert neo4j.categories == ["database", "search"]
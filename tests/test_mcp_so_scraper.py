@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test the mcp.so scraper: incremental refresh and the detail page worker pool
+"""
+
+import asyncio
+import time
+
+from aiohttp import web
+
+from scrapers import MCPSoScraper, StorageManager
+
+
+async def start_server(app):
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+
+def sitemap(base_url, entries):
+    urls = "".join(
+        f"<url><loc>{base_url}/server/{name}/acme</loc><lastmod>{lastmod}</lastmod></url>"
+        for name, lastmod in entries
+    )
+    return f'<?xml version="1.0"?><urlset>{urls}</urlset>'
+
+
+class SitemapOnlyScraper(MCPSoScraper):
+    async def _get_homepage_servers(self, base_url):
+        return []
+
+
+def test_parse_sitemap():
+    """Only server URLs are kept, with their lastmod when present"""
+    xml = (
+        "<urlset>"
+        "<url><loc>https://mcp.so/server/a/x</loc><lastmod>2025-01-02</lastmod></url>"
+        "<url><loc>https://mcp.so/server/b/y</loc></url>"
+        "<url><loc>https://mcp.so/about</loc><lastmod>2025-01-01</lastmod></url>"
+        "</urlset>"
+    )
+    assert MCPSoScraper._parse_sitemap(xml, "https://mcp.so") == {
+        "https://mcp.so/server/a/x": "2025-01-02",
+        "https://mcp.so/server/b/y": None,
+    }
+
+
+async def test_only_changed_pages_are_fetched(make_config):
+    """Unchanged servers are carried over; new and changed ones are fetched"""
+    entries = [("alpha", "2025-01-01"), ("beta", "2025-01-01")]
+    fetched = []
+
+    async def sitemap_1(request):
+        return web.Response(text=sitemap(base_url, entries), content_type="application/xml")
+
+    async def detail(request):
+        fetched.append(request.match_info["name"])
+        return web.Response(text=f"<html><h1>{request.match_info['name']} by acme</h1></html>",
+                            content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/sitemap_projects_1.xml", sitemap_1)
+    app.router.add_get("/server/{name}/acme", detail)
+    runner, base_url = await start_server(app)
+
+    config = make_config(mcp_so={"base_url": base_url})
+    storage = StorageManager(config)
+
+    try:
+        async with SitemapOnlyScraper(config, storage) as scraper:
+            first = await scraper.scrape()
+        storage.save_snapshot(first)
+        assert sorted(fetched) == ["alpha", "beta"]
+
+        # beta changed and gamma is new; alpha should not be fetched again
+        fetched.clear()
+        entries[:] = [("alpha", "2025-01-01"), ("beta", "2025-02-01"), ("gamma", "2025-02-01")]
+        async with SitemapOnlyScraper(config, storage) as scraper:
+            second = await scraper.scrape()
+    finally:
+        await runner.cleanup()
+
+    assert sorted(fetched) == ["beta", "gamma"]
+    assert sorted(server.name for server in second.servers) == ["alpha", "beta", "gamma"]
+    assert second.metadata["sitemap_lastmod"][f"{base_url}/server/beta/acme"] == "2025-02-01"
+
+
+async def test_slow_page_does_not_stall_the_pool(make_config):
+    """A hanging page times out on its own worker while the rest keep flowing"""
+
+    async def detail(request):
+        name = request.match_info["name"]
+        if name == "slow":
+            await asyncio.sleep(2)
+        return web.Response(text=f"<html><h1>{name} by acme</h1></html>", content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/server/{name}/acme", detail)
+    runner, base_url = await start_server(app)
+
+    config = make_config(mcp_so={"workers": 4, "requests_per_second": 100, "request_timeout": 0.5})
+    urls = [f"{base_url}/server/{name}/acme" for name in ["slow", *(f"page{i}" for i in range(20))]]
+    try:
+        async with MCPSoScraper(config, StorageManager(config)) as scraper:
+            start = time.time()
+            servers = await scraper._scrape_server_details(urls)
+            elapsed = time.time() - start
+    finally:
+        await runner.cleanup()
+
+    assert [server.name for server in servers] == [f"page{i}" for i in range(20)]
+    # 20 pages at 100/s take ~0.2s; the slow page only costs its own timeout
+    assert elapsed < 1.5
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Test the n-gram candidate index used for fuzzy name matching
+"""
+
+import random
+from difflib import SequenceMatcher
+
+from ngram_index import NgramCandidateIndex
+
+
+def mutate(name, rng, alphabet):
+    chars = list(name)
+    for _ in range(rng.randint(0, 3)):
+        position = rng.randint(0, len(chars))
+        operation = rng.random()
+        if operation < 0.4:
+            chars.insert(position, rng.choice(alphabet))
+        elif chars:
+            position = min(position, len(chars) - 1)
+            if operation < 0.7:
+                del chars[position]
+            else:
+                chars[position] = rng.choice(alphabet)
+    return "".join(chars)
+
+
+def test_candidates_include_every_match():
+    rng = random.Random(7)
+    alphabet = "abcdef -"
+    names = set()
+    for _ in range(150):
+        name = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+        names.update({name, mutate(name, rng, alphabet), mutate(mutate(name, rng, alphabet), rng, alphabet)})
+    names = sorted(names)
+
+    index = NgramCandidateIndex(0.85)
+    for name in names:
+        index.add(name)
+
+    for query in names[::3] + [mutate(name, rng, alphabet) for name in names[::7]]:
+        candidates = list(index.candidates(query))
+        assert len(candidates) == len(set(candidates))
+        matches = {name for name in names if SequenceMatcher(None, query, name).ratio() > 0.85}
+        assert matches <= set(candidates)
+
+
+def test_candidates_are_selective():
+    index = NgramCandidateIndex(0.85)
+    for name in ["postgres", "postgresql", "github", "slack", "filesystem", "weather"]:
+        index.add(name)
+
+    assert set(index.candidates("postgresq")) == {"postgres", "postgresql"}
+    assert list(index.candidates("notion")) == []
+    assert list(index.candidates("")) == []
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test the off-event-loop HTML parse stage
+"""
+
+import parsers
+
+DETAIL_PAGE = """
+<html><head><title>ignored</title><meta name="description" content="Query Postgres from MCP"></head>
+<body>
+  <nav><a href="/">home</a></nav>
+  <div class="layout">
+    <h1>postgres-mcp by acme</h1>
+    <section>
+      <span class="tag">#database</span>
+      <div class="badge-row"><span class="label">sql</span></div>
+      <a href="https://github.com/acme/postgres-mcp">GitHub</a>
+    </section>
+  </div>
+</body></html>
+"""
+
+GLAMA_PAGE = """
+<html><body>
+  <div class="grid">
+    <div class="server-card featured"><h2>Outer</h2><h3>Fetch</h3><p>Fetches pages</p>
+      <a href="https://github.com/tools/fetch">repo</a></div>
+    <div class="other"><h3>Not a card</h3></div>
+    <div class="server-card"><h3>Memory</h3></div>
+  </div>
+</body></html>
+"""
+
+
+def test_mcp_so_detail_fields():
+    """Only the needed elements are parsed, wherever they sit in the page"""
+    fields = parsers.parse_mcp_so_detail(DETAIL_PAGE, "https://mcp.so/server/postgres-mcp/acme")
+    assert fields == {
+        "name": "postgres-mcp",
+        "author": "acme",
+        "description": "Query Postgres from MCP",
+        "repository": "https://github.com/acme/postgres-mcp",
+        "tags": ["database", "sql", "sql"],
+    }
+
+
+def test_mcp_so_detail_falls_back_to_url():
+    """Name and author come from the URL when the page has no heading"""
+    fields = parsers.parse_mcp_so_detail("<html><body><p>hi</p></body></html>", "https://mcp.so/server/x/y")
+    assert fields["name"] == "x"
+    assert fields["author"] == "y"
+    assert fields["description"] == "hi"
+
+
+def test_server_links_and_cards():
+    html = '<a href="/server/a/b">a</a><div><a href="https://mcp.so/server/c/d">c</a></div><a href="/about">x</a>'
+    assert parsers.parse_mcp_so_server_links(html) == ["https://mcp.so/server/a/b", "https://mcp.so/server/c/d"]
+
+    cards = parsers.parse_glama_cards(GLAMA_PAGE)
+    # Glama cards prefer <h3> for the name
+    assert [card["name"] for card in cards] == ["Fetch", "Memory"]
+    assert cards[0]["author"] == "tools"
+    assert cards[1]["description"] == ""
+
+    # MCP Market falls back through card layouts
+    market = parsers.parse_mcpmarket_cards("<article><h1>Search</h1><p>Finds things</p></article><article><h2>x</h2></article>")
+    assert [card["name"] for card in market] == ["Search"]
+
+
+async def test_parse_pool_runs_in_worker_processes():
+    pool = parsers.ParsePool(workers=2, kind="process")
+    try:
+        fields = await pool.run(parsers.parse_mcp_so_detail, DETAIL_PAGE, "https://mcp.so/server/postgres-mcp/acme")
+    finally:
+        pool.close()
+    assert fields["name"] == "postgres-mcp"
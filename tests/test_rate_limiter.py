@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test the header-driven GitHub rate limiter
+"""
+
+import asyncio
+import time
+
+from aiohttp import web
+
+from rate_limiter import GitHubRateLimiter, HostRateLimiter
+from scrapers import BaseScraper, GlamaScraper, StorageManager
+
+
+def test_resource_for_url():
+    """Each GitHub API class maps to its own bucket"""
+    assert GitHubRateLimiter.resource_for_url("https://api.github.com/search/code?q=x") == "code_search"
+    assert GitHubRateLimiter.resource_for_url("https://api.github.com/search/repositories?q=x") == "search"
+    assert GitHubRateLimiter.resource_for_url("https://api.github.com/graphql") == "graphql"
+    assert GitHubRateLimiter.resource_for_url("https://api.github.com/repos/a/b/readme") == "core"
+
+
+async def test_large_quota_does_not_wait():
+    """With quota left, requests go out without any pacing"""
+    limiter = GitHubRateLimiter()
+    start = time.time()
+    for _ in range(200):
+        await limiter.acquire("core")
+    assert time.time() - start < 0.1
+    assert limiter.buckets["core"].remaining == 4800
+
+
+async def test_exhausted_quota_waits_until_reset():
+    """When remaining hits zero the bucket waits for X-RateLimit-Reset"""
+    limiter = GitHubRateLimiter()
+    reset_at = int(time.time()) + 1
+    headers = {
+        "X-RateLimit-Limit": "30",
+        "X-RateLimit-Remaining": "0",
+        "X-RateLimit-Reset": str(reset_at),
+        "X-RateLimit-Resource": "search",
+    }
+
+    assert limiter.update("search", headers, 403) is True
+    assert limiter.buckets["search"].delay() > 0
+
+    await limiter.acquire("search")
+    assert time.time() >= reset_at
+    assert limiter.buckets["search"].remaining == 29
+
+
+def test_stale_headers_do_not_refill():
+    """A late response from the same window must not hand tokens back"""
+    limiter = GitHubRateLimiter()
+    reset_at = str(int(time.time()) + 600)
+    limiter.update("core", {"X-RateLimit-Remaining": "100", "X-RateLimit-Reset": reset_at}, 200)
+    limiter.update("core", {"X-RateLimit-Remaining": "150", "X-RateLimit-Reset": reset_at}, 200)
+    assert limiter.buckets["core"].remaining == 100
+
+
+def test_first_response_replaces_default_quota():
+    """A token with a larger quota than the defaults gets all of it from the first response on"""
+    limiter = GitHubRateLimiter()
+    reset_at = int(time.time()) + 600
+    headers = {"X-RateLimit-Limit": "15000", "X-RateLimit-Remaining": "14990", "X-RateLimit-Reset": str(reset_at)}
+    limiter.update("core", headers, 200)
+
+    bucket = limiter.buckets["core"]
+    assert (bucket.limit, bucket.remaining, bucket.reset_at) == (15000, 14990, reset_at)
+    # Later responses from the same window still only lower it
+    limiter.update("core", {**headers, "X-RateLimit-Remaining": "14995"}, 200)
+    assert bucket.remaining == 14990
+
+
+async def test_host_rate_limiter_paces_each_host():
+    """Concurrent requests to one host are spread out; other hosts aren't held up"""
+    limiter = HostRateLimiter(requests_per_second=20)
+    start = time.monotonic()
+    await asyncio.gather(*(limiter.acquire("https://mcp.so/server/a") for _ in range(10)))
+    assert 0.4 <= time.monotonic() - start < 0.7
+
+    start = time.monotonic()
+    await limiter.acquire("https://glama.ai/mcp")
+    assert time.monotonic() - start < 0.05
+async def test_rate_limited_page_is_retried(make_config):
+    """A 403 with Retry-After is waited out and the same page is fetched again"""
+    calls = []
+
+    async def search(request):
+        calls.append(request.query["page"])
+        if len(calls) == 1:
+            return web.json_response({"message": "secondary rate limit"}, status=403, headers={"Retry-After": "1"})
+        return web.json_response({"items": [{"page": request.query["page"]}]})
+
+    app = web.Application()
+    app.router.add_get("/search/repositories", search)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    config = make_config()
+
+    try:
+        async with BaseScraper(config, StorageManager(config)) as scraper:
+            start = time.time()
+            status, data = await scraper._github_request(f"http://127.0.0.1:{port}/search/repositories?page=3", {})
+            elapsed = time.time() - start
+    finally:
+        await runner.cleanup()
+
+    assert status == 200
+    assert data == {"items": [{"page": "3"}]}
+    assert calls == ["3", "3"]
+    assert elapsed >= 1.0
+
+
+async def test_glama_json_search_goes_through_github_limiter(make_config):
+    """The glama.json search and downloads are GitHub API calls like any other"""
+    requested = []
+
+    class RecordingGlamaScraper(GlamaScraper):
+        async def _fetch(self, url, headers=None, method="GET", **kwargs):
+            raise AssertionError(f"fetched {url} around the rate limiter")
+
+        async def _github_request(self, url, headers, method="GET", **kwargs):
+            requested.append(url)
+            if url.endswith("/search/code"):
+                return 200, {"items": [{"url": "https://api.github.com/repos/a/b/contents/glama.json"}]}
+            return 200, {"name": "Weather", "description": "Weather forecasts"}
+
+    config = make_config()
+    async with RecordingGlamaScraper(config, StorageManager(config)) as scraper:
+        servers = await scraper._search_glama_json_files()
+
+    assert requested == ["https://api.github.com/search/code",
+                         "https://api.github.com/repos/a/b/contents/glama.json"]
+    assert [s.name for s in servers] == ["Weather"]
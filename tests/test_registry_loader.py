@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test loading registry snapshots in parallel chunks
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from models import MCPServer, RegistrySnapshot, RegistrySource
+from registry_loader import load_registry_servers
+from snapshot_io import iter_snapshot_servers, snapshot_body_ranges, write_snapshot
+
+
+def make_servers(registry, count):
+    return [
+        MCPServer(id=f"{registry.value}:{i}", name=f"server-{i}", registry_source=registry,
+                  description="x" * (i % 50), raw_metadata={"index": i})
+        for i in range(count)
+    ]
+
+
+def write_registry(registries_path, registry, count):
+    registry_dir = registries_path / registry.value
+    registry_dir.mkdir(parents=True)
+    snapshot = RegistrySnapshot(registry_source=registry, snapshot_date=datetime(2025, 6, 1),
+                                servers_count=count, servers=make_servers(registry, count))
+    return write_snapshot(snapshot, registry_dir / f"{registry.value}_20250601_000000.ndjson")
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 100, 1000, 10**6])
+def test_byte_ranges_cover_every_server_once(tmp_path, chunk_bytes):
+    path = write_registry(tmp_path, RegistrySource.GLAMA, 40)
+
+    ranges = snapshot_body_ranges(path, chunk_bytes)
+    ids = [s.id for r in ranges for s in iter_snapshot_servers(path, byte_range=r)]
+    assert ids == [s.id for s in iter_snapshot_servers(path)]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_loads_registries_in_order(tmp_path, capsys, workers):
+    write_registry(tmp_path, RegistrySource.GITHUB, 30)
+    write_registry(tmp_path, RegistrySource.MCP_SO, 7)
+
+    # A legacy single-document snapshot
+    legacy_dir = tmp_path / "glama"
+    legacy_dir.mkdir()
+    legacy = RegistrySnapshot(registry_source=RegistrySource.GLAMA, snapshot_date=datetime(2024, 1, 1),
+                              servers_count=3, servers=make_servers(RegistrySource.GLAMA, 3))
+    (legacy_dir / "glama_20240101_000000.json").write_text(json.dumps(legacy.dict(), default=str))
+
+    servers, counts = load_registry_servers(tmp_path, workers=workers, chunk_bytes=500)
+
+    assert counts == {"github": 30, "glama": 3, "mcp.so": 7}
+    assert [s.id for s in servers] == (
+        [f"github:{i}" for i in range(30)] + [f"glama:{i}" for i in range(3)] + [f"mcp.so:{i}" for i in range(7)]
+    )
+    assert "✅ Loaded 30 servers" in capsys.readouterr().out
+
+
+def test_unreadable_registry_is_reported_and_skipped(tmp_path, capsys):
+    write_registry(tmp_path, RegistrySource.GITHUB, 5)
+    broken_dir = tmp_path / "glama"
+    broken_dir.mkdir()
+    (broken_dir / "glama_20240101_000000.json").write_text("{not json")
+
+    servers, counts = load_registry_servers(tmp_path, workers=2)
+
+    assert counts == {"github": 5}
+    assert len(servers) == 5
+    assert "❌ Failed to load glama" in capsys.readouterr().out
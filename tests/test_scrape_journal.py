@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Test resumable scraping with the checkpoint journal
+"""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+
+from models import MCPServer, RegistrySource
+from scrape_journal import ScrapeJournal
+from http_cache import CachedResponse
+from scrapers import GitHubScraper, GlamaScraper, MCPSoScraper, StorageManager
+
+
+def test_replay_ignores_torn_last_line(tmp_path):
+    """Everything before a half-written line is recovered"""
+    journal = ScrapeJournal.start(tmp_path)
+    server = MCPServer(id="a", name="a", registry_source=RegistrySource.MCP_SO)
+    journal.record_server("details", "https://mcp.so/server/a/x", server)
+    journal.record_position("pages", {"cursor": "abc"})
+    journal.close()
+    with open(journal.path, "a") as f:
+        f.write('{"type": "item", "stage": "det')
+
+    resumed = ScrapeJournal.start(tmp_path, resume=True)
+    assert resumed.path == journal.path
+    assert resumed.resumed
+    assert resumed.servers("details")["https://mcp.so/server/a/x"].name == "a"
+    assert resumed.position("pages") == {"cursor": "abc"}
+
+    resumed.complete()
+    assert ScrapeJournal.latest(tmp_path) is None
+    # Without --resume a new run starts from scratch
+    assert not ScrapeJournal.start(tmp_path).resumed
+
+
+
+def test_new_run_discards_unfinished_journals(tmp_path):
+    """Only --resume picks up an old crash; a fresh run supersedes it"""
+    crashed = ScrapeJournal.start(tmp_path)
+    crashed.record_position("pages", {"cursor": "old"})
+    crashed.close()
+
+    fresh = ScrapeJournal.start(tmp_path)
+    fresh.close()
+    assert not crashed.path.exists()
+    assert not ScrapeJournal.start(tmp_path, resume=True).resumed
+
+
+class Crash(BaseException):
+    """Stands in for the process dying; scrapers don't catch it"""
+
+
+class CrashBeforePosition(ScrapeJournal):
+    """Dies after a page's servers are journaled but before its position is"""
+
+    def record_position(self, stage, position):
+        if position["page"] == 2:
+            raise Crash()
+        super().record_position(stage, position)
+
+
+class FakeGlamaScraper(GlamaScraper):
+    pages = {
+        "https://glama.ai/api/mcp/servers": {"servers": [{"name": "a"}], "cursor": "c1", "has_next": True},
+        "https://glama.ai/api/mcp/servers?after=c1": {"servers": [{"name": "b"}, {"name": "c"}], "has_next": False},
+    }
+
+    async def _fetch(self, url, headers=None, method="GET", **kwargs):
+        return CachedResponse(url, 200, {}, json.dumps(self.pages[url]).encode())
+
+
+async def test_glama_resume_after_crash_between_item_and_position(tmp_path, make_config):
+    """A page journaled just before a crash is fetched again without duplicating its servers"""
+    config = make_config()
+    journal = CrashBeforePosition(ScrapeJournal.start(tmp_path).path)
+    async with FakeGlamaScraper(config, StorageManager(config), journal=journal) as scraper:
+        with pytest.raises(Crash):
+            await scraper._scrape_glama_api()
+    journal.close()
+
+    async with FakeGlamaScraper(config, StorageManager(config),
+                                journal=ScrapeJournal.start(tmp_path, resume=True)) as scraper:
+        servers = await scraper._scrape_glama_api()
+
+    assert [server.name for server in servers] == ["a", "b", "c"]
+
+
+async def test_mcp_so_resume_skips_finished_pages(tmp_path, make_config):
+    fetched = []
+
+    async def detail(request):
+        fetched.append(request.match_info["name"])
+        return web.Response(text=f"<h1>{request.match_info['name']} by acme</h1>", content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/server/{name}/acme", detail)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    base_url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+    urls = [f"{base_url}/server/{name}/acme" for name in ["a", "b", "c"]]
+
+    config = make_config()
+    journal = ScrapeJournal.start(tmp_path)
+    journal.record_server("mcp_so_details", urls[1],
+                          MCPServer(id="b", name="b", registry_source=RegistrySource.MCP_SO, source_url=urls[1]))
+    journal.close()
+
+    try:
+        async with MCPSoScraper(config, StorageManager(config),
+                                journal=ScrapeJournal.start(tmp_path, resume=True)) as scraper:
+            servers = await scraper._scrape_server_details(urls)
+    finally:
+        await runner.cleanup()
+
+    assert sorted(fetched) == ["a", "c"]
+    assert [server.name for server in servers] == ["a", "b", "c"]
+
+
+class CrashingSearchScraper(GitHubScraper):
+    """Fake GitHub search that can be made to fail at a given query"""
+
+    crash_on = None
+    searched: list = []
+    processed: list = []
+
+    async def _github_request(self, url, headers, method="GET", **kwargs):
+        query = url.split("q=")[1].split("&")[0]
+        if query == self.crash_on:
+            raise ConnectionError("network went away")
+        self.searched.append(query)
+        if "page=1&" not in url:
+            return 200, {"items": []}
+        base = int(query[1:])
+        return 200, {"items": [
+            {"html_url": f"https://github.com/acme/repo{i}", "name": f"repo{i}", "owner": {"login": "acme"}}
+            for i in range(base, base + 10)
+        ]}
+
+    async def _process_github_repo(self, repo, headers):
+        self.processed.append(repo["name"])
+        await asyncio.sleep(0.01)
+        if repo["name"].endswith("3"):
+            return None
+        return MCPServer(id=repo["name"], name=repo["name"], registry_source=RegistrySource.GITHUB,
+                         repository=repo["html_url"])
+
+
+async def test_github_search_resumes_after_crash(tmp_path, make_config):
+    """The resumed run continues at the failed query and doesn't redo finished repos"""
+    config = make_config()
+    queries = ["q0", "q5", "q20"]
+
+    CrashingSearchScraper.crash_on = "q20"
+    async with CrashingSearchScraper(config, StorageManager(config), journal=ScrapeJournal.start(tmp_path)) as scraper:
+        with pytest.raises(ConnectionError):
+            await scraper._search_repositories(queries, {})
+    scraper.journal.close()
+
+    enriched_before = set(CrashingSearchScraper.processed)
+    CrashingSearchScraper.crash_on = None
+    CrashingSearchScraper.searched = []
+    CrashingSearchScraper.processed = []
+    async with CrashingSearchScraper(config, StorageManager(config),
+                                     journal=ScrapeJournal.start(tmp_path, resume=True)) as scraper:
+        servers = await scraper._search_repositories(queries, {})
+
+    assert CrashingSearchScraper.searched[0].startswith("q20")
+    assert all(not query.startswith(("q0", "q5")) for query in CrashingSearchScraper.searched)
+    assert not enriched_before & set(CrashingSearchScraper.processed)
+
+    expected = [f"repo{i}" for i in [*range(0, 15), *range(20, 30)] if not str(i).endswith("3")]
+    assert [server.name for server in servers] == expected
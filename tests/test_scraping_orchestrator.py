@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test concurrent registry scraping in ScrapingOrchestrator
+"""
+
+import asyncio
+import time
+from datetime import datetime
+
+from models import RegistrySnapshot, RegistrySource
+from scrapers import BaseScraper, ScrapingOrchestrator
+
+
+def make_orchestrator(make_config, config_path, scrapers):
+    """Create an orchestrator with storage under tmp_path and fake scrapers"""
+    make_config(github={"max_concurrency": 3})
+    orchestrator = ScrapingOrchestrator(str(config_path))
+    orchestrator.scrapers = scrapers
+    return orchestrator
+
+
+def slow_scraper(registry: RegistrySource, delay: float, fail: bool = False):
+    """Build a scraper class that sleeps and then returns an empty snapshot"""
+
+    class SlowScraper(BaseScraper):
+        budgets = []
+
+        async def scrape(self) -> RegistrySnapshot:
+            SlowScraper.budgets.append(self.max_concurrency)
+            await asyncio.sleep(delay)
+            if fail:
+                raise RuntimeError(f"{registry.value} is down")
+            return RegistrySnapshot(
+                registry_source=registry,
+                snapshot_date=datetime.now(),
+                servers_count=0,
+                servers=[],
+            )
+
+    return SlowScraper
+
+
+async def test_registries_scraped_concurrently(make_config, config_path):
+    """Wall time should track the slowest registry, not the sum"""
+    scrapers = {
+        RegistrySource.GITHUB: slow_scraper(RegistrySource.GITHUB, 0.3),
+        RegistrySource.MCP_SO: slow_scraper(RegistrySource.MCP_SO, 0.3),
+        RegistrySource.GLAMA: slow_scraper(RegistrySource.GLAMA, 0.3),
+    }
+    orchestrator = make_orchestrator(make_config, config_path, scrapers)
+
+    start = time.time()
+    snapshots = await orchestrator.scrape_all(force_refresh=True)
+    elapsed = time.time() - start
+
+    assert [s.registry_source for s in snapshots] == list(scrapers)
+    assert elapsed < 0.8, f"Registries were not scraped concurrently ({elapsed:.2f}s)"
+    assert scrapers[RegistrySource.GITHUB].budgets == [3]
+    assert scrapers[RegistrySource.MCP_SO].budgets == [10]
+
+
+async def test_failing_registry_is_isolated(tmp_path, make_config, config_path):
+    """One registry failing must not cancel or drop the others"""
+    scrapers = {
+        RegistrySource.GITHUB: slow_scraper(RegistrySource.GITHUB, 0.0, fail=True),
+        RegistrySource.MCP_SO: slow_scraper(RegistrySource.MCP_SO, 0.2),
+    }
+    orchestrator = make_orchestrator(make_config, config_path, scrapers)
+
+    snapshots = await orchestrator.scrape_all(force_refresh=True)
+
+    assert [s.registry_source for s in snapshots] == [RegistrySource.MCP_SO]
+    saved = list((tmp_path / "registries" / "mcp.so").glob("*.ndjson"))
+    assert len(saved) == 1
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Test the streaming NDJSON snapshot format
+"""
+
+import gc
+import json
+from datetime import datetime
+
+import pytest
+
+from models import MCPServer, RegistrySnapshot, RegistrySource
+from scrapers import StorageManager
+from snapshot_io import (
+    iter_snapshot_servers,
+    latest_snapshot_entry,
+    latest_snapshot_file,
+    load_snapshot,
+    paused_gc,
+    read_manifest,
+    read_snapshot_header,
+)
+
+
+def make_servers(count):
+    return [
+        MCPServer(id=f"s{i}", name=f"server-{i}", registry_source=RegistrySource.MCP_SO,
+                  repository=f"https://github.com/acme/server-{i}", raw_metadata={"stars": i})
+        for i in range(count)
+    ]
+
+
+def test_round_trip(make_config):
+    storage = StorageManager(make_config())
+    snapshot = RegistrySnapshot(
+        registry_source=RegistrySource.MCP_SO, snapshot_date=datetime(2025, 5, 1, 12, 0),
+        url="https://mcp.so", servers_count=3, servers=make_servers(3), metadata={"sitemap_lastmod": {}},
+    )
+    path = storage.save_snapshot(snapshot)
+
+    assert path.suffix == ".ndjson"
+    lines = path.read_text().splitlines()
+    assert len(lines) == 4
+    assert json.loads(lines[0])["servers_count"] == 3
+
+    loaded = storage.load_latest_snapshot(RegistrySource.MCP_SO)
+    assert loaded.servers == snapshot.servers
+    assert loaded.metadata == {"sitemap_lastmod": {}}
+    assert loaded.snapshot_date == snapshot.snapshot_date
+    assert [s.name for s in storage.iter_latest_servers(RegistrySource.MCP_SO)] == ["server-0", "server-1", "server-2"]
+
+
+def test_writer_streams_and_is_atomic(make_config):
+    storage = StorageManager(make_config())
+    date = datetime(2025, 5, 2)
+
+    with storage.open_snapshot_writer(RegistrySource.GLAMA, date) as writer:
+        for server in make_servers(5):
+            writer.write(server)
+        # Nothing is visible to readers until the writer is closed
+        assert latest_snapshot_file(storage.get_registry_path(RegistrySource.GLAMA)) is None
+
+    path = latest_snapshot_file(storage.get_registry_path(RegistrySource.GLAMA))
+    assert read_snapshot_header(path)["servers_count"] == 5
+    assert len(list(iter_snapshot_servers(path))) == 5
+
+    # A failed write leaves no partial files behind
+    with pytest.raises(RuntimeError):
+        with storage.open_snapshot_writer(RegistrySource.GLAMA, datetime(2025, 5, 3)) as writer:
+            writer.write(make_servers(1)[0])
+            raise RuntimeError("scrape failed")
+    assert sorted(p.name for p in storage.get_registry_path(RegistrySource.GLAMA).iterdir()) == [
+        path.name, "manifest.json",
+    ]
+
+
+def test_legacy_json_snapshots_still_load(make_config):
+    storage = StorageManager(make_config())
+    snapshot = RegistrySnapshot(
+        registry_source=RegistrySource.GITHUB, snapshot_date=datetime(2024, 1, 1),
+        servers_count=2, servers=make_servers(2),
+    )
+    legacy_path = storage.get_registry_path(RegistrySource.GITHUB) / "github_20240101_000000.json"
+    with open(legacy_path, "w") as f:
+        json.dump(snapshot.dict(), f, indent=2, default=str)
+
+    assert read_snapshot_header(legacy_path)["servers_count"] == 2
+    assert load_snapshot(legacy_path).servers == snapshot.servers
+    assert storage.load_latest_snapshot(RegistrySource.GITHUB).servers == snapshot.servers
+
+
+def test_manifest_tracks_snapshots(make_config):
+    storage = StorageManager(make_config())
+    registry_dir = storage.get_registry_path(RegistrySource.MCP_SO)
+    paths = []
+    for day, count in [(1, 2), (2, 4)]:
+        snapshot = RegistrySnapshot(
+            registry_source=RegistrySource.MCP_SO, snapshot_date=datetime(2025, 6, day),
+            servers_count=count, servers=make_servers(count),
+        )
+        paths.append(storage.save_snapshot(snapshot))
+        assert snapshot.checksum == read_snapshot_header(paths[-1])["checksum"]
+
+    entries = read_manifest(registry_dir)["snapshots"]
+    assert [e["file"] for e in entries] == [p.name for p in paths]
+    latest = storage.latest_snapshot_info(RegistrySource.MCP_SO)
+    assert latest["servers_count"] == 4
+    assert latest["bytes"] == paths[1].stat().st_size
+    assert storage.load_latest_snapshot(RegistrySource.MCP_SO).checksum == latest["checksum"]
+
+    # Lookup trusts the manifest rather than file modification times
+    paths[0].touch()
+    assert latest_snapshot_file(registry_dir) == paths[1]
+
+
+def test_manifest_rebuilt_for_old_directories(make_config):
+    storage = StorageManager(make_config())
+    registry_dir = storage.get_registry_path(RegistrySource.GLAMA)
+    path = storage.save_snapshot(RegistrySnapshot(
+        registry_source=RegistrySource.GLAMA, snapshot_date=datetime(2025, 6, 1),
+        servers_count=3, servers=make_servers(3),
+    ))
+    (registry_dir / "manifest.json").unlink()
+
+    entry = latest_snapshot_entry(registry_dir)
+    assert entry["file"] == path.name
+    assert entry["servers_count"] == 3
+    assert (registry_dir / "manifest.json").exists()
+
+    # A snapshot deleted by hand is dropped from the rebuilt manifest
+    path.unlink()
+    assert latest_snapshot_entry(registry_dir) is None
+
+
+def test_invalid_servers_can_be_skipped(make_config):
+    storage = StorageManager(make_config())
+    path = storage.save_snapshot(RegistrySnapshot(
+        registry_source=RegistrySource.MCP_SO, snapshot_date=datetime(2025, 6, 1),
+        servers_count=2, servers=make_servers(2),
+    ))
+    lines = path.read_text().splitlines()
+    lines.insert(2, json.dumps({"id": "broken", "registry_source": "nowhere"}))
+    path.write_text("\n".join(lines) + "\n")
+
+    with pytest.raises(ValueError):
+        list(iter_snapshot_servers(path))
+    assert [s.id for s in iter_snapshot_servers(path, skip_invalid=True)] == ["s0", "s1"]
+
+
+def test_paused_gc_restores_collector():
+    assert gc.isenabled()
+    with pytest.raises(RuntimeError):
+        with paused_gc():
+            assert not gc.isenabled()
+            raise RuntimeError
+    assert gc.isenabled()
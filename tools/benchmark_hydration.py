@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Benchmark loading registry snapshots and master data.
+
+Writes synthetic snapshots and master data files of 25k and 100k servers to a
+temporary directory and times loading them back:
+
+- ``before``: the old loaders (``json.loads`` then ``MCPServer(**data)`` per
+  server, garbage collector running)
+- ``now``: the current loaders
+- ``unvalidated``: ``model_construct`` with no validation at all, as a floor
+  for what skipping validation could save
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from master_data import MasterDataManager  # noqa: E402
+from models import MCPServer, MCPTool, RegistrySnapshot, RegistrySource, ServerCategory  # noqa: E402
+from snapshot_io import iter_snapshot_server_dicts, load_snapshot, write_snapshot  # noqa: E402
+
+
+def make_servers(count: int) -> list[MCPServer]:
+    categories = list(ServerCategory)
+    return [
+        MCPServer(
+            id=f"github:acme-{i % 997}/server-{i}",
+            name=f"server-{i}",
+            description=f"MCP server number {i} for talking to the acme-{i % 997} service",
+            author=f"acme-{i % 997}",
+            homepage=f"https://acme-{i % 997}.example.com",
+            repository=f"https://github.com/acme-{i % 997}/server-{i}",
+            implementation_language="Python",
+            tools=[MCPTool(name="query", description="Run a query")],
+            categories=[categories[i % len(categories)]],
+            data_types=["json"],
+            registry_source=RegistrySource.GITHUB,
+            source_url=f"https://github.com/acme-{i % 997}/server-{i}",
+            last_updated=datetime(2025, 1, 1),
+            popularity_score=i % 5000,
+            raw_metadata={"stars": i % 5000, "topics": ["mcp", "server"], "forks": i % 300},
+        )
+        for i in range(count)
+    ]
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    # The loaders print progress; keep the benchmark output readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func()
+    elapsed = time.perf_counter() - start
+    del result
+    return elapsed
+
+
+def load_master_before(path: Path) -> list[MCPServer]:
+    with open(path) as f:
+        data = json.load(f)
+    return [MCPServer(**server_data) for server_data in data["servers"]]
+
+
+def load_master_unvalidated(path: Path) -> list[MCPServer]:
+    with open(path) as f:
+        data = json.load(f)
+    return [MCPServer.model_construct(**server_data) for server_data in data["servers"]]
+
+
+def benchmark(count: int, workdir: Path):
+    servers = make_servers(count)
+
+    registry_dir = workdir / "registries" / "github"
+    registry_dir.mkdir(parents=True)
+    snapshot_path = write_snapshot(
+        RegistrySnapshot(registry_source=RegistrySource.GITHUB, snapshot_date=datetime.now(),
+                         servers_count=count, servers=servers),
+        registry_dir / "github_benchmark.ndjson",
+    )
+
+    master = MasterDataManager(str(workdir))
+    with contextlib.redirect_stdout(io.StringIO()):
+        master_path = Path(master.save_master_data(servers, []))
+    del servers
+
+    results = {
+        "snapshot": {
+            "before": timed(lambda: [MCPServer(**d) for d in iter_snapshot_server_dicts(snapshot_path)]),
+            "now": timed(lambda: load_snapshot(snapshot_path)),
+            "unvalidated": timed(lambda: [MCPServer.model_construct(**d)
+                                          for d in iter_snapshot_server_dicts(snapshot_path)]),
+        },
+        "master data": {
+            "before": timed(lambda: load_master_before(master_path)),
+            "now": timed(master.load_master_data),
+            "unvalidated": timed(lambda: load_master_unvalidated(master_path)),
+        },
+    }
+
+    print(f"\n📊 {count:,} servers")
+    for kind, timings in results.items():
+        print(f"   • {kind:<12} " + "  ".join(f"{label} {seconds:6.2f}s" for label, seconds in timings.items())
+              + f"  ({timings['before'] / timings['now']:.1f}x faster)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark snapshot and master data loading")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[25_000, 100_000],
+                        help="Numbers of servers to benchmark (default: 25000 100000)")
+    args = parser.parse_args()
+
+    for count in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            benchmark(count, Path(tmp))
+
+
+if __name__ == "__main__":
+    main()